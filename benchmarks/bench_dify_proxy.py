@@ -0,0 +1,248 @@
+"""
+Dify 프록시 추가 지연 벤치마크 (DB / 실제 Dify 서버 불필요)
+로컬 스텁 Dify 서버를 띄우고 같은 요청을 직접/프록시 경로로 반복하여 프록시가 더하는 지연 시간을 비교합니다.
+
+blocking 모드 (response_mode=blocking):
+- direct     : 스텁 서버에 직접 요청 (공유 클라이언트, 기준값)
+- per_request: /proxy/dify, 요청마다 HTTP 클라이언트를 새로 생성 (이전 방식, 매번 연결 수립)
+- shared     : /proxy/dify, 공유 HTTP 클라이언트로 연결 재사용 (dify_client.py)
+  /proxy/dify는 httpx.ASGITransport로 같은 프로세스에서 호출하므로 프록시 구간만 측정됩니다.
+
+streaming 모드 (response_mode=streaming, SSE):
+- direct / proxy의 첫 이벤트 수신 시간(TTFT)과 전체 수신 시간 비교
+  ASGITransport는 응답 본문을 모아서 반환하므로 프록시는 uvicorn으로 로컬 포트에 띄워 측정합니다.
+
+--upstream-delay로 스텁 서버의 응답 생성 시간(ms)을, --first-token/--events/--event-interval로
+스트리밍 응답의 첫 토큰 지연과 이벤트 간격을 흉내 낼 수 있습니다.
+
+사용 예:
+    python benchmarks/bench_dify_proxy.py --repeat 200
+    python benchmarks/bench_dify_proxy.py --mode streaming --repeat 20 --first-token 300
+"""
+import argparse
+import asyncio
+import json
+import logging
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import httpx
+import uvicorn
+
+from main import app
+from dify_client import dify_client
+
+STUB_ANSWER = {
+    "event": "message",
+    "answer": "스텁 응답입니다.",
+    "conversation_id": "stub-conversation",
+    "metadata": {"usage": {"total_tokens": 42}},
+}
+
+
+class StubDifyServer:
+    """HTTP/1.1 keep-alive를 지원하는 최소 스텁 Dify 서버
+
+    response_mode=streaming이면 chunked SSE 이벤트(message x events + message_end), 그 외에는 같은 JSON 응답
+    """
+
+    def __init__(self, delay: float, first_token: float = 0.0, events: int = 0, event_interval: float = 0.0):
+        self.delay = delay
+        self.first_token = first_token
+        self.events = events
+        self.event_interval = event_interval
+        self.connections = 0
+        self.server = None
+
+    async def start(self) -> str:
+        self.server = await asyncio.start_server(self.handle, '127.0.0.1', 0)
+        host, port = self.server.sockets[0].getsockname()[:2]
+        return f"http://{host}:{port}/v1"
+
+    async def close(self):
+        self.server.close()
+        await self.server.wait_closed()
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self.connections += 1
+        body = json.dumps(STUB_ANSWER, ensure_ascii=False).encode('utf-8')
+        try:
+            while True:
+                head = await reader.readuntil(b'\r\n\r\n')
+                headers = dict(
+                    line.split(': ', 1) for line in head.decode('latin-1').split('\r\n')[1:] if ': ' in line
+                )
+                length = int(next((value for name, value in headers.items() if name.lower() == 'content-length'), 0))
+                payload = json.loads(await reader.readexactly(length) or b'{}')
+                if payload.get("response_mode") == "streaming":
+                    await self.write_events(writer)
+                    continue
+                if self.delay:
+                    await asyncio.sleep(self.delay)
+                writer.write(
+                    b"HTTP/1.1 200 OK\r\nContent-Type: application/json\r\n"
+                    b"Content-Length: " + str(len(body)).encode() + b"\r\n\r\n" + body
+                )
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionResetError):
+            pass
+        finally:
+            writer.close()
+
+    async def write_events(self, writer: asyncio.StreamWriter):
+        """SSE 이벤트를 chunked 인코딩으로 간격을 두고 전송"""
+        def chunk(data: bytes) -> bytes:
+            return f"{len(data):x}\r\n".encode() + data + b"\r\n"
+
+        writer.write(b"HTTP/1.1 200 OK\r\nContent-Type: text/event-stream; charset=utf-8\r\n"
+                     b"Cache-Control: no-cache\r\nTransfer-Encoding: chunked\r\n\r\n")
+        await writer.drain()
+        await asyncio.sleep(self.first_token)
+        for i in range(self.events):
+            if i:
+                await asyncio.sleep(self.event_interval)
+            event = {"event": "message", "answer": f"토큰{i} ", "conversation_id": "stub-conversation"}
+            writer.write(chunk(f"data: {json.dumps(event, ensure_ascii=False)}\n\n".encode('utf-8')))
+            await writer.drain()
+        writer.write(chunk(b'data: {"event": "message_end", "conversation_id": "stub-conversation"}\n\n') + chunk(b""))
+        await writer.drain()
+
+
+def percentile(values, ratio):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * ratio))]
+
+
+async def measure(send, repeat, before_each=None):
+    """반복 요청 지연 시간(ms) 목록 (처음 몇 번은 워밍업으로 제외)"""
+    timings = []
+    for i in range(repeat + 5):
+        if before_each is not None:
+            await before_each()
+        started = time.perf_counter()
+        response = await send()
+        elapsed = (time.perf_counter() - started) * 1000
+        if response.status_code != 200:
+            raise RuntimeError(f"응답 오류 {response.status_code}: {response.text[:200]}")
+        if i >= 5:
+            timings.append(elapsed)
+    return timings
+
+
+async def run_blocking(repeat, upstream_delay):
+    stub = StubDifyServer(upstream_delay / 1000)
+    base_url = await stub.start()
+    proxy_body = {"url": base_url, "apiKey": "app-stub", "appType": "chatbot",
+                  "payload": {"inputs": {}, "query": "벤치마크", "response_mode": "blocking", "user": "bench"}}
+
+    direct_client = httpx.AsyncClient()
+    proxy_client = httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://proxy")
+    try:
+        async def direct():
+            return await direct_client.post(f"{base_url}/chat-messages", json=proxy_body["payload"])
+
+        async def proxied():
+            return await proxy_client.post("/proxy/dify", json=proxy_body)
+
+        results = {}
+        results["direct"] = await measure(direct, repeat)
+        connections = stub.connections
+        results["per_request"] = await measure(proxied, repeat, before_each=dify_client.close)
+        per_request_connections = stub.connections - connections
+        await dify_client.close()
+        connections = stub.connections
+        results["shared"] = await measure(proxied, repeat)
+        shared_connections = stub.connections - connections
+    finally:
+        await proxy_client.aclose()
+        await direct_client.aclose()
+        await dify_client.close()
+        await stub.close()
+
+    baseline = statistics.median(results["direct"])
+    print(f"반복: {repeat}, 스텁 응답 지연: {upstream_delay}ms, HTTP/2: {'사용' if dify_client.http2 else '미사용'}")
+    print(f"{'경로':<14}{'p50(ms)':>10}{'p95(ms)':>10}{'프록시 추가(ms)':>18}")
+    for name, timings in results.items():
+        median = statistics.median(timings)
+        added = '-' if name == "direct" else f"{median - baseline:.3f}"
+        print(f"{name:<14}{median:>10.3f}{percentile(timings, 0.95):>10.3f}{added:>18}")
+    print(f"스텁 서버 연결 수: per_request {per_request_connections}, shared {shared_connections}")
+
+
+async def measure_stream(client, url, body, repeat):
+    """반복 스트리밍 요청의 (첫 이벤트 수신 시간 목록, 전체 수신 시간 목록) (ms)"""
+    first_event, total = [], []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        first = None
+        async with client.stream("POST", url, json=body) as response:
+            if response.status_code != 200:
+                raise RuntimeError(f"응답 오류 {response.status_code}: {(await response.aread())[:200]!r}")
+            async for line in response.aiter_lines():
+                if first is None and line.startswith("data:"):
+                    first = time.perf_counter()
+        finished = time.perf_counter()
+        first_event.append((first - started) * 1000)
+        total.append((finished - started) * 1000)
+    return first_event, total
+
+
+async def run_streaming(repeat, first_token, events, event_interval):
+    stub = StubDifyServer(0.0, first_token / 1000, events, event_interval / 1000)
+    base_url = await stub.start()
+    payload = {"inputs": {}, "query": "벤치마크", "response_mode": "streaming", "user": "bench"}
+    proxy_body = {"url": base_url, "apiKey": "app-stub", "appType": "chatbot", "payload": payload}
+
+    server = uvicorn.Server(uvicorn.Config(app, host="127.0.0.1", port=0, log_level="warning", lifespan="off"))
+    serving = asyncio.create_task(server.serve())
+    while not server.started:
+        await asyncio.sleep(0.01)
+    proxy_port = server.servers[0].sockets[0].getsockname()[1]
+
+    client = httpx.AsyncClient(timeout=60.0)
+    try:
+        results = {
+            "direct": await measure_stream(client, f"{base_url}/chat-messages", payload, repeat),
+            "proxy": await measure_stream(client, f"http://127.0.0.1:{proxy_port}/proxy/dify", proxy_body, repeat),
+        }
+    finally:
+        await client.aclose()
+        await dify_client.close()
+        server.should_exit = True
+        await serving
+        await stub.close()
+
+    print(f"반복: {repeat}, 첫 토큰 지연: {first_token}ms, 이벤트 {events}개 x {event_interval}ms 간격")
+    print(f"{'경로':<10}{'TTFT p50(ms)':>14}{'TTFT p95(ms)':>14}{'전체 p50(ms)':>14}")
+    for name, (first_event, total) in results.items():
+        print(f"{name:<10}{statistics.median(first_event):>14.2f}{percentile(first_event, 0.95):>14.2f}"
+              f"{statistics.median(total):>14.2f}")
+    added = statistics.median(results["proxy"][0]) - statistics.median(results["direct"][0])
+    print(f"프록시 TTFT 추가: {added:.2f}ms")
+
+
+def main_cli():
+    parser = argparse.ArgumentParser(description="Dify 프록시 추가 지연 벤치마크 (로컬 스텁 서버)")
+    parser.add_argument("--repeat", type=int, default=200, help="경로별 반복 횟수 (기본 200)")
+    parser.add_argument("--mode", choices=("blocking", "streaming", "all"), default="all", help="측정 모드 (기본 all)")
+    parser.add_argument("--upstream-delay", type=float, default=0.0, help="blocking: 스텁 서버 응답 지연(ms, 기본 0)")
+    parser.add_argument("--first-token", type=float, default=200.0, help="streaming: 첫 이벤트 지연(ms, 기본 200)")
+    parser.add_argument("--events", type=int, default=20, help="streaming: message 이벤트 수 (기본 20)")
+    parser.add_argument("--event-interval", type=float, default=10.0, help="streaming: 이벤트 간격(ms, 기본 10)")
+    args = parser.parse_args()
+    logging.disable(logging.INFO)
+    if args.mode in ("blocking", "all"):
+        asyncio.run(run_blocking(args.repeat, args.upstream_delay))
+    if args.mode in ("streaming", "all"):
+        if args.mode == "all":
+            print()
+        asyncio.run(run_streaming(min(args.repeat, 20) if args.mode == "all" else args.repeat,
+                                  args.first_token, args.events, args.event_interval))
+
+
+if __name__ == "__main__":
+    main_cli()
@@ -0,0 +1,162 @@
+"""
+필터 조합별 쿼리 형태 비교 벤치마크 (실제 Oracle DB 필요)
+같은 요청을 두 가지 WHERE 절로 반복 실행하여 비교합니다.
+
+- catch_all: 모든 필터를 "(:x IS NULL OR 조건)"으로 나열한 단일 SQL (이전 템플릿 방식)
+- composed : query_builder.py가 주어진 필터 조건만 넣어 조립한 SQL
+
+필터 조합마다 두 방식의 결과 행이 같은지 확인한 뒤 p50/p95 지연 시간을 출력합니다.
+--plans를 지정하면 EXPLAIN PLAN으로 두 방식의 INFORM_NOTE 접근 경로(인덱스 사용 여부)도 출력합니다.
+
+사용 예:
+    python benchmarks/bench_query_shapes.py --repeat 30 --plans
+"""
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from database import db
+from query_builder import query_builder, QUERY_SPECS, PREDICATES, ERROR_CODE_STATS_TEMPLATES
+from sql_registry import sql_registry, render_error_code_stats
+
+# 필터 값 샘플 (INFORM_NOTE에서 eqp_id가 있는 최근 행 하나)
+SAMPLE_SQL = """
+SELECT process_id, eqp_id, error_code, operator, TO_CHAR(down_start_time, 'YYYY-MM-DD')
+FROM INFORM_NOTE
+WHERE eqp_id IS NOT NULL AND error_code IS NOT NULL AND down_start_time IS NOT NULL
+ORDER BY down_start_time DESC
+FETCH FIRST 1 ROWS ONLY
+"""
+
+# (템플릿, group_by, 비교할 필터 조합 목록)
+CASES = [
+    ("error_code_stats.sql", "error_code", [
+        (), ("eqp_id",), ("error_code",), ("process_id", "start_date"), ("eqp_id", "error_code", "start_date"),
+    ]),
+    ("search_inform_notes.sql", None, [
+        (), ("eqp_id",), ("process_id",), ("eqp_id", "start_date"), ("operator",),
+    ]),
+]
+
+ALL_FILTERS = ('start_date', 'end_date', 'process_id', 'model_id', 'eqp_id', 'error_code', 'status_id', 'operator')
+
+
+def catch_all_query(filename, group_by, params):
+    """이전 방식: 허용 필터 전체를 (:x IS NULL OR 조건)으로 나열하고 모든 바인드를 전달"""
+    spec = QUERY_SPECS[filename]
+    conditions = list(spec.fixed)
+    binds = {key: value for key, value in params.items() if key not in ALL_FILTERS}
+    for name in spec.filters:
+        if name in PREDICATES and name != 'cursor':
+            conditions.append(f"(:{name} IS NULL OR {PREDICATES[name].format(date_col=spec.date_col)})")
+            binds[name] = params.get(name)
+    where_clause = "WHERE " + "\n  AND ".join(conditions) if conditions else ""
+    template = sql_registry.template(filename)
+    if filename in ERROR_CODE_STATS_TEMPLATES:
+        return render_error_code_stats(template, group_by, spec.date_col, where_clause), binds
+    return template.format(where_clause=where_clause), binds
+
+
+async def fetch_rows(sql, binds):
+    async with db.acquire() as conn:
+        cursor = conn.cursor()
+        await cursor.execute(sql, binds)
+        rows = await cursor.fetchall()
+        cursor.close()
+    return rows
+
+
+async def access_paths(sql):
+    """EXPLAIN PLAN 결과 중 INFORM_NOTE 접근 단계 (예: INDEX RANGE SCAN IDX_INFORM_NOTE_EQP_COL)
+
+    EXPLAIN PLAN은 바인드 값 없이 계획을 세우므로 바인드 peeking 이전의 일반 계획 기준입니다.
+    """
+    async with db.acquire() as conn:
+        cursor = conn.cursor()
+        try:
+            await cursor.execute(f"EXPLAIN PLAN FOR {sql}")
+            await cursor.execute(
+                "SELECT operation || ' ' || options || ' ' || object_name FROM PLAN_TABLE "
+                "WHERE object_name LIKE 'IDX_INFORM_NOTE%' OR object_name = 'INFORM_NOTE' ORDER BY id"
+            )
+            steps = [step for (step,) in await cursor.fetchall()]
+            await cursor.execute("DELETE FROM PLAN_TABLE")
+            return steps
+        except Exception as e:
+            return [f"(실행 계획 조회 실패: {e})"]
+        finally:
+            cursor.close()
+
+
+async def measure(sql, binds, repeat):
+    """반복 실행 지연 시간(ms) 목록"""
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        await fetch_rows(sql, binds)
+        timings.append((time.perf_counter() - started) * 1000)
+    return timings
+
+
+def percentile(values, ratio):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * ratio))]
+
+
+async def run(repeat, show_plans):
+    sql_registry.load()
+    await db.create_async_pool()
+    try:
+        sample = await fetch_rows(SAMPLE_SQL, {})
+        if not sample:
+            print("✗ INFORM_NOTE에 샘플 행이 없습니다.")
+            return
+        process_id, eqp_id, error_code, operator, day = sample[0]
+        values = {
+            "start_date": day, "process_id": process_id, "eqp_id": eqp_id,
+            "error_code": error_code, "operator": (operator or "")[:2] or None,
+        }
+
+        print(f"반복: {repeat}")
+        print(f"{'템플릿':<26}{'필터':<34}{'catch_all p50/p95(ms)':>24}{'composed p50/p95(ms)':>24}{'배율':>7}")
+        for filename, group_by, combos in CASES:
+            for combo in combos:
+                params = {name: values.get(name) if name in combo else None for name in ALL_FILTERS}
+                if filename == "search_inform_notes.sql":
+                    params.update({"cursor_time": None, "cursor_id": None, "limit_val": 101})
+
+                legacy_sql, legacy_binds = catch_all_query(filename, group_by, params)
+                composed_sql, composed_binds = query_builder.build(filename, params, group_by=group_by)
+                if await fetch_rows(legacy_sql, legacy_binds) != await fetch_rows(composed_sql, composed_binds):
+                    print(f"✗ {filename} {combo}: 두 방식의 결과가 다릅니다.")
+                    continue
+
+                legacy = await measure(legacy_sql, legacy_binds, repeat)
+                composed = await measure(composed_sql, composed_binds, repeat)
+                label = ', '.join(combo) or '(없음)'
+                print(f"{filename:<26}{label:<34}"
+                      f"{statistics.median(legacy):>12.2f}/{percentile(legacy, 0.95):<11.2f}"
+                      f"{statistics.median(composed):>12.2f}/{percentile(composed, 0.95):<11.2f}"
+                      f"{statistics.median(legacy) / statistics.median(composed):>6.1f}x")
+                if show_plans:
+                    print(f"    catch_all: {'; '.join(await access_paths(legacy_sql))}")
+                    print(f"    composed : {'; '.join(await access_paths(composed_sql))}")
+    finally:
+        await db.close_async_pool()
+
+
+def main_cli():
+    parser = argparse.ArgumentParser(description="필터 조합별 쿼리 형태 비교 벤치마크")
+    parser.add_argument("--repeat", type=int, default=30, help="반복 횟수 (기본 30)")
+    parser.add_argument("--plans", action="store_true", help="EXPLAIN PLAN 접근 경로 출력")
+    args = parser.parse_args()
+    asyncio.run(run(args.repeat, args.plans))
+
+
+if __name__ == "__main__":
+    main_cli()
@@ -0,0 +1,131 @@
+"""
+목록 API 응답 생성 방식 비교 벤치마크 (실제 Oracle DB 필요)
+상세 검색 / PM 이력 엔드포인트에 대해 두 방식을 같은 조건으로 반복 실행하여 비교합니다.
+
+- python : 행 조회(fetchall) -> 행 매퍼 -> serialization.dumps
+- db_json: *_json.sql로 DB에서 JSON_ARRAYAGG 문서 생성 -> 바이트 그대로 반환
+
+두 방식의 응답이 같은 내용인지 확인한 뒤 p50/p95 지연 시간을 출력하고,
+엔드포인트별로 더 빠른 쪽의 설정값(SEARCH_RESPONSE_MODE / PM_HISTORY_RESPONSE_MODE)을 제안합니다.
+
+사용 예:
+    python benchmarks/bench_response_mode.py --limit 1000 --repeat 30
+"""
+import argparse
+import asyncio
+import json
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import main
+from database import db
+from serialization import dumps
+from query_builder import query_builder
+from sql_registry import sql_registry
+
+# 엔드포인트별 (이름, 설정 키, python SQL, db_json SQL, 행 매퍼, cursor 컬럼 위치(id, time), 추가 바인드, 추가 응답 필드)
+CASES = [
+    ("search", "SEARCH_RESPONSE_MODE", "search_inform_notes.sql", "search_inform_notes_json.sql",
+     main.search_row_to_dict, (0, 10), {"status_id": None}, {"truncated": False}),
+    ("pm_history", "PM_HISTORY_RESPONSE_MODE", "pm_history.sql", "pm_history_json.sql",
+     main.pm_history_row_to_dict, (4, 5), {}, {}),
+]
+
+
+def base_params(limit, extra):
+    params = {
+        "start_date": None,
+        "end_date": None,
+        "process_id": None,
+        "eqp_id": None,
+        "operator": None,
+        "cursor_time": None,
+        "cursor_id": None,
+        "limit_val": limit + 1,
+    }
+    params.update(extra)
+    return params
+
+
+async def run_python_mode(sql, params, limit, mapper, cursor_columns, fields):
+    async with db.acquire() as conn:
+        cursor = conn.cursor()
+        await cursor.execute(sql, params)
+        rows = await cursor.fetchall()
+        cursor.close()
+    id_index, time_index = cursor_columns
+    rows, next_cursor = main.split_page(rows, limit, id_index=id_index, time_index=time_index)
+    return dumps({"list": [mapper(row) for row in rows], "next_cursor": next_cursor, **fields})
+
+
+async def run_db_json_mode(sql, params, limit, fields):
+    return await main.fetch_db_json_page(sql, params, limit, extra_fields=fields)
+
+
+async def measure(fn, repeat):
+    """반복 실행 지연 시간(ms) 목록"""
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        await fn()
+        timings.append((time.perf_counter() - started) * 1000)
+    return timings
+
+
+def normalize(body: bytes):
+    """숫자 표기 차이(10 / 10.0)를 무시하고 비교하기 위한 정규화"""
+    return json.loads(body, parse_int=float)
+
+
+def percentile(values, ratio):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * ratio))]
+
+
+async def run(limit, repeat):
+    sql_registry.load()
+    await db.create_async_pool()
+    try:
+        print(f"limit: {limit}, 반복: {repeat}")
+        print(f"{'엔드포인트':<14}{'방식':<10}{'p50(ms)':>10}{'p95(ms)':>10}{'평균 크기(bytes)':>18}")
+        for name, setting_key, python_sql, json_sql, mapper, cursor_columns, extra, fields in CASES:
+            python_sql, params = query_builder.build(python_sql, base_params(limit, extra))
+            json_sql, _ = query_builder.build(json_sql, base_params(limit, extra))
+
+            python_body = await run_python_mode(python_sql, params, limit, mapper, cursor_columns, fields)
+            json_body = await run_db_json_mode(json_sql, params, limit, fields)
+            if normalize(python_body) != normalize(json_body):
+                print(f"✗ {name}: 두 방식의 응답 내용이 다릅니다.")
+                continue
+
+            results = {}
+            for mode, fn in (
+                ("python", lambda: run_python_mode(python_sql, params, limit, mapper, cursor_columns, fields)),
+                ("db_json", lambda: run_db_json_mode(json_sql, params, limit, fields)),
+            ):
+                await fn()  # 워밍업 (statement cache / 버퍼 캐시)
+                timings = await measure(fn, repeat)
+                results[mode] = statistics.median(timings)
+                size = len(python_body if mode == "python" else json_body)
+                print(f"{name:<14}{mode:<10}{results[mode]:>10.2f}{percentile(timings, 0.95):>10.2f}{size:>18}")
+
+            best = min(results, key=results.get)
+            print(f"  → {setting_key}={best}")
+    finally:
+        await db.close_async_pool()
+
+
+def main_cli():
+    parser = argparse.ArgumentParser(description="목록 API 응답 생성 방식 비교 벤치마크")
+    parser.add_argument("--limit", type=int, default=1000, help="페이지 크기 (기본 1000)")
+    parser.add_argument("--repeat", type=int, default=30, help="반복 횟수 (기본 30)")
+    args = parser.parse_args()
+    asyncio.run(run(args.limit, args.repeat))
+
+
+if __name__ == "__main__":
+    main_cli()
@@ -0,0 +1,113 @@
+"""
+응답 직렬화 벤치마크 및 응답 형식 계약 확인 스크립트
+DB 없이 합성 행으로 기존 경로(행마다 Pydantic 모델 생성 -> response_model 검증 -> JSON 인코딩)와
+빠른 경로(행 -> dict -> serialization.dumps)를 비교합니다.
+
+- 계약 확인: 두 경로의 JSON이 완전히 같고, 빠른 경로 출력이 response_model로 검증되는지 확인
+- 벤치마크: 엔드포인트별 행당 직렬화 비용(µs)
+
+사용 예:
+    python benchmarks/bench_serialization.py --rows 1000 --repeat 20
+"""
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from fastapi.encoders import jsonable_encoder
+
+import main
+from serialization import JSON_BACKEND, dumps
+
+
+def make_error_code_stats_rows(n):
+    return [
+        (f"2024-{i % 12 + 1:02d}", f"PROC{i % 7:03d}", "ETCH 공정", f"MODEL{i % 11:03d}", "KE Pro",
+         f"EQP{i % 50:03d}", f"Etcher-{i % 50:02d}", f"ERR{i % 30:03d}", "챔버 압력 이상",
+         i % 40 + 1, None if i % 17 == 0 else (i % 900) * 1.25)
+        for i in range(n)
+    ]
+
+
+def make_pm_history_rows(n):
+    return [
+        (f"2024-{i % 12 + 1:02d}-{i % 28 + 1:02d}", None if i % 9 == 0 else "SCHEDULED",
+         None if i % 13 == 0 else float(i % 240), None if i % 5 == 0 else "홍길동")
+        for i in range(n)
+    ]
+
+
+def make_search_rows(n):
+    return [
+        (f"IN{i:06d}", f"2024-06-{i % 28 + 1:02d} 09:{i % 60:02d}:00", "ETCH", f"Etcher-{i % 50:02d}",
+         f"ERR{i % 30:03d}", "챔버 압력 이상", "센서 교체 후 정상 확인 \"재발 시 보고\"", "홍길동",
+         i % 3 if i % 3 < 2 else None, None if i % 4 else "COMPLETED")
+        for i in range(n)
+    ]
+
+
+# 엔드포인트별 (이름, 합성 행 생성, 행 매퍼, 아이템 모델, 응답 모델, 추가 필드)
+CASES = [
+    ("error_code_stats", make_error_code_stats_rows, main.error_code_stats_row_to_dict,
+     main.ErrorCodeStatsItem, main.ErrorCodeStatsResponse, {}),
+    ("pm_history", make_pm_history_rows, main.pm_history_row_to_dict,
+     main.PMHistoryItem, main.PMHistoryResponse, {"next_cursor": "WyJ0IiwiaWQiXQ"}),
+    ("search", make_search_rows, main.search_row_to_dict,
+     main.SearchItem, main.SearchResponse, {"next_cursor": None, "truncated": False}),
+]
+
+
+def encode_model_path(rows, mapper, item_model, response_model, extra):
+    """기존 경로: 아이템 모델 생성 -> 응답 모델 -> response_model 재검증 -> FastAPI JSONResponse 인코딩"""
+    response = response_model(list=[item_model(**mapper(row)) for row in rows], **extra)
+    validated = response_model.model_validate(response.model_dump())
+    return json.dumps(jsonable_encoder(validated), ensure_ascii=False, allow_nan=False,
+                      indent=None, separators=(",", ":")).encode("utf-8")
+
+
+def encode_fast_path(rows, mapper, extra):
+    """빠른 경로: 행 -> dict -> dumps"""
+    return dumps({"list": [mapper(row) for row in rows], **extra})
+
+
+def check_contract(name, rows, mapper, item_model, response_model, extra):
+    """두 경로의 출력이 같은 JSON이고 빠른 경로 출력이 응답 모델 스키마를 만족하는지 확인"""
+    legacy = json.loads(encode_model_path(rows, mapper, item_model, response_model, extra))
+    fast = json.loads(encode_fast_path(rows, mapper, extra))
+    assert legacy == fast, f"{name}: 기존 경로와 빠른 경로의 응답이 다릅니다."
+    assert response_model.model_validate(fast).model_dump() == fast, f"{name}: 응답 모델 검증 결과가 다릅니다."
+
+
+def time_per_row(fn, row_count, repeat):
+    """행당 평균 소요 시간(µs, repeat 중 최솟값 기준)"""
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - started)
+    return best / row_count * 1e6
+
+
+def main_cli():
+    parser = argparse.ArgumentParser(description="응답 직렬화 벤치마크")
+    parser.add_argument("--rows", type=int, default=1000, help="응답당 행 수 (기본 1000)")
+    parser.add_argument("--repeat", type=int, default=20, help="반복 횟수 (기본 20)")
+    args = parser.parse_args()
+
+    print(f"JSON 백엔드: {JSON_BACKEND}, 행 수: {args.rows}, 반복: {args.repeat}")
+    print(f"{'엔드포인트':<20}{'기존(µs/행)':>14}{'빠른 경로(µs/행)':>18}{'배율':>8}")
+    for name, make_rows, mapper, item_model, response_model, extra in CASES:
+        rows = make_rows(args.rows)
+        check_contract(name, rows, mapper, item_model, response_model, extra)
+        legacy = time_per_row(lambda: encode_model_path(rows, mapper, item_model, response_model, extra),
+                              args.rows, args.repeat)
+        fast = time_per_row(lambda: encode_fast_path(rows, mapper, extra), args.rows, args.repeat)
+        print(f"{name:<20}{legacy:>14.2f}{fast:>18.2f}{legacy / fast:>7.1f}x")
+    print("✓ 응답 형식 계약 확인 완료 (기존 경로와 동일)")
+
+
+if __name__ == "__main__":
+    main_cli()
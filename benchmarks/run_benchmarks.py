@@ -0,0 +1,363 @@
+"""
+API/적재 핫 경로 마이크로 벤치마크 모음 (DB 없이 실행)
+핫 경로를 수정하기 전에 기준값(baseline)을 기록해 두고, 수정 후 다시 실행하여 성능 회귀를 확인합니다.
+
+- 요청 값 정리: main.clean_request_value
+- 행 -> 응답 dict 변환: 엔드포인트별 *_row_to_dict
+- SQL 파일 분리: utils.split_sql_statements (create_*.sql, index_migrations/*.sql)
+- 적재 값 정리: load_data._clean / _clean_number (엑셀에서 읽은 형태의 컬럼 값)
+- 요청 처리 전체: FastAPI TestClient -> 엔드포인트 -> 가짜 DB 연결(합성 행) -> JSON 응답
+  (응답 캐시는 끄고 매 요청 SQL 조립/행 변환/직렬화까지 수행, 요청 로그는 끈 상태로 측정)
+
+결과는 연산 1회당 시간(µs)의 반복 측정 중앙값이며, --save-baseline으로 JSON 파일에 기록합니다.
+기준값이 있으면 비교하여 --threshold(기본 25%)보다 느려진 항목을 표시하고 종료 코드 1을 반환합니다.
+기준값은 측정한 장비에서만 의미가 있으므로 같은 장비에서 기록/비교합니다.
+
+사용 예:
+    python benchmarks/run_benchmarks.py --save-baseline       # 기준값 기록
+    python benchmarks/run_benchmarks.py                       # 기준값과 비교
+    python benchmarks/run_benchmarks.py --filter e2e --threshold 0.1
+"""
+import argparse
+import contextlib
+import json
+import logging
+import math
+import platform
+import statistics
+import sys
+import time
+import warnings
+from datetime import datetime
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+sys.path.insert(0, str(ROOT / "benchmarks"))
+
+warnings.filterwarnings("ignore", category=DeprecationWarning)
+
+import main
+from utils import read_sql_file, split_sql_statements
+from bench_serialization import make_error_code_stats_rows, make_pm_history_rows, make_search_rows
+
+DEFAULT_BASELINE = ROOT / "benchmarks" / "baseline.json"
+DEFAULT_THRESHOLD = 0.25
+
+# 응답당 합성 행 수 (행 변환/요청 처리 벤치마크)
+ROW_COUNT = 200
+
+
+# (이름, 연산 단위, setup) 목록 - setup()은 (측정 함수, 함수 1회 호출당 연산 수)를 반환
+BENCHMARKS = []
+
+
+def benchmark(name, unit="op"):
+    def register(setup):
+        BENCHMARKS.append((name, unit, setup))
+        return setup
+    return register
+
+
+def measure(fn, ops_per_call, repeat, min_time):
+    """연산 1회당 시간(µs) 중앙값 (샘플 1회가 min_time 이상 걸리도록 호출 횟수 자동 조정)"""
+    fn()  # 워밍업
+    number = 1
+    while True:
+        started = time.perf_counter()
+        for _ in range(number):
+            fn()
+        elapsed = time.perf_counter() - started
+        if elapsed >= min_time:
+            break
+        number *= 2 if elapsed <= 0 else max(2, min(10, math.ceil(min_time / elapsed)))
+
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for _ in range(number):
+            fn()
+        samples.append((time.perf_counter() - started) / (number * ops_per_call) * 1e6)
+    return statistics.median(samples)
+
+
+# ----------------------------------------------------------------------------
+# 요청 값 정리 / 행 변환
+# ----------------------------------------------------------------------------
+
+@benchmark("clean_request_value")
+def setup_clean_request_value():
+    values = [None, "", "   ", "null", " NULL ", "EQP-001", "  ETCH01  ", "홍길동", "2024-06-01", "MODEL_X"]
+    clean = main.clean_request_value
+
+    def run():
+        for value in values:
+            clean(value)
+    return run, len(values)
+
+
+def row_mapper_setup(mapper, make_rows):
+    rows = make_rows(ROW_COUNT)
+
+    def run():
+        for row in rows:
+            mapper(row)
+    return run, len(rows)
+
+
+benchmark("row_to_dict.error_code_stats", unit="row")(
+    lambda: row_mapper_setup(main.error_code_stats_row_to_dict, make_error_code_stats_rows))
+benchmark("row_to_dict.pm_history", unit="row")(
+    lambda: row_mapper_setup(main.pm_history_row_to_dict, make_pm_history_rows))
+benchmark("row_to_dict.search", unit="row")(
+    lambda: row_mapper_setup(main.search_row_to_dict, make_search_rows))
+
+
+# ----------------------------------------------------------------------------
+# SQL 파일 분리 / 적재 값 정리
+# ----------------------------------------------------------------------------
+
+@benchmark("split_sql_statements", unit="file")
+def setup_split_sql_statements():
+    paths = sorted(ROOT.glob("create_*.sql")) + sorted((ROOT / "index_migrations").glob("*.sql"))
+    contents = [read_sql_file(path) for path in paths]
+
+    def run():
+        for content in contents:
+            split_sql_statements(content)
+    return run, len(contents)
+
+
+def excel_like_values():
+    """엑셀 시트를 pandas로 읽었을 때의 컬럼 값 형태 (문자열 공백, NaN, Timestamp, 정수/실수, 숫자 문자열)"""
+    import pandas as pd
+
+    text = [" EQP-001 ", "ETCH01", "", "   ", "챔버 압력 이상 - 센서 교체 후 정상 확인", "홍길동", "N/A"]
+    timestamps = [pd.Timestamp("2024-06-01 09:15:00"), pd.Timestamp("2024-12-31 23:59:59"), pd.NaT]
+    numbers = [float("nan"), 12.5, 0.0, 240, 3, " 45.5 ", "", "n/a"]
+    return text * 6 + timestamps * 4 + numbers * 4, numbers * 8
+
+
+@benchmark("load_data._clean")
+def setup_load_data_clean():
+    import load_data
+    values, _ = excel_like_values()
+
+    def run():
+        for value in values:
+            load_data._clean(value)
+    return run, len(values)
+
+
+@benchmark("load_data._clean_number")
+def setup_load_data_clean_number():
+    import load_data
+    _, values = excel_like_values()
+
+    def run():
+        for value in values:
+            load_data._clean_number(value)
+    return run, len(values)
+
+
+# ----------------------------------------------------------------------------
+# 요청 처리 전체 (TestClient + 가짜 DB 연결)
+# ----------------------------------------------------------------------------
+
+class StubCursor:
+    """SQL 템플릿에 따라 합성 행을 돌려주는 비동기 커서"""
+
+    def __init__(self, rows_for):
+        self.rows_for = rows_for
+        self.rows = []
+        self.arraysize = 100
+
+    async def execute(self, sql, params=None):
+        self.rows = self.rows_for(sql, params or {})
+
+    async def fetchall(self):
+        rows, self.rows = self.rows, []
+        return rows
+
+    async def fetchone(self):
+        return self.rows.pop(0) if self.rows else None
+
+    def close(self):
+        pass
+
+
+class StubConnection:
+    def __init__(self, rows_for):
+        self.rows_for = rows_for
+
+    def cursor(self):
+        return StubCursor(self.rows_for)
+
+
+def stub_rows_for():
+    """엔드포인트 SQL -> 합성 결과 행 (목록 조회는 limit + 1건을 돌려 다음 페이지 cursor까지 생성)"""
+    stats_rows = make_error_code_stats_rows(ROW_COUNT)
+    pm_rows = [
+        row + (f"IN{i:06d}", f"2024-06-{i % 28 + 1:02d} 09:00:00.000000")
+        for i, row in enumerate(make_pm_history_rows(ROW_COUNT + 1))
+    ]
+    search_rows = [row + (row[1] + ".000000",) for row in make_search_rows(ROW_COUNT + 1)]
+
+    def rows_for(sql, params):
+        if "event_cnt" in sql:
+            return stats_rows
+        if "down_type_name" in sql:
+            return pm_rows[:params.get("limit_val", len(pm_rows))]
+        if "act_content" in sql:
+            return search_rows[:params.get("limit_val", len(search_rows))]
+        return []
+    return rows_for
+
+
+@contextlib.contextmanager
+def stubbed_app():
+    """가짜 DB 연결 + 응답 캐시/요청 로그 비활성 상태의 TestClient (종료 시 원래대로 복구)"""
+    from fastapi.testclient import TestClient
+
+    rows_for = stub_rows_for()
+
+    @contextlib.asynccontextmanager
+    async def acquire(*args, **kwargs):
+        yield StubConnection(rows_for)
+
+    original_acquire = main.db.acquire
+    original_max_entries = main.response_cache.max_entries
+    if not main.sql_registry.loaded:
+        main.sql_registry.load()
+    main.db.acquire = acquire
+    main.response_cache.max_entries = 0
+    logging.disable(logging.INFO)
+    try:
+        # with 블록 없이 생성하여 startup 이벤트(실제 DB 연결/백그라운드 작업)는 실행하지 않음
+        yield TestClient(main.app)
+    finally:
+        logging.disable(logging.NOTSET)
+        main.response_cache.max_entries = original_max_entries
+        main.db.acquire = original_acquire
+
+
+def e2e_setup(path, payload):
+    def setup():
+        stack = contextlib.ExitStack()
+        client = stack.enter_context(stubbed_app())
+        response = client.post(path, json=payload)
+        if response.status_code != 200:
+            stack.close()
+            raise RuntimeError(f"{path} 응답 {response.status_code}: {response.text[:200]}")
+
+        def run():
+            client.post(path, json=payload)
+        run.cleanup = stack.close
+        return run, 1
+    return setup
+
+
+benchmark("e2e.error_code_stats", unit="request")(e2e_setup(
+    "/api/v1/informnote/stats/error-code",
+    {"start_date": "2024-01-01", "end_date": "2024-12-31", "process_id": "PROC001", "group_by": "month"}))
+benchmark("e2e.pm_history", unit="request")(e2e_setup(
+    "/api/v1/informnote/history/pm", {"eqp_id": "EQP001", "limit": ROW_COUNT}))
+benchmark("e2e.search", unit="request")(e2e_setup(
+    "/api/v1/informnote/search", {"process_id": "PROC001", "start_date": "2024-06-01", "limit": ROW_COUNT}))
+
+
+# ----------------------------------------------------------------------------
+# 기준값 기록/비교
+# ----------------------------------------------------------------------------
+
+def environment():
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "machine": platform.machine(),
+        "platform": platform.platform(),
+    }
+
+
+def run_all(name_filter, repeat, min_time):
+    results = {}
+    for name, unit, setup in BENCHMARKS:
+        if name_filter and name_filter not in name:
+            continue
+        try:
+            fn, ops_per_call = setup()
+        except ImportError as e:
+            print(f"  - {name}: 건너뜀 (모듈 없음: {e.name})")
+            continue
+        try:
+            results[name] = {
+                "us_per_op": round(measure(fn, ops_per_call, repeat, min_time), 4),
+                "unit": unit,
+            }
+        finally:
+            cleanup = getattr(fn, "cleanup", None)
+            if cleanup:
+                cleanup()
+    return results
+
+
+def compare(results, baseline, threshold):
+    """기준값 대비 결과 출력, 회귀 항목 이름 목록 반환"""
+    previous = baseline.get("results", {})
+    regressions = []
+    print(f"\n{'벤치마크':<32}{'현재(µs)':>12}{'기준(µs)':>12}{'변화':>10}")
+    for name, result in results.items():
+        current = result["us_per_op"]
+        base = previous.get(name, {}).get("us_per_op")
+        if base is None:
+            print(f"{name:<32}{current:>12.3f}{'-':>12}{'(신규)':>10}  /{result['unit']}")
+            continue
+        change = current / base - 1
+        flag = ""
+        if change > threshold:
+            flag = "  ✗ 회귀"
+            regressions.append(name)
+        print(f"{name:<32}{current:>12.3f}{base:>12.3f}{change:>+10.1%}  /{result['unit']}{flag}")
+    return regressions
+
+
+def main_cli():
+    parser = argparse.ArgumentParser(description="API/적재 핫 경로 마이크로 벤치마크")
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE, help="기준값 JSON 파일")
+    parser.add_argument("--save-baseline", action="store_true", help="이번 결과를 기준값으로 기록")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="회귀 판정 기준 (기준값 대비 증가율, 기본 0.25)")
+    parser.add_argument("--filter", default=None, help="이름에 이 문자열이 포함된 벤치마크만 실행")
+    parser.add_argument("--repeat", type=int, default=7, help="측정 반복 횟수 (기본 7)")
+    parser.add_argument("--min-time", type=float, default=0.05, help="측정 1회 최소 시간(초, 기본 0.05)")
+    args = parser.parse_args()
+
+    print(f"벤치마크 실행 (반복 {args.repeat}회, {platform.python_implementation()} {platform.python_version()})")
+    results = run_all(args.filter, args.repeat, args.min_time)
+
+    baseline = {}
+    if args.baseline.exists():
+        baseline = json.loads(args.baseline.read_text(encoding="utf-8"))
+        if baseline.get("environment") != environment():
+            print(f"⚠ 기준값 측정 환경이 다릅니다: {baseline.get('environment')}")
+    regressions = compare(results, baseline, args.threshold)
+
+    if args.save_baseline:
+        merged = {**baseline.get("results", {}), **results}
+        args.baseline.write_text(json.dumps({
+            "recorded_at": datetime.now().isoformat(timespec="seconds"),
+            "environment": environment(),
+            "results": merged,
+        }, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+        print(f"\n✓ 기준값 기록: {args.baseline}")
+        return
+
+    if regressions:
+        print(f"\n✗ 기준값보다 {args.threshold:.0%} 넘게 느려진 항목 {len(regressions)}개: {', '.join(regressions)}")
+        sys.exit(1)
+    if baseline:
+        print("\n✓ 회귀 없음")
+
+
+if __name__ == "__main__":
+    main_cli()
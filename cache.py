@@ -0,0 +1,145 @@
+"""
+응답 캐시 모듈
+같은 요청이 반복되는 통계/검색 API 응답을 프로세스 메모리에 보관합니다.
+
+- 만료: 항목별 TTL (time.monotonic 기준)
+- 크기 제한: 최대 항목 수 초과 시 가장 오래 사용되지 않은 항목부터 제거 (LRU)
+- 무효화: 데이터 적재 완료(DATA_VERSION 변경) 시 clear()
+- 동시 요청 병합(SingleFlight): 캐시에 없는 같은 키의 요청이 동시에 들어오면 DB 조회를 한 번만 실행하고 결과 공유
+  (공유 조회의 단계별 시간/행 수는 기다린 요청 모두의 요청 타이밍에 더함)
+"""
+import asyncio
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple
+from metrics import RequestTiming, current_request_timing
+
+
+def make_cache_key(endpoint: str, params: Dict[str, Any]) -> Tuple:
+    """엔드포인트 + 정규화된 요청 파라미터로 캐시 키 생성 (파라미터 순서 무관)"""
+    return (endpoint,) + tuple(sorted(params.items()))
+
+
+class TTLCache:
+    """TTL + LRU 기반 크기 제한 캐시 (이벤트 루프 단일 스레드에서 사용)"""
+
+    def __init__(self, ttl: float, max_entries: int):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """캐시 조회 (없거나 만료되었으면 None)"""
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def set(self, key: Hashable, value: Any):
+        """캐시 저장 (최대 항목 수 초과 시 LRU 항목 제거)"""
+        if self.max_entries <= 0:
+            return
+        self._entries[key] = (time.monotonic() + self.ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def clear(self):
+        """전체 무효화"""
+        self._entries.clear()
+        self.invalidations += 1
+
+    def stats(self) -> Dict[str, Any]:
+        """캐시 통계"""
+        lookups = self.hits + self.misses
+        return {
+            'entries': len(self._entries),
+            'max_entries': self.max_entries,
+            'ttl_seconds': self.ttl,
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_ratio': round(self.hits / lookups, 4) if lookups else None,
+            'evictions': self.evictions,
+            'invalidations': self.invalidations,
+        }
+
+
+class SingleFlight:
+    """같은 키의 동시 작업 병합 (이벤트 루프 단일 스레드에서 사용)
+
+    키별로 진행 중인 작업이 있으면 새로 실행하지 않고 그 작업의 결과(또는 예외)를 함께 받습니다.
+    작업은 별도 태스크로 실행되므로 처음 요청한 클라이언트의 연결이 끊겨도 나머지 요청은 결과를 받습니다.
+    작업이 끝나면 키가 제거되므로 이후 요청은 응답 캐시 또는 새 조회로 처리됩니다.
+    작업은 처음 요청의 타이밍 대신 별도 RequestTiming으로 측정하고, 끝나면 기다린 요청마다 그 값을 더합니다.
+    """
+
+    def __init__(self, enabled: bool = True):
+        self.enabled = enabled
+        self._calls: Dict[Hashable, Tuple["asyncio.Task", Optional[RequestTiming]]] = {}
+        self.executions = 0
+        self.coalesced = 0
+
+    def __len__(self) -> int:
+        return len(self._calls)
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """key로 진행 중인 작업이 있으면 그 결과를, 없으면 fn()을 실행한 결과를 반환"""
+        if not self.enabled:
+            return await fn()
+        call = self._calls.get(key)
+        if call is None:
+            timing = current_request_timing.get()
+            shared_timing = RequestTiming(timing.path) if timing is not None else None
+            task = asyncio.ensure_future(self._run(fn, shared_timing))
+            call = self._calls[key] = (task, shared_timing)
+            task.add_done_callback(lambda done: self._finish(key, done))
+            self.executions += 1
+        else:
+            self.coalesced += 1
+        task, shared_timing = call
+        try:
+            # 한 요청이 취소되어도 공유 작업은 취소하지 않음
+            return await asyncio.shield(task)
+        finally:
+            timing = current_request_timing.get()
+            if task.done() and timing is not None and shared_timing is not None:
+                timing.merge(shared_timing)
+
+    @staticmethod
+    async def _run(fn: Callable[[], Awaitable[Any]], shared_timing: Optional[RequestTiming]) -> Any:
+        """공유 작업 실행 (태스크 컨텍스트의 요청 타이밍을 공유 타이밍으로 교체)"""
+        current_request_timing.set(shared_timing)
+        return await fn()
+
+    def _finish(self, key: Hashable, task: "asyncio.Task"):
+        call = self._calls.get(key)
+        if call is not None and call[0] is task:
+            del self._calls[key]
+        # 기다리던 요청이 모두 취소된 경우에도 예외가 회수되지 않았다는 경고를 남기지 않음
+        if not task.cancelled():
+            task.exception()
+
+    def stats(self) -> Dict[str, Any]:
+        """병합 통계"""
+        return {
+            'enabled': self.enabled,
+            'in_flight': len(self._calls),
+            'executions': self.executions,
+            'coalesced': self.coalesced,
+        }
@@ -18,10 +18,98 @@ class Settings(BaseSettings):
     APP_VERSION: str = "1.0.0"
     DEBUG: bool = False
 
+    # Oracle 연결 풀 설정
+    DB_POOL_MIN: int = 1                       # 최소 연결 수 (콜드 스타트 시 미리 열어 둘 연결)
+    DB_POOL_MAX: int = 5                       # 최대 연결 수
+    DB_POOL_INCREMENT: int = 1                 # 부족 시 한 번에 추가로 여는 연결 수
+    DB_POOL_GETMODE: str = "timedwait"         # wait / nowait / forceget / timedwait
+    DB_POOL_WAIT_TIMEOUT: int = 10000          # timedwait 모드 acquire 최대 대기 시간(ms)
+    DB_POOL_MAX_LIFETIME_SESSION: int = 0      # 세션 최대 수명(초), 0이면 무제한
+    DB_POOL_PING_INTERVAL: int = 60            # 유휴 연결 재사용 전 ping 간격(초)
+
+    # DB 헬스 모니터 / 서킷 브레이커 설정
+    DB_HEALTH_CHECK_INTERVAL: float = 10.0     # 백그라운드 헬스 체크 주기(초)
+    DB_CIRCUIT_FAILURE_THRESHOLD: int = 3      # 서킷 open까지 허용하는 연속 실패 횟수
+    DB_CIRCUIT_RESET_TIMEOUT: float = 30.0     # open 후 half_open 전환까지 대기 시간(초)
+
+    # 요청 단계별 시간 측정 (/metrics 누적) 및 Server-Timing 응답 헤더
+    REQUEST_METRICS_ENABLED: bool = True
+    SERVER_TIMING_HEADER: bool = True
+
+    # 느린 쿼리 기록 (slow_query.py, 문장별 execute + fetch 시간 기준, 0이면 기록 안 함)
+    SLOW_QUERY_THRESHOLD: float = 1.0                       # 기록 기준 시간(초)
+    SLOW_QUERY_LOG_PATH: Optional[str] = None               # JSONL 파일 경로 (opt-in, 예: "logs/slow_queries.jsonl")
+    SLOW_QUERY_LOG_BINDS: bool = False                      # 바인드 값(작업자 이름 등) 원문 기록 여부 (기본은 값 가림)
+    SLOW_QUERY_DEBUG_ENDPOINT: bool = False                 # /debug/slow-queries 노출 여부 (인증 없음, 기본 404)
+    SLOW_QUERY_LOG_MAX_BYTES: int = 10 * 1024 * 1024        # 파일 회전 크기
+    SLOW_QUERY_LOG_BACKUP_COUNT: int = 5                    # 보관할 회전 파일 수
+    SLOW_QUERY_PLAN_SAMPLE_RATE: float = 0.1                # 실제 실행 계획(DBMS_XPLAN.DISPLAY_CURSOR)을 조회할 비율 (0~1)
+
+    # 목록/통계 쿼리 요청 파라미터 기록 (index_advisor.py 입력, 미설정 시 기록 안 함)
+    WORKLOAD_LOG_PATH: Optional[str] = None       # 예: "logs/workload.jsonl"
+    WORKLOAD_LOG_SAMPLE_RATE: float = 1.0         # 기록할 요청 비율 (0~1)
+
+    # 연결별 statement cache 크기 (사전 렌더링 SQL 수보다 커야 함)
+    DB_STMT_CACHE_SIZE: int = 100
+
+    # 데이터 버전(DATA_VERSION) 폴링 주기(초) - 적재 완료 감지용
+    DATA_VERSION_CHECK_INTERVAL: float = 30.0
+
+    # 레퍼런스 데이터(PROCESS/MODEL/EQUIPMENT) 인메모리 인덱스 전체 갱신 주기(초)
+    REFERENCE_INDEX_REFRESH_INTERVAL: float = 600.0
+
+    # 작업자(operator) 이름 trigram 인덱스 전체 갱신 주기(초) - 부분 일치 조건을 후보 이름 IN 목록으로 변환
+    OPERATOR_INDEX_REFRESH_INTERVAL: float = 600.0
+
+    # 반도체 용어 사전(FAB_TERMS_DICTIONARY) 인메모리 인덱스 전체 갱신 주기(초)
+    TERM_INDEX_REFRESH_INTERVAL: float = 600.0
+
+    # 조치 내용 키워드 검색 인메모리 역색인 (text_index.py)
+    TEXT_INDEX_REFRESH_INTERVAL: float = 600.0  # 변경분 반영 주기(초), 적재 완료 시에는 즉시 반영
+    TEXT_SEARCH_MAX_CANDIDATES: int = 20000     # 키워드 검색 시 필터를 적용해 볼 관련도 상위 후보 최대 건수 (512건씩 조회)
+
+    # 통계/검색 API 응답 캐시 (데이터 적재 완료 시 전체 무효화)
+    RESPONSE_CACHE_ENABLED: bool = True
+    RESPONSE_CACHE_TTL: float = 300.0          # 항목 유효 시간(초)
+    RESPONSE_CACHE_MAX_ENTRIES: int = 1000     # 최대 항목 수 (초과 시 LRU 제거)
+    REQUEST_COALESCING_ENABLED: bool = True    # 캐시에 없는 같은 요청이 동시에 들어오면 DB 조회 1회로 병합
+
+    # Error Code 통계를 일별 집계 테이블(INFORM_NOTE_DAILY_STATS)로 조회
+    # (집계 버전이 INFORM_NOTE 버전과 같을 때만 사용, 아니면 원본 테이블 집계)
+    ERROR_STATS_USE_ROLLUP: bool = True
+
+    # NDJSON 스트리밍 응답의 fetchmany 배치 크기 (스트리밍 중 메모리에 올라가는 최대 행 수)
+    STREAM_FETCH_SIZE: int = 500
+
+    # 목록 응답을 Pydantic 모델 생성/검증 없이 바로 JSON 인코딩 (orjson 설치 시 사용)
+    FAST_JSON_RESPONSE: bool = True
+
+    # 목록 API 응답 생성 방식: python(행 -> dict -> JSON) / db_json(Oracle JSON_ARRAYAGG 결과를 그대로 반환)
+    # benchmarks/bench_response_mode.py로 측정 후 엔드포인트별로 빠른 쪽 선택
+    SEARCH_RESPONSE_MODE: str = "python"
+    PM_HISTORY_RESPONSE_MODE: str = "python"
+
     # Dify AI 설정 (선택 사항)
     DIFY_API_BASE: Optional[str] = None  # 예: "http://.../v1"
     DIFY_API_KEY: Optional[str] = None   # 예: "app-xxxxxxxx"
     DIFY_USER_ID: str = "oracle-agent-user"
+
+    # /proxy/dify 공유 HTTP 클라이언트 (dify_client.py)
+    DIFY_PROXY_MAX_CONNECTIONS: int = 20            # 전체 최대 연결 수
+    DIFY_PROXY_MAX_CONNECTIONS_PER_HOST: int = 10   # Dify 호스트별 동시 요청 상한
+    DIFY_PROXY_MAX_KEEPALIVE: int = 10              # 재사용을 위해 보관하는 유휴 연결 수
+    DIFY_PROXY_KEEPALIVE_EXPIRY: float = 60.0       # 유휴 연결 보관 시간(초)
+    DIFY_PROXY_CONNECT_TIMEOUT: float = 5.0         # 연결(및 연결 풀 대기) 타임아웃(초)
+    DIFY_PROXY_READ_TIMEOUT: float = 60.0           # 응답 수신 타임아웃(초) - LLM 생성 시간 포함
+    DIFY_PROXY_SLOT_WAIT_TIMEOUT: float = 120.0     # 호스트별 상한 도달 시 빈 슬롯 대기 시간(초), 초과 시 503
+    DIFY_PROXY_HTTP2: bool = True                   # h2 패키지가 설치되어 있을 때만 HTTP/2 사용
+
+    # /proxy/dify 응답 캐시 (같은 요청의 Dify 워크플로 실행 결과 재사용, 기본 꺼짐)
+    # 키: URL + 앱 타입 + API Key 해시 + payload(user/conversation_id 제외), blocking 모드 성공 응답만 저장
+    DIFY_ANSWER_CACHE_ENABLED: bool = False
+    DIFY_ANSWER_CACHE_TTL: float = 600.0            # 항목 유효 시간(초)
+    DIFY_ANSWER_CACHE_MAX_ENTRIES: int = 200        # 최대 항목 수 (초과 시 LRU 제거)
+    DIFY_ANSWER_CACHE_APP_TYPES: str = "workflow"   # 캐시할 앱 타입 (쉼표 구분, 예: "workflow,completion")
     
     class Config:
         env_file = ".env"
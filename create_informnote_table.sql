@@ -134,6 +134,30 @@ BEGIN
     :NEW.updated_at := SYSTIMESTAMP;
 END;
 
+-- ============================================================
+-- 일별 집계 테이블 (Error Code 통계용 사전 집계)
+-- load_data.py가 INFORM_NOTE 적재 후 전체 재구성하며,
+-- 재구성이 끝나면 DATA_VERSION('inform_note_daily')을 'inform_note' 버전과 맞춤
+-- ============================================================
+CREATE TABLE INFORM_NOTE_DAILY_STATS (
+    stat_day DATE,                          -- 집계 일자 (TRUNC(down_start_time), 다운 시작 시각이 없으면 NULL)
+    process_id VARCHAR2(20),                -- 공정 ID
+    model_id VARCHAR2(50),                  -- 장비 모델 ID
+    eqp_id VARCHAR2(50),                    -- 장비 ID
+    error_code VARCHAR2(50),                -- 에러 코드
+    down_type_id NUMBER(5),                 -- 다운 유형
+    event_cnt NUMBER(10) NOT NULL,          -- 건수
+    down_time_minutes_sum NUMBER(14,2)      -- 다운 시간 합계(분)
+);
+
+CREATE INDEX IDX_INFORM_NOTE_DAILY_DAY ON INFORM_NOTE_DAILY_STATS(down_type_id, stat_day);
+
+CREATE INDEX IDX_INFORM_NOTE_DAILY_PROC ON INFORM_NOTE_DAILY_STATS(process_id, stat_day);
+
+CREATE INDEX IDX_INFORM_NOTE_DAILY_EQP ON INFORM_NOTE_DAILY_STATS(eqp_id, stat_day);
+
+COMMENT ON TABLE INFORM_NOTE_DAILY_STATS IS 'INFORM_NOTE 일별 집계 (일자/공정/모델/장비/에러코드/다운유형별 건수·다운시간)';
+
 -- 시퀀스 생성 (informnote_id 자동 생성용 - 필요시 사용)
 -- CREATE SEQUENCE SEQ_INFORMNOTE_ID
 -- START WITH 1
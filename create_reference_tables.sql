@@ -89,3 +89,11 @@ CREATE TABLE DOWN_TYPE (
     CONSTRAINT PK_DOWN_TYPE_TBL PRIMARY KEY (DOWN_TYPE_ID)
 );
 
+
+-- 데이터셋별 적재 버전 (load_data.py가 적재 완료 시 증가, API 서버가 폴링하여 인메모리 인덱스/캐시 갱신)
+CREATE TABLE DATA_VERSION (
+    DATASET_NAME VARCHAR2(50)  NOT NULL,
+    VERSION      NUMBER(19)    DEFAULT 0 NOT NULL,
+    UPDATED_AT   DATE          DEFAULT SYSDATE NOT NULL,
+    CONSTRAINT PK_DATA_VERSION_TBL PRIMARY KEY (DATASET_NAME)
+);
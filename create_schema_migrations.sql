@@ -0,0 +1,11 @@
+-- 인덱스 마이그레이션 적용 이력 테이블
+-- recreate_database.py가 index_migrations/V{번호}__{설명}.sql을 적용할 때마다 한 행씩 기록
+
+CREATE TABLE SCHEMA_MIGRATIONS (
+    version NUMBER(5) PRIMARY KEY,          -- 마이그레이션 버전 (파일명 V001 -> 1)
+    description VARCHAR2(200),              -- 파일명의 설명 부분
+    checksum VARCHAR2(64) NOT NULL,         -- 적용 당시 파일 내용 SHA-256 (적용 후 수정 감지용)
+    applied_at TIMESTAMP DEFAULT SYSTIMESTAMP NOT NULL
+);
+
+COMMENT ON TABLE SCHEMA_MIGRATIONS IS '인덱스 마이그레이션(index_migrations/) 적용 이력';
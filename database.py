@@ -1,20 +1,444 @@
 """
 Oracle 데이터베이스 연결 및 관리 모듈
 """
+import asyncio
+import time
 import oracledb
-from contextlib import contextmanager
-from typing import Optional
+from contextlib import contextmanager, asynccontextmanager
+from datetime import datetime
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple
 from config import settings
+from sql_registry import sql_registry
+from metrics import Histogram, RequestTiming, current_request_timing, record_phase
+from slow_query import StatementStats, slow_query_log, capture_plan
 import logging
 
 logger = logging.getLogger(__name__)
 
+# DB_POOL_GETMODE 설정값 -> python-oracledb 상수
+POOL_GETMODES = {
+    'wait': oracledb.POOL_GETMODE_WAIT,
+    'nowait': oracledb.POOL_GETMODE_NOWAIT,
+    'forceget': oracledb.POOL_GETMODE_FORCEGET,
+    'timedwait': oracledb.POOL_GETMODE_TIMEDWAIT,
+}
+
+
+def pool_params() -> dict:
+    """config.Settings의 연결 풀 설정을 create_pool/create_pool_async 인자로 변환"""
+    getmode = settings.DB_POOL_GETMODE.lower()
+    if getmode not in POOL_GETMODES:
+        raise ValueError(f"지원하지 않는 DB_POOL_GETMODE: {settings.DB_POOL_GETMODE} (허용: {', '.join(POOL_GETMODES)})")
+    return {
+        'min': settings.DB_POOL_MIN,
+        'max': settings.DB_POOL_MAX,
+        'increment': settings.DB_POOL_INCREMENT,
+        'getmode': POOL_GETMODES[getmode],
+        'wait_timeout': settings.DB_POOL_WAIT_TIMEOUT,
+        'max_lifetime_session': settings.DB_POOL_MAX_LIFETIME_SESSION,
+        'ping_interval': settings.DB_POOL_PING_INTERVAL,
+    }
+
+
+def is_pool_timeout(error: Exception) -> bool:
+    """연결 풀 대기 시간 초과(DPY-4005) 여부 - DB 장애가 아니라 풀 포화"""
+    if isinstance(error, oracledb.Error) and error.args:
+        return getattr(error.args[0], 'full_code', None) == 'DPY-4005'
+    return False
+
+
+# 요청 실행 중 DB 장애로 보는 드라이버 오류 (연결 없음, 연결 종료, 호출 타임아웃)
+CONNECTION_FAILURE_CODES = frozenset({'DPY-1001', 'DPY-4011', 'DPY-4024'})
+
+
+def is_connection_failure(error: Exception) -> bool:
+    """요청 실행 중 오류가 DB/네트워크 장애인지 (SQL 오류처럼 DB가 응답한 오류는 제외)"""
+    if isinstance(error, oracledb.OperationalError):
+        return True
+    if isinstance(error, oracledb.Error) and error.args:
+        info = error.args[0]
+        return getattr(info, 'is_session_dead', False) or getattr(info, 'full_code', None) in CONNECTION_FAILURE_CODES
+    return False
+
+
+def fetch_lobs_as_text(cursor, metadata):
+    """CLOB 컬럼을 LOB 객체 대신 문자열로 한 번에 가져오는 outputtypehandler (DB JSON 생성 결과 조회용)"""
+    if metadata.type_code is oracledb.DB_TYPE_CLOB:
+        return cursor.var(oracledb.DB_TYPE_LONG, arraysize=cursor.arraysize)
+
+
+class DatabaseUnavailableError(Exception):
+    """서킷 브레이커가 열려 있어 DB 작업을 즉시 거부할 때 발생하는 예외"""
+
+
+class InstrumentedCursor:
+    """계측 비동기 커서
+
+    - 요청 처리 중이면 execute/fetch 소요 시간과 조회 행 수를 현재 요청 타이밍에 기록
+    - 문장별 execute + fetch 시간을 누적하여 결과를 다 읽거나 커서를 닫으면 느린 쿼리 여부 판단 (slow_query.py)
+    """
+
+    __slots__ = ('_cursor', '_conn', '_statement')
+
+    def __init__(self, cursor, conn: 'InstrumentedConnection'):
+        object.__setattr__(self, '_cursor', cursor)
+        object.__setattr__(self, '_conn', conn)
+        object.__setattr__(self, '_statement', None)
+
+    def __getattr__(self, name):
+        return getattr(self._cursor, name)
+
+    def __setattr__(self, name, value):
+        setattr(self._cursor, name, value)
+
+    async def execute(self, *args, **kwargs):
+        if self._statement is not None:
+            self._conn.defer(self._statement)
+        started = time.perf_counter()
+        error: Optional[Exception] = None
+        try:
+            return await self._cursor.execute(*args, **kwargs)
+        except Exception as e:
+            error = e
+            raise
+        finally:
+            elapsed = time.perf_counter() - started
+            timing = self._conn.timing
+            if timing is not None:
+                timing.add('execute', elapsed)
+            if slow_query_log.enabled:
+                sql = args[0] if args else kwargs.get('statement')
+                binds = args[1] if len(args) > 1 else kwargs.get('parameters')
+                statement = StatementStats(sql, binds, elapsed, timing.path if timing else None)
+                if error is not None:
+                    # 실패한 문장(호출 타임아웃 등)은 가져올 결과가 없으므로 바로 연결 반환 시 판단 대상으로
+                    statement.error = str(error)
+                    self._conn.defer(statement)
+                else:
+                    object.__setattr__(self, '_statement', statement)
+                    self._conn.last_statement = statement
+
+    async def _fetch(self, fetch, *args, **kwargs):
+        started = time.perf_counter()
+        try:
+            return await fetch(*args, **kwargs)
+        finally:
+            elapsed = time.perf_counter() - started
+            if self._conn.timing is not None:
+                self._conn.timing.add('fetch', elapsed)
+            if self._statement is not None:
+                self._statement.fetch += elapsed
+
+    def _count(self, rows: int):
+        if self._conn.timing is not None:
+            self._conn.timing.rows += rows
+        if self._statement is not None:
+            self._statement.rows += rows
+
+    async def _complete(self):
+        """결과를 끝까지 읽은 문장 판단 (직후라 같은 세션에서 실행 계획 조회 가능)"""
+        statement = self._statement
+        if statement is not None:
+            object.__setattr__(self, '_statement', None)
+            await self._conn.finish_statement(statement)
+
+    async def fetchall(self):
+        rows = await self._fetch(self._cursor.fetchall)
+        self._count(len(rows))
+        await self._complete()
+        return rows
+
+    async def fetchmany(self, *args, **kwargs):
+        rows = await self._fetch(self._cursor.fetchmany, *args, **kwargs)
+        self._count(len(rows))
+        size = args[0] if args else kwargs.get('size', self._cursor.arraysize)
+        if len(rows) < size:
+            await self._complete()
+        return rows
+
+    async def fetchone(self):
+        row = await self._fetch(self._cursor.fetchone)
+        if row is None:
+            await self._complete()
+        else:
+            self._count(1)
+        return row
+
+    def close(self):
+        if self._statement is not None:
+            self._conn.defer(self._statement)
+            object.__setattr__(self, '_statement', None)
+        self._cursor.close()
+
+
+class InstrumentedConnection:
+    """계측 비동기 연결: cursor()가 InstrumentedCursor를 반환 (그 외 속성은 원래 연결로 위임)"""
+
+    __slots__ = ('_conn', 'timing', 'last_statement', '_deferred')
+
+    def __init__(self, conn, timing: Optional[RequestTiming]):
+        self._conn = conn
+        self.timing = timing
+        self.last_statement: Optional[StatementStats] = None  # 이 세션에서 마지막으로 실행한 문장
+        self._deferred: List[StatementStats] = []
+
+    def __getattr__(self, name):
+        return getattr(self._conn, name)
+
+    def cursor(self, *args, **kwargs):
+        return InstrumentedCursor(self._conn.cursor(*args, **kwargs), self)
+
+    def defer(self, statement: StatementStats):
+        """결과를 끝까지 읽지 않고 닫힌 문장 (연결 반환 시 finish()에서 판단)"""
+        self._deferred.append(statement)
+
+    async def finish_statement(self, statement: StatementStats):
+        """느린 문장이면 기록 (세션의 마지막 문장이고 샘플링되면 실제 실행 계획 포함, 기록 실패는 무시)
+
+        실패한 문장은 last_statement가 아니므로 실행 계획 없이 오류 메시지와 함께 기록
+        """
+        if not slow_query_log.is_slow(statement):
+            return
+        plan = plan_error = None
+        if statement is self.last_statement and slow_query_log.sample_plan():
+            try:
+                plan = await capture_plan(self._conn, peeked_binds=slow_query_log.log_binds)
+            except Exception as e:
+                plan_error = str(e)
+        try:
+            slow_query_log.record(statement, plan, plan_error)
+        except Exception as e:
+            logger.error(f"느린 쿼리 기록 실패: {e}")
+
+    async def finish(self):
+        """연결 반환 전 미판단 문장 처리"""
+        deferred, self._deferred = self._deferred, []
+        for statement in deferred:
+            await self.finish_statement(statement)
+
+
+class CircuitBreaker:
+    """연속 실패 횟수 기반 서킷 브레이커
+    
+    - closed: 정상 상태, 모든 요청 허용
+    - open: 연속 실패가 임계값에 도달한 상태, 요청을 즉시 거부
+    - half_open: reset_timeout 경과 후 시험 요청 하나만 허용하는 상태
+      (성공하면 closed, 실패하면 다시 open, 결과 없이 reset_timeout이 지나면 다음 요청을 시험 요청으로 허용)
+    """
+    
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+    
+    def __init__(self, failure_threshold: int, reset_timeout: float):
+        self.failure_threshold = max(1, failure_threshold)
+        self.reset_timeout = reset_timeout
+        self.failure_count = 0
+        self.opened_at: Optional[float] = None
+        self.trial_started_at: Optional[float] = None  # half_open 시험 요청 시작 시각
+    
+    @property
+    def state(self) -> str:
+        """현재 서킷 상태"""
+        if self.opened_at is None:
+            return self.CLOSED
+        if time.monotonic() - self.opened_at >= self.reset_timeout:
+            return self.HALF_OPEN
+        return self.OPEN
+    
+    def is_available(self) -> bool:
+        """요청을 받을 수 있는 상태인지 (open 상태에서만 False, 시험 요청 슬롯은 사용하지 않음)"""
+        return self.state != self.OPEN
+    
+    def allow_request(self) -> bool:
+        """요청 허용 여부 (open 거부, half_open은 진행 중인 시험 요청이 없을 때 이 요청을 시험 요청으로 허용)"""
+        state = self.state
+        if state == self.CLOSED:
+            return True
+        if state == self.OPEN:
+            return False
+        now = time.monotonic()
+        if self.trial_started_at is not None and now - self.trial_started_at < self.reset_timeout:
+            return False
+        self.trial_started_at = now
+        return True
+    
+    def release_trial(self, trial_started_at: Optional[float]):
+        """성공/실패를 판단할 수 없이 끝난 시험 요청(풀 대기 초과, DB와 무관한 오류, 취소)의 슬롯 반환
+        
+        trial_started_at: 해당 요청이 허용된 직후의 값 (그 요청이 시험 요청이었을 때만 반환)
+        """
+        if trial_started_at is not None and self.trial_started_at == trial_started_at:
+            self.trial_started_at = None
+    
+    def record_success(self):
+        """성공 기록: 서킷을 닫고 실패 카운트 초기화"""
+        if self.opened_at is not None:
+            logger.info("DB 서킷 브레이커 closed (연결 복구)")
+        self.failure_count = 0
+        self.opened_at = None
+        self.trial_started_at = None
+    
+    def record_failure(self):
+        """실패 기록: 임계값 도달 또는 half_open 시험 실패 시 서킷 open"""
+        self.failure_count += 1
+        if self.state == self.HALF_OPEN or self.failure_count >= self.failure_threshold:
+            if self.state != self.OPEN:
+                logger.warning(f"DB 서킷 브레이커 open (연속 실패 {self.failure_count}회)")
+            self.opened_at = time.monotonic()
+            self.trial_started_at = None
+
+
+class PeriodicTask:
+    """일정 주기로 run_once()를 실행하는 백그라운드 태스크 기반 클래스"""
+    
+    name = "백그라운드 작업"
+    
+    def __init__(self, interval: float):
+        self.interval = interval
+        self._task: Optional[asyncio.Task] = None
+    
+    async def run_once(self):
+        raise NotImplementedError
+    
+    async def _run(self):
+        """주기적 실행 루프 (개별 실행 실패는 로그만 남기고 계속)"""
+        while True:
+            await asyncio.sleep(self.interval)
+            try:
+                await self.run_once()
+            except Exception as e:
+                logger.error(f"{self.name} 실행 실패: {e}")
+    
+    def start(self):
+        """백그라운드 실행 시작"""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+            logger.info(f"{self.name} 시작 (주기: {self.interval}초)")
+    
+    async def stop(self):
+        """백그라운드 실행 종료"""
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+
+class DatabaseHealthMonitor(PeriodicTask):
+    """백그라운드 DB 헬스 모니터
+    
+    일정 주기로 SELECT 1 FROM DUAL을 실행하고 결과를 캐시합니다.
+    엔드포인트와 /health는 매 요청마다 쿼리하지 않고 캐시된 상태를 읽습니다.
+    """
+    
+    name = "DB 헬스 모니터"
+    
+    def __init__(self, database: "Database", interval: float):
+        super().__init__(interval)
+        self.database = database
+        self.connected = False
+        self.last_checked_at: Optional[datetime] = None
+        self.last_error: Optional[str] = None
+    
+    async def probe(self) -> bool:
+        """DB 상태를 한 번 점검하고 캐시된 상태 및 서킷 브레이커 갱신"""
+        try:
+            if not self.database.async_pool:
+                await self.database.create_async_pool()
+            async with self.database.async_pool.acquire() as conn:
+                cursor = conn.cursor()
+                await cursor.execute("SELECT 1 FROM DUAL")
+                result = await cursor.fetchone()
+                cursor.close()
+            self.connected = result is not None
+            self.last_error = None
+        except Exception as e:
+            if self.connected:
+                logger.error(f"DB 헬스 체크 실패: {e}")
+            self.connected = False
+            self.last_error = str(e)
+        
+        self.last_checked_at = datetime.now()
+        if self.connected:
+            self.database.circuit_breaker.record_success()
+        else:
+            self.database.circuit_breaker.record_failure()
+        return self.connected
+    
+    async def run_once(self):
+        await self.probe()
+
+
+class DataVersionWatcher(PeriodicTask):
+    """DATA_VERSION 테이블 폴링
+    
+    적재 스크립트(load_data.py)가 데이터셋 적재를 마칠 때마다 버전을 올리면,
+    변경된 데이터셋에 등록된 콜백(인메모리 인덱스 갱신, 캐시 무효화 등)을 호출합니다.
+    
+    - 이전 폴링에 없던 데이터셋은 버전 0으로 간주 (첫 적재로 행이 생기면 변경)
+    - 버전과 UPDATED_AT 중 하나라도 다르면 변경 (DB 재구성 후 버전이 1로 돌아가도 감지)
+    """
+    
+    name = "데이터 버전 감시"
+    
+    def __init__(self, database: "Database", interval: float):
+        super().__init__(interval)
+        self.database = database
+        self.versions: Dict[str, int] = {}
+        self._stamps: Dict[str, Tuple[int, Optional[datetime]]] = {}
+        self._callbacks: Dict[str, List[Callable[[int], Awaitable[None]]]] = {}
+    
+    def subscribe(self, dataset: str, callback: Callable[[int], Awaitable[None]]):
+        """데이터셋 버전 변경 시 호출할 비동기 콜백 등록"""
+        self._callbacks.setdefault(dataset, []).append(callback)
+    
+    async def poll(self, notify: bool = True) -> Dict[str, int]:
+        """현재 버전을 조회하고 변경된 데이터셋의 콜백 호출
+        
+        notify=False면 현재 버전만 기준으로 기록 (서버 시작 시 인덱스를 직접 적재하기 직전 등)
+        """
+        stamps = await self.database.fetch_data_versions()
+        changed = [
+            dataset for dataset, stamp in stamps.items()
+            if self._stamps.get(dataset, (0, None)) != stamp
+        ]
+        self._stamps = stamps
+        self.versions = {dataset: stamp[0] for dataset, stamp in stamps.items()}
+        if not notify:
+            return self.versions
+        for dataset in changed:
+            version = self.versions[dataset]
+            logger.info(f"데이터 버전 변경 감지: {dataset} -> {version}")
+            for callback in self._callbacks.get(dataset, []):
+                try:
+                    await callback(version)
+                except Exception as e:
+                    logger.error(f"데이터 버전 콜백 실패 ({dataset}): {e}")
+        return self.versions
+    
+    async def run_once(self):
+        await self.poll()
+
 
 class Database:
     """Oracle 데이터베이스 연결 관리 클래스"""
     
     def __init__(self):
         self.pool: Optional[oracledb.ConnectionPool] = None
+        self.async_pool: Optional[oracledb.AsyncConnectionPool] = None
+        self.circuit_breaker = CircuitBreaker(
+            failure_threshold=settings.DB_CIRCUIT_FAILURE_THRESHOLD,
+            reset_timeout=settings.DB_CIRCUIT_RESET_TIMEOUT
+        )
+        self.health_monitor = DatabaseHealthMonitor(self, settings.DB_HEALTH_CHECK_INTERVAL)
+        self.data_versions = DataVersionWatcher(self, settings.DATA_VERSION_CHECK_INTERVAL)
+        # 비동기 풀 acquire 통계
+        self.acquire_latency = Histogram()
+        self.acquire_waiting = 0
+        self.acquire_timeouts = 0
     
     def create_pool(self):
         """연결 풀 생성"""
@@ -26,9 +450,7 @@ class Database:
                 user=settings.ORACLE_USER,
                 password=settings.ORACLE_PASSWORD,
                 dsn=settings.ORACLE_DSN,
-                min=1,
-                max=5,
-                increment=1
+                **pool_params()
             )
             logger.info("Oracle DB 연결 풀이 생성되었습니다.")
             
@@ -64,7 +486,9 @@ class Database:
         if not self.pool:
             self.create_pool()
         
+        started = time.perf_counter()
         conn = self.pool.acquire()
+        record_phase('acquire', time.perf_counter() - started)
         try:
             yield conn
             conn.commit()
@@ -92,6 +516,182 @@ class Database:
         except Exception as e:
             logger.error(f"연결 테스트 실패: {e}")
             return False
+    
+    # ------------------------------------------------------------------
+    # 비동기(asyncio) 연결 풀 - FastAPI 엔드포인트 전용
+    # ------------------------------------------------------------------
+    
+    async def create_async_pool(self):
+        """비동기 연결 풀 생성 (python-oracledb thin 모드)"""
+        try:
+            logger.info("Oracle DB 비동기 연결 풀 생성 중...")
+            logger.info(f"DSN: {settings.ORACLE_DSN}, User: {settings.ORACLE_USER}")
+            
+            self.async_pool = oracledb.create_pool_async(
+                user=settings.ORACLE_USER,
+                password=settings.ORACLE_PASSWORD,
+                dsn=settings.ORACLE_DSN,
+                **pool_params(),
+                stmtcachesize=settings.DB_STMT_CACHE_SIZE,
+                session_callback=self._init_async_session
+            )
+            logger.info("Oracle DB 비동기 연결 풀이 생성되었습니다.")
+        except oracledb.Error as e:
+            error, = e.args
+            logger.error(f"Oracle DB 비동기 연결 풀 생성 실패: {error.message}")
+            logger.error(f"오류 코드: {error.code}")
+            raise
+        except Exception as e:
+            logger.error(f"Oracle DB 비동기 연결 풀 생성 실패: {e}")
+            raise
+    
+    async def _init_async_session(self, conn, requested_tag):
+        """새 세션 생성 시 호출: 사전 렌더링된 SQL을 parse하여 statement cache 워밍업"""
+        statements = sql_registry.statements()
+        if len(statements) > settings.DB_STMT_CACHE_SIZE:
+            logger.warning(
+                f"DB_STMT_CACHE_SIZE({settings.DB_STMT_CACHE_SIZE})가 "
+                f"사전 렌더링 SQL 수({len(statements)})보다 작습니다."
+            )
+        cursor = conn.cursor()
+        try:
+            for sql in statements:
+                await cursor.parse(sql)
+        except Exception as e:
+            logger.warning(f"statement cache 워밍업 실패: {e}")
+        finally:
+            cursor.close()
+    
+    async def close_async_pool(self):
+        """비동기 연결 풀 종료"""
+        if self.async_pool:
+            await self.async_pool.close(force=True)
+            self.async_pool = None
+            logger.info("Oracle DB 비동기 연결 풀이 종료되었습니다.")
+    
+    @asynccontextmanager
+    async def acquire(self):
+        """비동기 데이터베이스 연결 컨텍스트 매니저
+        
+        작업 결과(연결/네트워크 장애 여부)를 서킷 브레이커에 반영합니다.
+        half_open 상태에서는 시험 요청 하나만 통과시키고, 시험 요청이 결과 없이 끝나면
+        (풀 대기 초과, DB와 무관한 오류, 취소) 슬롯을 반환하여 다음 요청을 시험 요청으로 허용합니다.
+        
+        사용 예:
+            async with db.acquire() as conn:
+                cursor = conn.cursor()
+                await cursor.execute(sql, params)
+                rows = await cursor.fetchall()
+        """
+        breaker = self.circuit_breaker
+        if not breaker.allow_request():
+            raise DatabaseUnavailableError("데이터베이스에 연결할 수 없습니다. (서킷 브레이커 open)")
+        trial = breaker.trial_started_at  # half_open 시험 요청이면 이 요청의 슬롯
+        try:
+            async with self._acquire_connection() as conn:
+                yield conn
+        finally:
+            # 성공/실패를 기록했으면 슬롯이 이미 비어 있으므로 아무 것도 하지 않음
+            breaker.release_trial(trial)
+    
+    @asynccontextmanager
+    async def _acquire_connection(self):
+        """풀에서 연결을 얻어 작업 후 커밋/롤백하고 반환 (acquire 통계, 요청 계측, 서킷 브레이커 기록)"""
+        if not self.async_pool:
+            await self.create_async_pool()
+        
+        self.acquire_waiting += 1
+        started = time.perf_counter()
+        try:
+            conn = await self.async_pool.acquire()
+        except Exception as e:
+            if is_pool_timeout(e):
+                # 풀 포화는 DB 장애가 아니므로 서킷 브레이커에 반영하지 않음
+                self.acquire_timeouts += 1
+                raise DatabaseUnavailableError("연결 풀 대기 시간이 초과되었습니다. 잠시 후 다시 시도하세요.")
+            self.circuit_breaker.record_failure()
+            raise
+        finally:
+            self.acquire_waiting -= 1
+            waited = time.perf_counter() - started
+            self.acquire_latency.observe(waited)
+        timing = current_request_timing.get()
+        if timing is not None:
+            timing.add('acquire', waited)
+        # 요청 타이밍 기록 또는 느린 쿼리 기록이 켜져 있으면 계측 연결로 감쌈
+        instrumented = InstrumentedConnection(conn, timing) if timing is not None or slow_query_log.enabled else None
+        try:
+            yield conn if instrumented is None else instrumented
+            if instrumented is not None:
+                await instrumented.finish()
+            await conn.commit()
+            self.circuit_breaker.record_success()
+        except Exception as e:
+            # 연결/네트워크 장애는 실패, 그 밖의 DB 오류(SQL 오류 등)는 DB가 응답한 것이므로 성공으로 반영
+            if is_connection_failure(e):
+                self.circuit_breaker.record_failure()
+            elif isinstance(e, oracledb.Error):
+                self.circuit_breaker.record_success()
+            if instrumented is not None:
+                await instrumented.finish()
+            await conn.rollback()
+            logger.error(f"데이터베이스 작업 중 오류 발생: {e}")
+            raise
+        finally:
+            await self.async_pool.release(conn)
+    
+    async def test_connection_async(self) -> bool:
+        """비동기 데이터베이스 연결 테스트"""
+        try:
+            async with self.acquire() as conn:
+                cursor = conn.cursor()
+                await cursor.execute("SELECT 1 FROM DUAL")
+                result = await cursor.fetchone()
+                cursor.close()
+                return result is not None
+        except oracledb.Error as e:
+            error, = e.args
+            logger.error(f"연결 테스트 실패: {error.message}")
+            logger.error(f"오류 코드: {error.code}")
+            return False
+        except Exception as e:
+            logger.error(f"연결 테스트 실패: {e}")
+            return False
+    
+    async def fetch_data_versions(self) -> Dict[str, Tuple[int, Optional[datetime]]]:
+        """DATA_VERSION 테이블의 데이터셋별 (버전, 갱신 시각) 조회 (테이블이 없으면 빈 dict)"""
+        try:
+            async with self.acquire() as conn:
+                cursor = conn.cursor()
+                await cursor.execute(sql_registry.get("data_version.sql"))
+                rows = await cursor.fetchall()
+                cursor.close()
+            return {row[0]: (int(row[1]), row[2]) for row in rows}
+        except oracledb.DatabaseError as e:
+            error, = e.args
+            if error.code == 942:  # ORA-00942: 테이블 없음 (재구성 전 DB)
+                return {}
+            raise
+    
+    def pool_stats(self) -> dict:
+        """비동기 연결 풀 현황 및 acquire 지연 시간 분포"""
+        pool = self.async_pool
+        return {
+            'opened': pool.opened if pool else 0,
+            'busy': pool.busy if pool else 0,
+            'waiting': self.acquire_waiting,
+            'acquire_timeouts': self.acquire_timeouts,
+            'min': settings.DB_POOL_MIN,
+            'max': settings.DB_POOL_MAX,
+            'increment': settings.DB_POOL_INCREMENT,
+            'getmode': settings.DB_POOL_GETMODE.lower(),
+            'wait_timeout_ms': settings.DB_POOL_WAIT_TIMEOUT,
+            'acquire_latency_seconds': self.acquire_latency.snapshot(),
+        }
+    
+    def is_available(self) -> bool:
+        """캐시된 헬스 상태 기준 DB 사용 가능 여부 (쿼리 없음)"""
+        return self.circuit_breaker.is_available()
 
 
 # 전역 데이터베이스 인스턴스
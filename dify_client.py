@@ -0,0 +1,133 @@
+"""
+Dify 프록시용 HTTP 클라이언트 모듈
+/proxy/dify가 요청마다 httpx.AsyncClient를 만들지 않고 프로세스 전체에서 하나의 클라이언트를 공유하여
+Dify 서버와의 연결(DNS 조회, TCP/TLS 핸드셰이크)을 재사용합니다.
+
+- 연결 풀: DIFY_PROXY_MAX_CONNECTIONS(전체), DIFY_PROXY_MAX_KEEPALIVE(유휴 연결 보관 수), DIFY_PROXY_KEEPALIVE_EXPIRY
+- 호스트별 동시 요청 상한: DIFY_PROXY_MAX_CONNECTIONS_PER_HOST
+  (httpx 연결 풀은 전체 상한만 지원하므로 호스트별 세마포어로 제한)
+  슬롯은 LLM 응답(스트리밍이면 스트림 전체)이 끝날 때까지 유지되므로 상한 초과 요청은
+  DIFY_PROXY_SLOT_WAIT_TIMEOUT까지 대기하고, 그래도 슬롯을 얻지 못하면 httpx.PoolTimeout (main.py에서 503)
+- HTTP/2: DIFY_PROXY_HTTP2=true이고 h2 패키지가 설치되어 있으면 사용 (pip install "httpx[http2]")
+- 타임아웃: 연결(DIFY_PROXY_CONNECT_TIMEOUT)과 응답 수신(DIFY_PROXY_READ_TIMEOUT)을 분리
+- 스트리밍: stream()은 응답 헤더까지 받은 응답을 반환하고 본문은 호출자가 읽는 대로 수신 (SSE 중계)
+- 수명: main.py startup에서 start(), shutdown에서 close() (시작 전 호출 시에는 처음 사용할 때 생성)
+- 응답 캐시 키: answer_cache_key() (user/conversation_id 등 요청마다 달라지는 필드 제외)
+"""
+import asyncio
+import hashlib
+import json
+import logging
+from contextlib import asynccontextmanager
+from typing import Any, Dict, Optional
+from urllib.parse import urlsplit, urlunsplit
+
+import httpx
+
+from config import settings
+
+try:
+    import h2  # noqa: F401
+except ImportError:  # 선택 의존성
+    h2 = None
+
+logger = logging.getLogger(__name__)
+
+# 응답 캐시 키에서 제외하는 payload 필드 (요청마다 달라지지만 실행 결과에는 영향 없음)
+VOLATILE_PAYLOAD_FIELDS = ('user', 'conversation_id')
+
+
+def answer_cache_key(url: str, app_type: str, api_key: str, payload: Dict[str, Any]) -> str:
+    """Dify 응답 캐시 키 (정규화한 URL + 앱 타입 + API Key 해시 + 정규화한 payload의 SHA-256)
+
+    Dify Cloud처럼 여러 앱이 같은 URL을 쓰므로 API Key(앱 구분)도 키에 포함합니다.
+    """
+    parts = urlsplit(url)
+    normalized_url = urlunsplit((parts.scheme.lower(), parts.netloc.lower(), parts.path.rstrip('/'), parts.query, ''))
+    stable_payload = {key: value for key, value in payload.items() if key not in VOLATILE_PAYLOAD_FIELDS}
+    material = '\n'.join((
+        normalized_url,
+        app_type,
+        hashlib.sha256(api_key.encode('utf-8')).hexdigest(),
+        json.dumps(stable_payload, ensure_ascii=False, sort_keys=True, separators=(',', ':'), default=str),
+    ))
+    return hashlib.sha256(material.encode('utf-8')).hexdigest()
+
+
+class DifyHttpClient:
+    """공유 httpx.AsyncClient + 호스트별 동시 요청 제한 (이벤트 루프 단일 스레드에서 사용)"""
+
+    def __init__(self):
+        self._client: Optional[httpx.AsyncClient] = None
+        self._host_slots: Dict[str, asyncio.Semaphore] = {}
+        self.http2 = settings.DIFY_PROXY_HTTP2 and h2 is not None
+
+    def start(self) -> httpx.AsyncClient:
+        """공유 클라이언트 생성 (이미 있으면 그대로 반환)"""
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                http2=self.http2,
+                follow_redirects=True,
+                limits=httpx.Limits(
+                    max_connections=settings.DIFY_PROXY_MAX_CONNECTIONS,
+                    max_keepalive_connections=settings.DIFY_PROXY_MAX_KEEPALIVE,
+                    keepalive_expiry=settings.DIFY_PROXY_KEEPALIVE_EXPIRY,
+                ),
+                timeout=httpx.Timeout(
+                    connect=settings.DIFY_PROXY_CONNECT_TIMEOUT,
+                    read=settings.DIFY_PROXY_READ_TIMEOUT,
+                    write=settings.DIFY_PROXY_CONNECT_TIMEOUT,
+                    pool=settings.DIFY_PROXY_CONNECT_TIMEOUT,
+                ),
+            )
+            logger.info(
+                f"Dify 프록시 HTTP 클라이언트 생성 (HTTP/2: {'사용' if self.http2 else '미사용'}, "
+                f"최대 연결 {settings.DIFY_PROXY_MAX_CONNECTIONS}, 호스트별 {settings.DIFY_PROXY_MAX_CONNECTIONS_PER_HOST})"
+            )
+        return self._client
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        return self._client if self._client is not None else self.start()
+
+    async def close(self):
+        """공유 클라이언트 종료 (유휴 연결 정리)"""
+        if self._client is not None:
+            client, self._client = self._client, None
+            await client.aclose()
+            logger.info("Dify 프록시 HTTP 클라이언트가 종료되었습니다.")
+
+    @asynccontextmanager
+    async def host_slot(self, url: str):
+        """호스트별 동시 요청 슬롯 (상한 초과 시 DIFY_PROXY_SLOT_WAIT_TIMEOUT까지 대기)"""
+        host = urlsplit(url).netloc.lower()
+        slot = self._host_slots.get(host)
+        if slot is None:
+            slot = self._host_slots[host] = asyncio.Semaphore(settings.DIFY_PROXY_MAX_CONNECTIONS_PER_HOST)
+        try:
+            await asyncio.wait_for(slot.acquire(), timeout=settings.DIFY_PROXY_SLOT_WAIT_TIMEOUT)
+        except asyncio.TimeoutError:
+            raise httpx.PoolTimeout(f"호스트별 동시 요청 상한({settings.DIFY_PROXY_MAX_CONNECTIONS_PER_HOST}) 대기 시간 초과: {host}")
+        try:
+            yield
+        finally:
+            slot.release()
+
+    async def post(self, url: str, headers: Dict[str, str], json: Any) -> httpx.Response:
+        """JSON POST (응답 본문까지 수신)"""
+        async with self.host_slot(url):
+            return await self.client.post(url, headers=headers, json=json)
+
+    @asynccontextmanager
+    async def stream(self, url: str, headers: Dict[str, str], json: Any):
+        """JSON POST 스트리밍 응답 (응답 헤더까지 받은 httpx.Response, 블록을 벗어나면 업스트림 연결 종료)
+
+        스트림을 읽는 동안 호스트별 동시 요청 슬롯을 유지합니다.
+        """
+        async with self.host_slot(url):
+            async with self.client.stream("POST", url, headers=headers, json=json) as response:
+                yield response
+
+
+# 전역 Dify 프록시 HTTP 클라이언트 인스턴스
+dify_client = DifyHttpClient()
@@ -0,0 +1,376 @@
+#!/usr/bin/env python3
+"""
+워크로드 기반 인덱스 추천 도구
+WORKLOAD_LOG_PATH로 기록한 요청 파라미터(JSONL)를 query_builder로 다시 조립하여
+템플릿 shape(필터 조합)별로 EXPLAIN PLAN을 실행하고, 조건 컬럼을 인덱스로 다 쓰지 못하는 shape에
+복합 인덱스를 제안합니다. ID/NAME 조회(lookup_id)는 UPPER(TRIM(컬럼)) 함수 기반 인덱스를 확인합니다.
+
+- 인덱스 컬럼 순서: 동등 조건 컬럼(워크로드에서 자주 쓰인 순) -> 기간/정렬 컬럼 (+ 키셋 정렬 보조 컬럼)
+- 기존 인덱스의 선행 컬럼이 동등 조건 컬럼 + 기간/정렬 컬럼을 이미 포함하면 제안하지 않음
+- 제안 순위: shape별 요청 수 x EXPLAIN PLAN 비용 합계
+- --write-migration: 제안을 index_migrations/V{다음 번호}__index_advisor.sql로 기록
+  (적용은 python recreate_database.py --migrate-only)
+
+EXPLAIN PLAN은 바인드 값 없이 계획을 세우므로 바인드 peeking 이전의 일반 계획 기준입니다.
+
+사용 예:
+    python index_advisor.py logs/workload.jsonl
+    python index_advisor.py logs/workload.jsonl --min-count 10 --write-migration
+"""
+import argparse
+import hashlib
+import json
+import logging
+import re
+import sys
+from collections import Counter
+from pathlib import Path
+from typing import Dict, List, NamedTuple, Optional, Tuple
+from database import db
+from query_builder import query_builder, QUERY_SPECS, ERROR_CODE_STATS_TEMPLATES
+from sql_registry import sql_registry, LOOKUP_TABLES
+
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+MIGRATIONS_DIR = Path(__file__).parent / 'index_migrations'
+
+# PLAN_TABLE 행 구분용 STATEMENT_ID
+STATEMENT_ID = 'index_advisor'
+
+# 템플릿별 조회 대상 테이블 (기본 INFORM_NOTE)
+TEMPLATE_TABLES = {
+    'error_code_stats_rollup.sql': 'INFORM_NOTE_DAILY_STATS',
+}
+
+# 동등(=, IN) 조건 바인드 -> 컬럼 (operator LIKE는 선행 와일드카드라 인덱스 대상 아님)
+EQUALITY_BINDS = {
+    'process_id': 'PROCESS_ID',
+    'model_id': 'MODEL_ID',
+    'eqp_id': 'EQP_ID',
+    'error_code': 'ERROR_CODE',
+    'status_id': 'STATUS_ID',
+    'op0': 'OPERATOR',          # 작업자 인덱스로 좁힌 작업자 이름 IN 목록
+}
+RANGE_BINDS = ('start_date', 'end_date', 'cursor_time', 'cursor_id')
+FIXED_EQUALITY_PATTERN = re.compile(r'^n\.(\w+) = ')
+
+# 목록 템플릿의 키셋 정렬 컬럼 (ORDER BY down_start_time DESC NULLS FIRST, informnote_id DESC)
+LIST_ORDER_COLUMNS = ('DOWN_START_TIME', 'INFORMNOTE_ID')
+
+# 인덱스 이름용 약어 (Oracle 식별자 30자 이내 유지)
+TABLE_ABBREVIATIONS = {
+    'INFORM_NOTE': 'IN',
+    'INFORM_NOTE_DAILY_STATS': 'IN_DAILY',
+}
+COLUMN_ABBREVIATIONS = {
+    'DOWN_TYPE_ID': 'TYPE',
+    'DOWN_START_TIME': 'START',
+    'INFORMNOTE_ID': 'ID',
+    'PROCESS_ID': 'PROC',
+    'MODEL_ID': 'MODEL',
+    'EQP_ID': 'EQP',
+    'ERROR_CODE': 'ERR',
+    'STATUS_ID': 'STATUS',
+    'OPERATOR': 'OPER',
+    'STAT_DAY': 'DAY',
+}
+FUNCTION_INDEX_PATTERN = re.compile(r'^UPPER\(TRIM\((\w+)\)\)$')
+MAX_IDENTIFIER_LENGTH = 30
+
+
+class ShapeAccess(NamedTuple):
+    """shape 하나의 인덱스 관점 조건 컬럼"""
+    table: str
+    equality: Tuple[str, ...]     # 동등 조건 컬럼
+    tail: Tuple[str, ...]         # 기간/정렬 컬럼 (첫 컬럼까지가 필수, 나머지는 정렬 보조)
+
+
+class Proposal(NamedTuple):
+    table: str
+    columns: Tuple[str, ...]      # 컬럼 또는 함수 식
+    weight: float                 # 요청 수 x 계획 비용 합계
+    reasons: List[str]
+
+    @property
+    def name(self) -> str:
+        return index_name(self.table, self.columns)
+
+    @property
+    def ddl(self) -> str:
+        return f"CREATE INDEX {self.name} ON {self.table}({', '.join(self.columns)})"
+
+
+def column_label(column: str) -> str:
+    """인덱스 이름용 컬럼 약어 (UPPER(TRIM(EQP_NAME)) -> NAME_UPPER)"""
+    match = FUNCTION_INDEX_PATTERN.match(column)
+    if match:
+        return f"{match.group(1).rsplit('_', 1)[-1]}_UPPER"
+    return COLUMN_ABBREVIATIONS.get(column, re.sub(r'\W+', '', column))
+
+
+def index_name(table: str, columns: Tuple[str, ...]) -> str:
+    """제안 인덱스 이름 (30자를 넘으면 잘라서 해시 접미사)"""
+    parts = [column_label(column) for column in columns]
+    name = f"IDX_{TABLE_ABBREVIATIONS.get(table, table)}_{'_'.join(parts)}"
+    if len(name) > MAX_IDENTIFIER_LENGTH:
+        digest = hashlib.sha1(name.encode('utf-8')).hexdigest()[:6].upper()
+        name = f"{name[:MAX_IDENTIFIER_LENGTH - 7]}_{digest}"
+    return name
+
+
+def normalize_expression(expression: str) -> str:
+    """인덱스 컬럼/식 비교용 정규화 (따옴표/공백 제거, 대문자)"""
+    return re.sub(r'[\s"]+', '', expression).upper()
+
+
+def load_workload(path: Path) -> List[dict]:
+    """워크로드 JSONL 읽기 (형식이 맞지 않는 줄은 건너뜀)"""
+    records = []
+    with open(path, 'r', encoding='utf-8') as f:
+        for line_no, line in enumerate(f, 1):
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                logger.warning(f"{line_no}행: JSON 형식이 아닙니다 (건너뜀)")
+                continue
+            if record.get('template') not in QUERY_SPECS:
+                logger.warning(f"{line_no}행: 알 수 없는 템플릿 {record.get('template')!r} (건너뜀)")
+                continue
+            records.append(record)
+    return records
+
+
+def shape_access(filename: str, binds: Dict[str, object]) -> Optional[ShapeAccess]:
+    """조립된 바인드로 shape의 조건 컬럼 구성 (ID 목록 조회는 기본 키로 접근하므로 None)"""
+    if 'k0' in binds:
+        return None
+    spec = QUERY_SPECS[filename]
+    equality = [match.group(1).upper() for match in map(FIXED_EQUALITY_PATTERN.match, spec.fixed) if match]
+    equality += [column for bind, column in EQUALITY_BINDS.items() if bind in binds]
+
+    date_column = spec.date_col.split('.')[-1].upper()
+    if filename in ERROR_CODE_STATS_TEMPLATES:
+        has_range = any(bind in binds for bind in RANGE_BINDS)
+        tail = (date_column,) if has_range else ()
+    else:
+        tail = LIST_ORDER_COLUMNS
+    if not equality and not tail:
+        return None
+    return ShapeAccess(TEMPLATE_TABLES.get(filename, 'INFORM_NOTE'), tuple(equality), tail)
+
+
+def covers(index_columns: List[str], access: ShapeAccess) -> bool:
+    """기존 인덱스 선행 컬럼이 동등 조건 컬럼(순서 무관) + 첫 기간/정렬 컬럼을 포함하는지"""
+    required = len(access.equality) + min(len(access.tail), 1)
+    if not required or len(index_columns) < required:
+        return False
+    leading = index_columns[:len(access.equality)]
+    if set(leading) != set(access.equality):
+        return False
+    return not access.tail or index_columns[len(access.equality)] == access.tail[0]
+
+
+class IndexAdvisor:
+    """EXPLAIN PLAN / 데이터 딕셔너리 조회 (동기 연결 사용, 오프라인 도구)"""
+
+    def __init__(self, cursor):
+        self.cursor = cursor
+        self._indexes: Dict[str, Dict[str, List[str]]] = {}
+
+    def indexes(self, table: str) -> Dict[str, List[str]]:
+        """테이블의 인덱스 -> 컬럼 목록 (함수 기반 인덱스는 정규화한 식)"""
+        if table not in self._indexes:
+            self.cursor.execute("""
+                SELECT c.index_name, c.column_name, e.column_expression
+                FROM user_ind_columns c
+                LEFT JOIN user_ind_expressions e
+                  ON e.index_name = c.index_name AND e.column_position = c.column_position
+                WHERE c.table_name = :table_name
+                ORDER BY c.index_name, c.column_position
+            """, {"table_name": table})
+            indexes: Dict[str, List[str]] = {}
+            for name, column_name, expression in self.cursor.fetchall():
+                column = normalize_expression(expression) if expression else column_name
+                indexes.setdefault(name, []).append(column)
+            self._indexes[table] = indexes
+        return self._indexes[table]
+
+    def explain(self, sql: str, table: str) -> Tuple[bool, List[str], float]:
+        """(대상 테이블 전체 스캔 여부, 사용 인덱스 목록, 계획 비용)"""
+        self.cursor.execute(f"DELETE FROM PLAN_TABLE WHERE statement_id = '{STATEMENT_ID}'")
+        self.cursor.execute(f"EXPLAIN PLAN SET STATEMENT_ID = '{STATEMENT_ID}' FOR {sql}")
+        self.cursor.execute(f"""
+            SELECT id, operation, options, object_name, cost
+            FROM PLAN_TABLE
+            WHERE statement_id = '{STATEMENT_ID}'
+            ORDER BY id
+        """)
+        steps = self.cursor.fetchall()
+        self.cursor.execute(f"DELETE FROM PLAN_TABLE WHERE statement_id = '{STATEMENT_ID}'")
+
+        table_indexes = self.indexes(table)
+        full_scan = any(
+            operation == 'TABLE ACCESS' and options == 'FULL' and object_name == table
+            for _, operation, options, object_name, _ in steps
+        )
+        used = [object_name for _, operation, _, object_name, _ in steps
+                if operation == 'INDEX' and object_name in table_indexes]
+        cost = next((step_cost for step_id, *_, step_cost in steps if step_id == 0), None) or 0
+        return full_scan, used, float(cost)
+
+
+def advise_shapes(advisor: IndexAdvisor, records: List[dict], min_count: int) -> List[Proposal]:
+    """워크로드 shape별 EXPLAIN PLAN 결과로 복합 인덱스 제안"""
+    shapes: Dict[str, Tuple[str, ShapeAccess]] = {}
+    counts: Counter = Counter()
+    for record in records:
+        sql, binds = query_builder.build(
+            record['template'], record.get('params') or {},
+            group_by=record.get('group_by'), in_lists=record.get('in_lists') or None,
+        )
+        access = shape_access(record['template'], binds)
+        if access is None:
+            continue
+        shapes[sql] = (record['template'], access)
+        counts[sql] += 1
+
+    # 동등 조건 컬럼은 워크로드 전체에서 자주 쓰인 순으로 배치 (여러 shape가 같은 인덱스를 공유하도록)
+    column_usage: Counter = Counter()
+    for sql, (_, access) in shapes.items():
+        for column in access.equality:
+            column_usage[column] += counts[sql]
+
+    print(f"\n{'요청 수':>8}  {'비용':>8}  {'템플릿':<32}{'접근 경로':<40}제안")
+    proposals: Dict[Tuple[str, Tuple[str, ...]], Proposal] = {}
+    for sql, (filename, access) in sorted(shapes.items(), key=lambda item: -counts[item[0]]):
+        if counts[sql] < min_count:
+            continue
+        full_scan, used, cost = advisor.explain(sql, access.table)
+        table_indexes = advisor.indexes(access.table)
+        path = 'FULL SCAN' if full_scan else (', '.join(used) or '-')
+        condition = ', '.join(access.equality + access.tail[:1]) or '(조건 없음)'
+
+        if any(covers(columns, access) for columns in table_indexes.values()):
+            status = '기존 인덱스로 충분' if not full_scan else '기존 인덱스 미사용 (통계 확인 필요)'
+        elif not full_scan and any(covers(table_indexes[name], access) for name in used):
+            status = '-'
+        else:
+            equality = tuple(sorted(access.equality, key=lambda column: (-column_usage[column], column)))
+            columns = equality + access.tail
+            key = (access.table, columns)
+            reason = f"{filename} [{condition}] {counts[sql]}회, 비용 {cost:g}, {path}"
+            previous = proposals.get(key)
+            proposals[key] = Proposal(
+                access.table, columns,
+                (previous.weight if previous else 0.0) + counts[sql] * max(cost, 1.0),
+                (previous.reasons if previous else []) + [reason],
+            )
+            status = index_name(access.table, columns)
+        print(f"{counts[sql]:>8}  {cost:>8g}  {filename:<32}{path[:38]:<40}{status}")
+        print(f"{'':>20}조건: {condition}")
+
+    return merge_prefix_proposals(list(proposals.values()))
+
+
+def merge_prefix_proposals(proposals: List[Proposal]) -> List[Proposal]:
+    """다른 제안의 선행 컬럼과 같은 제안은 긴 쪽으로 합침"""
+    merged: List[Proposal] = []
+    for proposal in sorted(proposals, key=lambda p: -len(p.columns)):
+        target = next((i for i, other in enumerate(merged)
+                       if other.table == proposal.table and other.columns[:len(proposal.columns)] == proposal.columns), None)
+        if target is None:
+            merged.append(proposal)
+        else:
+            other = merged[target]
+            merged[target] = other._replace(weight=other.weight + proposal.weight, reasons=other.reasons + proposal.reasons)
+    return sorted(merged, key=lambda p: -p.weight)
+
+
+def advise_lookups(advisor: IndexAdvisor) -> List[Proposal]:
+    """ID/NAME 조회(UPPER(TRIM(컬럼)) 조건)의 함수 기반 인덱스 확인"""
+    print(f"\n{'테이블':<12}{'접근 경로':<40}제안")
+    proposals = []
+    for table, (id_col, name_col) in LOOKUP_TABLES.items():
+        full_scan, used, cost = advisor.explain(sql_registry.lookup_id(table, True, True), table)
+        existing = {columns[0] for columns in advisor.indexes(table).values()}
+        missing = []
+        for column in (id_col, name_col):
+            expression = f"UPPER(TRIM({column}))"
+            if normalize_expression(expression) not in existing:
+                missing.append(expression)
+                proposals.append(Proposal(table, (expression,), cost, [f"lookup_id {table} 비용 {cost:g}"]))
+        path = 'FULL SCAN' if full_scan else (', '.join(used) or '-')
+        status = ', '.join(index_name(table, (expression,)) for expression in missing) or '기존 인덱스로 충분'
+        print(f"{table:<12}{path[:38]:<40}{status}")
+    return proposals
+
+
+def next_migration_path() -> Path:
+    versions = [int(match.group(1)) for match in
+                (re.match(r'^V(\d+)__', path.name) for path in MIGRATIONS_DIR.glob('V*.sql')) if match]
+    return MIGRATIONS_DIR / f"V{max(versions, default=0) + 1:03d}__index_advisor.sql"
+
+
+def write_migration(proposals: List[Proposal], workload_path: Path, record_count: int) -> Path:
+    """제안 인덱스를 다음 버전 마이그레이션 파일로 기록"""
+    path = next_migration_path()
+    lines = [
+        f"-- {path.stem.split('__')[0]}: index_advisor.py 제안 인덱스",
+        f"-- 워크로드: {workload_path.name} (요청 {record_count}건)",
+        "-- 적용: python recreate_database.py --migrate-only",
+    ]
+    for proposal in proposals:
+        lines.append("")
+        lines.extend(f"-- {reason}" for reason in proposal.reasons)
+        lines.append(f"{proposal.ddl};")
+    path.write_text('\n'.join(lines) + '\n', encoding='utf-8')
+    return path
+
+
+def main():
+    parser = argparse.ArgumentParser(description='워크로드 기반 인덱스 추천')
+    parser.add_argument('workload', type=Path, help='WORKLOAD_LOG_PATH로 기록한 JSONL 파일')
+    parser.add_argument('--min-count', type=int, default=1, help='이 횟수 미만으로 요청된 shape는 제외 (기본 1)')
+    parser.add_argument('--skip-lookups', action='store_true', help='ID/NAME 조회 함수 기반 인덱스 확인 생략')
+    parser.add_argument('--write-migration', action='store_true', help='제안을 index_migrations/ 다음 버전 파일로 기록')
+    args = parser.parse_args()
+
+    if not args.workload.exists():
+        logger.error(f"워크로드 파일을 찾을 수 없습니다: {args.workload}")
+        sys.exit(1)
+
+    sql_registry.load()
+    records = load_workload(args.workload)
+    print(f"워크로드: {args.workload} (요청 {len(records)}건)")
+
+    with db.get_connection() as conn:
+        cursor = conn.cursor()
+        advisor = IndexAdvisor(cursor)
+        proposals = advise_shapes(advisor, records, args.min_count)
+        if not args.skip_lookups:
+            proposals += advise_lookups(advisor)
+        cursor.close()
+    proposals.sort(key=lambda proposal: -proposal.weight)
+
+    if not proposals:
+        print("\n✓ 제안할 인덱스가 없습니다.")
+        return
+
+    print(f"\n제안 인덱스 ({len(proposals)}개, 가중치 = 요청 수 x 계획 비용):")
+    for proposal in proposals:
+        print(f"  [{proposal.weight:>10g}] {proposal.ddl};")
+
+    if args.write_migration:
+        path = write_migration(proposals, args.workload, len(records))
+        print(f"\n✓ 마이그레이션 기록: {path.relative_to(Path(__file__).parent)}")
+        print("  적용: python recreate_database.py --migrate-only")
+
+
+if __name__ == '__main__':
+    main()
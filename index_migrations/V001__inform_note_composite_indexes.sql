@@ -0,0 +1,17 @@
+-- V001: 조회 패턴 기준 복합/함수 기반 인덱스
+-- recreate_database.py가 버전 순서대로 적용하고 SCHEMA_MIGRATIONS에 기록
+-- (이후 버전은 index_advisor.py가 워크로드 EXPLAIN PLAN 결과로 제안한 인덱스를 기록)
+
+-- Error Code 통계(down_type_id = 1 + 기간 조건), PM 이력(down_type_id = 0 + down_start_time DESC 키셋 순서)
+CREATE INDEX IDX_INFORM_NOTE_TYPE_START ON INFORM_NOTE(down_type_id, down_start_time, informnote_id);
+
+-- 위 복합 인덱스의 선행 컬럼과 같은 단일 컬럼 인덱스 제거
+DROP INDEX IDX_INFORM_NOTE_DOWN_TYPE_COL;
+
+-- ID/NAME 조회 (lookup_id.sql / lookup_id_batch.sql의 UPPER(TRIM(컬럼)) 조건)
+CREATE INDEX IDX_PROCESS_ID_UPPER ON PROCESS(UPPER(TRIM(process_id)));
+CREATE INDEX IDX_PROCESS_NAME_UPPER ON PROCESS(UPPER(TRIM(process_name)));
+CREATE INDEX IDX_MODEL_ID_UPPER ON MODEL(UPPER(TRIM(model_id)));
+CREATE INDEX IDX_MODEL_NAME_UPPER ON MODEL(UPPER(TRIM(model_name)));
+CREATE INDEX IDX_EQUIPMENT_ID_UPPER ON EQUIPMENT(UPPER(TRIM(eqp_id)));
+CREATE INDEX IDX_EQUIPMENT_NAME_UPPER ON EQUIPMENT(UPPER(TRIM(eqp_name)));
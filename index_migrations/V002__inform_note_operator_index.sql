@@ -0,0 +1,6 @@
+-- V002: 작업자 조건 인덱스
+-- operator_index.py가 작업자 부분 일치 조건을 후보 이름 IN 목록(n.operator IN (...))으로 바꾼 조회용
+-- (create_informnote_table.sql로 이미 만든 DB는 ORA-00955로 건너뛰고 적용 이력만 기록)
+
+-- 작업자 조회 (후보 이름 IN 조건 + 기간 조건)
+CREATE INDEX IDX_INFORM_NOTE_OPERATOR_COL ON INFORM_NOTE(operator, down_start_time);
@@ -100,6 +100,100 @@ WHEN NOT MATCHED THEN INSERT (
 """
 
 
+# 데이터셋 적재 버전 증가 SQL (API 서버가 DATA_VERSION을 폴링하여 인메모리 인덱스/캐시 갱신)
+DATA_VERSION_BUMP_SQL = """
+MERGE INTO DATA_VERSION dst
+USING (SELECT :dataset_name AS dataset_name FROM dual) src
+ON (dst.dataset_name = src.dataset_name)
+WHEN MATCHED THEN UPDATE SET
+    version = dst.version + 1,
+    updated_at = SYSDATE
+WHEN NOT MATCHED THEN INSERT (dataset_name, version, updated_at)
+VALUES (:dataset_name, 1, SYSDATE)
+"""
+
+
+def bump_data_version(dataset_name: str):
+    """데이터셋 적재 완료 후 버전 증가 (DATA_VERSION 테이블이 없으면 경고만 출력)"""
+    try:
+        with db.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(DATA_VERSION_BUMP_SQL, {'dataset_name': dataset_name})
+            cursor.close()
+        logger.info(f"  ✓ 데이터 버전 증가: {dataset_name}")
+    except Exception as e:
+        logger.warning(f"  ⚠ 데이터 버전 증가 실패 ({dataset_name}): {e}")
+
+
+# INFORM_NOTE 일별 집계 재구성 SQL (DELETE + INSERT를 한 트랜잭션으로 실행하여 조회 중에도 일관성 유지)
+DAILY_STATS_DELETE_SQL = "DELETE FROM INFORM_NOTE_DAILY_STATS"
+
+DAILY_STATS_INSERT_SQL = """
+INSERT INTO INFORM_NOTE_DAILY_STATS (
+    stat_day, process_id, model_id, eqp_id, error_code, down_type_id,
+    event_cnt, down_time_minutes_sum
+)
+SELECT
+    TRUNC(down_start_time),
+    process_id,
+    model_id,
+    eqp_id,
+    error_code,
+    down_type_id,
+    COUNT(*),
+    SUM(down_time_minutes)
+FROM INFORM_NOTE
+GROUP BY TRUNC(down_start_time), process_id, model_id, eqp_id, error_code, down_type_id
+"""
+
+# 집계 테이블 버전을 원본 데이터셋 버전과 동일하게 맞추는 SQL
+DATA_VERSION_SYNC_SQL = """
+MERGE INTO DATA_VERSION dst
+USING (
+    SELECT :dataset_name AS dataset_name, version
+    FROM DATA_VERSION
+    WHERE dataset_name = :source_dataset
+) src
+ON (dst.dataset_name = src.dataset_name)
+WHEN MATCHED THEN UPDATE SET
+    version = src.version,
+    updated_at = SYSDATE
+WHEN NOT MATCHED THEN INSERT (dataset_name, version, updated_at)
+VALUES (src.dataset_name, src.version, SYSDATE)
+"""
+
+
+def sync_data_version(dataset_name: str, source_dataset: str):
+    """파생 데이터셋 버전을 원본 데이터셋 버전과 맞춤 (API 서버는 두 버전이 같을 때만 파생 데이터 사용)"""
+    try:
+        with db.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(DATA_VERSION_SYNC_SQL, {
+                'dataset_name': dataset_name,
+                'source_dataset': source_dataset,
+            })
+            cursor.close()
+        logger.info(f"  ✓ 데이터 버전 동기화: {dataset_name} = {source_dataset}")
+    except Exception as e:
+        logger.warning(f"  ⚠ 데이터 버전 동기화 실패 ({dataset_name}): {e}")
+
+
+def rebuild_inform_note_daily_stats():
+    """INFORM_NOTE 일별 집계 테이블 재구성 (Error Code 통계 API가 사용)"""
+    table_name = 'INFORM_NOTE_DAILY_STATS'
+    try:
+        with db.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(DAILY_STATS_DELETE_SQL)
+            cursor.execute(DAILY_STATS_INSERT_SQL)
+            logger.info(f"  ✓ {table_name} {cursor.rowcount}건 집계 완료")
+            cursor.close()
+        sync_data_version('inform_note_daily', 'inform_note')
+    except Exception as e:
+        # 집계 실패 시 버전이 맞지 않으므로 API는 원본 테이블로 집계
+        logger.warning(f"  ⚠ {table_name} 재구성 실패 (원본 테이블 집계로 대체됨): {e}")
+
+
 def _clean(value: Any):
     """값 정리"""
     if value is None:
@@ -222,6 +316,8 @@ def load_reference_tables():
         except Exception as e:
             logger.error(f"✗ {sheet_name} 시트 적재 실패: {e}", exc_info=True)
             raise
+    
+    bump_data_version('reference')
 
 
 def load_reference_dependencies():
@@ -406,6 +502,8 @@ def load_term_dictionary(truncate: bool = False):
     except Exception as e:
         logger.error(f"✗ {table_name} 데이터 적재 실패: {e}", exc_info=True)
         raise
+    
+    bump_data_version('term_dictionary')
 
 
 def _dedup_columns(columns):
@@ -547,6 +645,9 @@ def load_inform_notes():
             
             cursor.close()
         
+        bump_data_version('inform_note')
+        rebuild_inform_note_daily_stats()
+        
     except Exception as e:
         logger.error(f"✗ {table_name} 데이터 적재 실패: {e}", exc_info=True)
         raise
@@ -5,17 +5,33 @@ Dify에서 받은 입력값으로 DB를 조회하고 결과를 반환합니다.
 """
 from fastapi import FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse, StreamingResponse
+from fastapi.responses import JSONResponse, Response, StreamingResponse
+from starlette.background import BackgroundTask
 from pydantic import BaseModel, Field
+from starlette.datastructures import MutableHeaders
 from typing import Optional, List, Tuple, Any, Dict
+from contextlib import AsyncExitStack
 from datetime import date
+import anyio
+import asyncio
+import base64
 import logging
 import json
+import time
 import httpx
-from database import db
+from database import db, DatabaseUnavailableError, fetch_lobs_as_text
 from config import settings
-from utils import read_sql_file
-from pathlib import Path
+from sql_registry import sql_registry, LOOKUP_TABLES, LOOKUP_BATCH_BUCKETS
+from query_builder import query_builder, error_code_stats_template, normalize_group_by, ID_BUCKETS
+from reference_index import reference_index, build_lookup_maps, resolve_from_maps, REFERENCE_DATASET
+from text_index import text_index, INFORM_NOTE_DATASET
+from operator_index import operator_index
+from term_index import term_index
+from cache import TTLCache, SingleFlight, make_cache_key
+from dify_client import dify_client, answer_cache_key
+from serialization import FastJSONResponse, dumps, dumps_line
+from metrics import RequestTiming, PrometheusText, current_request_timing, request_metrics, timed_phase
+from slow_query import slow_query_log
 
 # 로깅 설정
 logging.basicConfig(
@@ -41,6 +57,72 @@ app.add_middleware(
 )
 
 
+
+class RequestTimingMiddleware:
+    """요청 단계별 시간 측정 ASGI 미들웨어 (Server-Timing 응답 헤더 + /metrics 엔드포인트별 누적)
+    
+    응답 헤더 전송 시점까지를 요청 처리 시간으로 기록 (스트리밍 응답의 본문 전송 시간은 제외)
+    """
+    
+    def __init__(self, app):
+        self.app = app
+    
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not settings.REQUEST_METRICS_ENABLED:
+            await self.app(scope, receive, send)
+            return
+        
+        timing = RequestTiming(scope["path"])
+        
+        async def send_with_timing(message):
+            if message["type"] == "http.response.start":
+                total = time.perf_counter() - timing.started
+                # 경로 템플릿 기준으로 집계 (라우트가 없는 요청은 한 항목으로 묶어 라벨 수를 제한)
+                endpoint = getattr(scope.get("route"), "path", None) or "unmatched"
+                request_metrics.observe(scope["method"], endpoint, message["status"], total, timing)
+                if settings.SERVER_TIMING_HEADER:
+                    MutableHeaders(scope=message).append("Server-Timing", timing.server_timing(total))
+            await send(message)
+        
+        token = current_request_timing.set(timing)
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            current_request_timing.reset(token)
+
+
+app.add_middleware(RequestTimingMiddleware)
+
+# 통계/검색 API 응답 캐시
+INFORM_NOTE_DAILY_DATASET = 'inform_note_daily'
+response_cache = TTLCache(
+    ttl=settings.RESPONSE_CACHE_TTL,
+    max_entries=settings.RESPONSE_CACHE_MAX_ENTRIES if settings.RESPONSE_CACHE_ENABLED else 0
+)
+# 캐시에 없는 같은 요청의 동시 DB 조회 병합 (Dify 병렬 분기가 같은 요청을 동시에 보내는 경우, 키는 응답 캐시와 동일)
+request_coalescer = SingleFlight(enabled=settings.REQUEST_COALESCING_ENABLED)
+
+# /proxy/dify 응답 캐시 (opt-in, 같은 워크플로 요청의 실행 결과 재사용)
+dify_answer_cache = TTLCache(
+    ttl=settings.DIFY_ANSWER_CACHE_TTL,
+    max_entries=settings.DIFY_ANSWER_CACHE_MAX_ENTRIES if settings.DIFY_ANSWER_CACHE_ENABLED else 0
+)
+DIFY_ANSWER_CACHE_APP_TYPES = {
+    app_type.strip() for app_type in settings.DIFY_ANSWER_CACHE_APP_TYPES.split(',') if app_type.strip()
+}
+
+
+async def invalidate_response_cache(version: int):
+    """Inform Note 또는 레퍼런스 데이터 적재 완료 시 응답 캐시 전체 무효화 (Dify 응답도 조회 데이터 기준이므로 함께)"""
+    response_cache.clear()
+    dify_answer_cache.clear()
+    logger.info(f"응답 캐시 무효화 (데이터 버전 {version})")
+
+
+db.data_versions.subscribe(INFORM_NOTE_DATASET, invalidate_response_cache)
+db.data_versions.subscribe(REFERENCE_DATASET, invalidate_response_cache)
+
+
 # ============================================================================
 # 요청/응답 모델
 # ============================================================================
@@ -69,6 +151,8 @@ class IdLookupRequest(BaseModel):
     process: Optional[ProcessInfo] = None
     model: Optional[ModelInfo] = None
     equipment: Optional[EquipmentInfo] = None
+    # 계층 해석 모드: 장비 -> 모델 -> 공정 계층으로 비어 있는 상위 ID를 채우고 불일치 검사
+    resolve_hierarchy: Optional[bool] = False
 
 
 class IdLookupResponse(BaseModel):
@@ -76,12 +160,83 @@ class IdLookupResponse(BaseModel):
     process_id: Optional[str] = None
     model_id: Optional[str] = None
     eqp_id: Optional[str] = None
+    # 계층 해석 모드에서만 채워짐: 요청한 ID 조합의 계층 불일치 내역
+    conflicts: Optional[List[str]] = None
+
+
+class IdLookupBatchRequest(BaseModel):
+    """ID 일괄 조회 요청 모델"""
+    items: List[IdLookupRequest] = Field(..., max_length=1000)
+
+
+class IdLookupBatchItem(IdLookupResponse):
+    """ID 일괄 조회 결과 아이템 모델 (missing: 값이 주어졌지만 찾지 못한 엔티티)"""
+    missing: List[str] = []
+
+
+class IdLookupBatchResponse(BaseModel):
+    """ID 일괄 조회 응답 모델 (요청 items 순서 유지)"""
+    list: List[IdLookupBatchItem]
 
 
 class HealthResponse(BaseModel):
     """헬스 체크 응답 모델"""
     status: str
     database_connected: bool
+    circuit_state: Optional[str] = None
+    last_checked_at: Optional[str] = None
+
+
+class PoolStatsResponse(BaseModel):
+    """연결 풀 통계 응답 모델"""
+    opened: int
+    busy: int
+    waiting: int
+    acquire_timeouts: int
+    min: int
+    max: int
+    increment: int
+    getmode: str
+    wait_timeout_ms: int
+    acquire_latency_seconds: Dict[str, Any]
+
+
+class CacheStatsResponse(BaseModel):
+    """응답 캐시 통계 응답 모델"""
+    enabled: bool
+    entries: int
+    max_entries: int
+    ttl_seconds: float
+    hits: int
+    misses: int
+    hit_ratio: Optional[float] = None
+    evictions: int
+    invalidations: int
+    coalescing: Dict[str, Any]     # 동시 요청 병합 현황 (enabled/in_flight/executions/coalesced)
+
+
+class SlowQueryItem(BaseModel):
+    """템플릿별 느린 쿼리 누적 항목 모델"""
+    template: str
+    count: int
+    errors: int = 0                            # 실행 실패(호출 타임아웃 등)로 끝난 횟수
+    total_ms: float
+    avg_ms: float
+    max_ms: float
+    max_rows: int
+    last_seen: Optional[str] = None
+    slowest: Optional[Dict[str, Any]] = None   # 가장 느렸던 실행의 시간/행 수/요청 경로/바인드 값(기본은 가림)/오류
+    plan: Optional[List[str]] = None           # 마지막으로 샘플링된 실제 실행 계획
+
+
+class SlowQueryResponse(BaseModel):
+    """느린 쿼리 목록 응답 모델"""
+    enabled: bool
+    threshold_seconds: float
+    plan_sample_rate: float
+    total: int
+    list: List[SlowQueryItem]
+    recent: List[Dict[str, Any]]
 
 
 class ErrorCodeStatsItem(BaseModel):
@@ -126,6 +281,7 @@ class PMHistoryItem(BaseModel):
 class PMHistoryResponse(BaseModel):
     """PM 이력 응답 모델"""
     list: List[PMHistoryItem]
+    next_cursor: Optional[str] = None  # 다음 페이지 요청 시 cursor로 전달 (마지막 페이지면 null)
 
 
 class PMHistoryRequest(BaseModel):
@@ -136,6 +292,7 @@ class PMHistoryRequest(BaseModel):
     eqp_id: Optional[str] = None
     operator: Optional[str] = None
     limit: Optional[int] = Field(default=10, ge=1, le=1000)
+    cursor: Optional[str] = None  # 이전 응답의 next_cursor
 
 
 class SearchItem(BaseModel):
@@ -154,6 +311,8 @@ class SearchItem(BaseModel):
 class SearchResponse(BaseModel):
     """상세 내역 검색 응답 모델"""
     list: List[SearchItem]
+    next_cursor: Optional[str] = None  # 다음 페이지 요청 시 cursor로 전달 (마지막 페이지면 null)
+    truncated: bool = False  # 키워드 검색에서 후보 최대 건수까지만 확인하여 일치 결과가 더 있을 수 있음
 
 
 class SearchRequest(BaseModel):
@@ -164,7 +323,31 @@ class SearchRequest(BaseModel):
     eqp_id: Optional[str] = None
     operator: Optional[str] = None
     status_id: Optional[int] = None
+    keyword: Optional[str] = None  # 조치 내용/추정 원인 키워드 (지정 시 관련도 순 정렬)
     limit: Optional[int] = Field(default=20, ge=1, le=1000)
+    cursor: Optional[str] = None  # 이전 응답의 next_cursor
+
+
+class TermSearchItem(BaseModel):
+    """용어 사전 조회 아이템 모델"""
+    term_id: str
+    term_en: Optional[str] = None  # 원본 행에 영문 용어가 없으면 null (한글 발음/키워드로만 검색됨)
+    term_kor_reading: Optional[str] = None
+    meaning_short: Optional[str] = None
+    match_type: str  # exact / prefix / keyword / fuzzy
+    score: float
+
+
+class TermSearchResponse(BaseModel):
+    """용어 사전 조회 응답 모델"""
+    list: List[TermSearchItem]
+
+
+class TermSearchRequest(BaseModel):
+    """용어 사전 조회 요청 모델"""
+    query: str = Field(..., min_length=1, max_length=200)  # 영문 용어, 한글 발음 또는 앞부분
+    limit: Optional[int] = Field(default=10, ge=1, le=100)
+    fuzzy: bool = True  # 오타 허용 일치 사용 여부
 
 
 # ============================================================================
@@ -186,19 +369,215 @@ def clean_request_value(value: Optional[str]) -> Optional[str]:
     return str_val
 
 
-def get_sql_template(filename: str) -> str:
-    """SQL 템플릿 파일 읽기"""
-    template_path = Path(__file__).parent / "sql_templates" / filename
-    sql_content = read_sql_file(template_path)
-    if not sql_content:
-        logger.error(f"SQL 템플릿 파일을 읽을 수 없습니다: {template_path}")
-        raise HTTPException(status_code=500, detail=f"SQL 템플릿 파일을 읽을 수 없습니다: {filename}")
-    return sql_content.strip()
+def _encode_token(value: Any) -> str:
+    """JSON 값을 URL-safe base64 불투명 토큰으로 인코딩"""
+    raw = json.dumps(value, ensure_ascii=False, separators=(',', ':'))
+    return base64.urlsafe_b64encode(raw.encode('utf-8')).decode('ascii').rstrip('=')
+
+
+def _decode_token(token: str) -> Any:
+    """_encode_token 토큰 디코딩 (형식 오류 시 400)"""
+    try:
+        return json.loads(base64.urlsafe_b64decode(token + '=' * (-len(token) % 4)))
+    except (ValueError, TypeError):
+        raise HTTPException(status_code=400, detail="유효하지 않은 cursor입니다.")
+
+
+def encode_cursor(cursor_time: Optional[str], informnote_id: str) -> str:
+    """페이지 마지막 행의 (down_start_time, informnote_id)를 불투명 cursor 토큰으로 인코딩"""
+    return _encode_token([cursor_time, informnote_id])
 
 
+def decode_cursor(token: Optional[str]) -> Tuple[Optional[str], Optional[str]]:
+    """cursor 토큰을 (cursor_time, cursor_id) 바인드 값으로 디코딩 (없으면 첫 페이지)"""
+    token = clean_request_value(token)
+    if token is None:
+        return None, None
+    value = _decode_token(token)
+    if not (isinstance(value, list) and len(value) == 2 and isinstance(value[1], str)
+            and (value[0] is None or isinstance(value[0], str))):
+        raise HTTPException(status_code=400, detail="유효하지 않은 cursor입니다.")
+    return value[0], value[1]
+
+
+def encode_rank_cursor(offset: int) -> str:
+    """키워드 검색 순위 목록에서 다음 페이지 시작 위치를 cursor 토큰으로 인코딩"""
+    return _encode_token({"rank": offset})
+
+
+def decode_rank_cursor(token: Optional[str]) -> int:
+    """키워드 검색 cursor 토큰을 순위 목록 시작 위치로 디코딩 (없으면 0)"""
+    token = clean_request_value(token)
+    if token is None:
+        return 0
+    value = _decode_token(token)
+    if not (isinstance(value, dict) and isinstance(value.get("rank"), int) and value["rank"] >= 0):
+        raise HTTPException(status_code=400, detail="유효하지 않은 cursor입니다.")
+    return value["rank"]
+
+
+def split_page(rows: List[Any], limit: int, id_index: int, time_index: int) -> Tuple[List[Any], Optional[str]]:
+    """limit + 1건 조회 결과를 현재 페이지와 next_cursor로 분리"""
+    if len(rows) <= limit:
+        return rows, None
+    rows = rows[:limit]
+    last = rows[-1]
+    return rows, encode_cursor(last[time_index], last[id_index])
+
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+
+def wants_ndjson(http_request: Request, stream: bool) -> bool:
+    """스트리밍(NDJSON) 응답 요청 여부 (?stream=true 또는 Accept: application/x-ndjson)"""
+    return stream or NDJSON_MEDIA_TYPE in http_request.headers.get("accept", "")
+
+
+def error_code_stats_row_to_dict(row) -> Dict[str, Any]:
+    """error_code_stats SQL 결과 행 -> ErrorCodeStatsItem 필드 dict"""
+    return {
+        "period": row[0],
+        "process_id": row[1],
+        "process_name": row[2],
+        "model_id": row[3],
+        "model_name": row[4],
+        "eqp_id": row[5],
+        "eqp_name": row[6],
+        "error_code": row[7],
+        "error_des": row[8],
+        "event_cnt": int(row[9]),
+        "total_down_time_minutes": float(row[10]) if row[10] is not None else None,
+    }
+
+
+def pm_history_row_to_dict(row) -> Dict[str, Any]:
+    """pm_history SQL 결과 행 -> PMHistoryItem 필드 dict"""
+    return {
+        "down_date": row[0],
+        "down_type": row[1] or "SCHEDULED",
+        "down_time_minutes": float(row[2]) if row[2] is not None else 0.0,
+        "operator": row[3],
+    }
+
+
+def search_row_to_dict(row) -> Dict[str, Any]:
+    """search_inform_notes SQL 결과 행 -> SearchItem 필드 dict"""
+    return {
+        "informnote_id": row[0],
+        "down_start_time": row[1],
+        "process_name": row[2],
+        "eqp_name": row[3],
+        "error_code": row[4],
+        "error_desc": row[5],
+        "act_content": row[6],
+        "operator": row[7],
+        "status": row[9] or ("COMPLETED" if row[8] == 1 else "IN_PROGRESS" if row[8] == 0 else "UNKNOWN"),
+    }
+
+
+RESPONSE_MODE_DB_JSON = "db_json"
+
+
+def build_response(payload):
+    """목록 응답 생성
+    
+    - bytes: DB JSON 생성 모드 결과로 이미 완성된 JSON 문서이므로 그대로 반환
+    - dict: FAST_JSON_RESPONSE가 켜져 있으면 Pydantic 모델 생성/검증 없이 바로 인코딩하고,
+      꺼져 있으면 그대로 반환하여 response_model 검증·직렬화를 거침 (출력 형식은 동일)
+    """
+    if isinstance(payload, bytes):
+        return Response(content=payload, media_type="application/json")
+    if settings.FAST_JSON_RESPONSE:
+        with timed_phase('serialize'):
+            return FastJSONResponse(payload)
+    return payload
+
+
+async def stream_error_code_stats(sql: str, params: Dict[str, Any]):
+    """error_code_stats 결과를 fetchmany 배치 단위로 읽어 NDJSON 청크로 반환
+
+    연결은 스트림이 끝나거나 클라이언트 연결이 끊길 때까지 유지되며,
+    메모리에는 한 배치만 올라갑니다.
+    클라이언트 연결이 끊겨 취소된 상태에서도 연결 반환은 취소되지 않도록 보호합니다.
+    """
+    batch_size = settings.STREAM_FETCH_SIZE
+    connection = AsyncExitStack()
+    conn = await connection.enter_async_context(db.acquire())
+    error = None
+    try:
+        cursor = conn.cursor()
+        cursor.arraysize = batch_size
+        try:
+            await cursor.execute(sql, params)
+            total = 0
+            while True:
+                rows = await cursor.fetchmany(batch_size)
+                if not rows:
+                    break
+                total += len(rows)
+                yield b''.join(dumps_line(error_code_stats_row_to_dict(row)) for row in rows)
+            logger.info(f"[Error Code 통계] 스트리밍 완료: {total}건")
+        finally:
+            cursor.close()
+    except BaseException as e:
+        error = e
+        raise
+    finally:
+        # 오류/취소 여부를 acquire()에 그대로 전달 (커밋 또는 롤백 후 풀에 반환)
+        with anyio.CancelScope(shield=True):
+            await connection.__aexit__(type(error) if error else None, error, error.__traceback__ if error else None)
+
+
+async def fetch_db_json_page(sql: str, params: Dict[str, Any], limit: int,
+                             extra_fields: Optional[Dict[str, Any]] = None) -> bytes:
+    """DB JSON 생성 모드 조회: DB가 만든 list 배열 JSON에 next_cursor(+ 응답 모델의 나머지 필드)만 붙여 응답 본문 생성 (행 단위 처리 없음)"""
+    async with db.acquire() as conn:
+        cursor = conn.cursor()
+        cursor.outputtypehandler = fetch_lobs_as_text
+        await cursor.execute(sql, {**params, "page_size": limit})
+        list_json, cursor_time, cursor_id, fetched_count = await cursor.fetchone()
+        cursor.close()
+    
+    next_cursor = encode_cursor(cursor_time, cursor_id) if fetched_count > limit else None
+    return b''.join((
+        b'{"list":', (list_json or '[]').encode('utf-8'),
+        b',"next_cursor":', dumps(next_cursor),
+        *(b',' + dumps(name) + b':' + dumps(value) for name, value in (extra_fields or {}).items()),
+        b'}'
+    ))
+
+
+def ensure_database_available():
+    """캐시된 헬스 상태로 DB 가용성 확인 (서킷 open 시 즉시 503)"""
+    if not db.is_available():
+        raise HTTPException(status_code=503, detail="데이터베이스에 연결할 수 없습니다.")
 
 
-def lookup_id_by_id_or_name(table: str, id_col: str, name_col: str, id_value: Optional[str] = None, name_value: Optional[str] = None) -> Optional[str]:
+def error_stats_rollup_ready() -> bool:
+    """일별 집계 테이블 사용 가능 여부 (설정 활성 + 집계 버전이 INFORM_NOTE 버전과 일치)"""
+    if not settings.ERROR_STATS_USE_ROLLUP:
+        return False
+    versions = db.data_versions.versions
+    rollup_version = versions.get(INFORM_NOTE_DAILY_DATASET)
+    return rollup_version is not None and rollup_version == versions.get(INFORM_NOTE_DATASET)
+
+
+def build_list_query(filename: str, params: Dict[str, Any],
+                     in_lists: Optional[Dict[str, List[Any]]] = None) -> Tuple[str, Dict[str, Any]]:
+    """목록 조회 SQL/바인드 조립 (요청에 주어진 필터 조건만 포함)
+    
+    작업자 조건은 작업자 인덱스로 부분 일치 후보 이름을 찾으면 IN 목록 조건으로 바꿉니다.
+    인덱스에 일치하는 작업자가 없으면 마지막 갱신 이후 추가된 작업자일 수 있으므로 LIKE 조건으로 조회합니다.
+    """
+    in_lists = dict(in_lists or {})
+    operator = params.get("operator")
+    names = operator_index.match(operator) if operator else None
+    if names:
+        in_lists["operator_names"] = names
+    return query_builder.build(filename, params, in_lists=in_lists)
+
+
+async def lookup_id_by_id_or_name(table: str, id_col: str, name_col: str, id_value: Optional[str] = None, name_value: Optional[str] = None) -> Optional[str]:
     """테이블에서 ID 또는 NAME으로 실제 ID 조회 (OR 조건)"""
     id_val = clean_request_value(id_value)
     name_val = clean_request_value(name_value)
@@ -208,59 +587,28 @@ def lookup_id_by_id_or_name(table: str, id_col: str, name_col: str, id_value: Op
         return None
     
     # SQL Injection 방지: 테이블/컬럼명 화이트리스트 검증
-    ALLOWED_TABLES = {'PROCESS', 'MODEL', 'EQUIPMENT'}
-    ALLOWED_COLUMNS = {
-        'PROCESS': {'PROCESS_ID', 'PROCESS_NAME'},
-        'MODEL': {'MODEL_ID', 'MODEL_NAME'},
-        'EQUIPMENT': {'EQP_ID', 'EQP_NAME'}
-    }
-    
     table_upper = table.upper()
-    id_col_upper = id_col.upper()
-    name_col_upper = name_col.upper()
-    
-    if table_upper not in ALLOWED_TABLES:
+    if table_upper not in LOOKUP_TABLES:
         logger.error(f"허용되지 않은 테이블: {table}")
         return None
     
-    if id_col_upper not in ALLOWED_COLUMNS[table_upper]:
-        logger.error(f"허용되지 않은 컬럼: {id_col} (테이블: {table})")
+    if (id_col.upper(), name_col.upper()) != LOOKUP_TABLES[table_upper]:
+        logger.error(f"허용되지 않은 컬럼: {id_col}, {name_col} (테이블: {table})")
         return None
     
-    if name_col_upper not in ALLOWED_COLUMNS[table_upper]:
-        logger.error(f"허용되지 않은 컬럼: {name_col} (테이블: {table})")
-        return None
+    # 인메모리 레퍼런스 인덱스가 준비되어 있으면 DB 조회 없이 해결
+    if reference_index.ready:
+        return reference_index.resolve(table_upper, id_val, name_val)
     
     try:
-        # SQL 템플릿 파일 읽기
-        sql_template = get_sql_template("lookup_id.sql")
+        # 사전 렌더링된 SQL 변형 선택 (바인드 순서: ID, NAME)
+        query = sql_registry.lookup_id(table_upper, bool(id_val), bool(name_val))
+        params = [val.strip() for val in (id_val, name_val) if val]
         
-        # WHERE 조건 구성
-        conditions = []
-        params = []
-        param_index = 1
-        
-        if id_val:
-            conditions.append(f"UPPER(TRIM({id_col_upper})) = UPPER(:{param_index})")
-            params.append(id_val.strip())
-            param_index += 1
-        
-        if name_val:
-            conditions.append(f"UPPER(TRIM({name_col_upper})) = UPPER(:{param_index})")
-            params.append(name_val.strip())
-        
-        # SQL 템플릿에 동적 값 주입 (화이트리스트 검증 완료)
-        query = sql_template.format(
-            id_col=id_col_upper,
-            name_col=name_col_upper,
-            table=table_upper,
-            where_conditions=' OR '.join(conditions)
-        )
-        
-        with db.get_connection() as conn:
+        async with db.acquire() as conn:
             cursor = conn.cursor()
-            cursor.execute(query, params)
-            row = cursor.fetchone()
+            await cursor.execute(query, params)
+            row = await cursor.fetchone()
             cursor.close()
             return row[0] if row else None
     except Exception as e:
@@ -287,12 +635,12 @@ def extract_id_from_request(request: IdLookupRequest, entity_type: str, info_obj
     return id_val, name_val
 
 
-def resolve_entity_id(table: str, id_col: str, name_col: str, entity_type: str, id_val: Optional[str], name_val: Optional[str]) -> Optional[str]:
+async def resolve_entity_id(table: str, id_col: str, name_col: str, entity_type: str, id_val: Optional[str], name_val: Optional[str]) -> Optional[str]:
     """엔티티 ID 해결 및 로깅"""
     if not id_val and not name_val:
         return None
     
-    final_id = lookup_id_by_id_or_name(table, id_col, name_col, id_val, name_val)
+    final_id = await lookup_id_by_id_or_name(table, id_col, name_col, id_val, name_val)
     if final_id:
         logger.info(f"[ID 조회] {entity_type} (id={id_val}, name={name_val}) -> ID '{final_id}'")
     else:
@@ -301,6 +649,119 @@ def resolve_entity_id(table: str, id_col: str, name_col: str, entity_type: str,
     return final_id
 
 
+# 엔티티 유형별 조회 설정: (응답 필드, 단순 형식 필드 접두사, Dify 형식 객체 속성, 테이블)
+ENTITY_LOOKUPS = [
+    ('process_id', 'process', 'process', 'PROCESS'),
+    ('model_id', 'model', 'model', 'MODEL'),
+    ('eqp_id', 'eqp', 'equipment', 'EQUIPMENT'),
+]
+
+
+async def fetch_lookup_maps(table: str, values: List[str]) -> Tuple[Dict[str, str], Dict[str, str]]:
+    """한 엔티티 유형의 여러 ID/NAME 값을 set 기반 쿼리 한 번으로 조회하여 해시 맵 생성"""
+    keys = sorted({value.strip().upper() for value in values})
+    max_bucket = LOOKUP_BATCH_BUCKETS[-1]
+    rows = []
+    async with db.acquire() as conn:
+        cursor = conn.cursor()
+        for start in range(0, len(keys), max_bucket):
+            chunk = keys[start:start + max_bucket]
+            sql, bucket_size = sql_registry.lookup_id_batch(table, len(chunk))
+            binds = {f"k{i}": (chunk[i] if i < len(chunk) else None) for i in range(bucket_size)}
+            await cursor.execute(sql, binds)
+            rows.extend(await cursor.fetchall())
+        cursor.close()
+    return build_lookup_maps(rows)
+
+
+async def ensure_reference_index():
+    """계층 해석에 필요한 레퍼런스 인덱스 준비 (미적재 시 1회 쿼리로 즉시 적재)"""
+    if reference_index.ready:
+        return
+    ensure_database_available()
+    try:
+        await reference_index.refresh()
+    except Exception as e:
+        logger.error(f"[ID 조회] 레퍼런스 인덱스 적재 실패: {e}")
+        raise HTTPException(status_code=503, detail="레퍼런스 데이터를 적재할 수 없습니다.")
+
+
+async def ensure_text_index():
+    """키워드 검색에 필요한 조치 내용 검색 인덱스 준비 (미적재 시 즉시 구성)"""
+    if text_index.ready:
+        return
+    ensure_database_available()
+    try:
+        await text_index.refresh()
+    except Exception as e:
+        logger.error(f"[상세 검색] 조치 내용 검색 인덱스 구성 실패: {e}")
+        raise HTTPException(status_code=503, detail="키워드 검색 인덱스를 준비할 수 없습니다.")
+
+
+async def ensure_term_index():
+    """용어 조회에 필요한 용어 사전 인덱스 준비 (미적재 시 즉시 적재)"""
+    if term_index.ready:
+        return
+    ensure_database_available()
+    try:
+        await term_index.refresh()
+    except Exception as e:
+        logger.error(f"[용어 조회] 용어 사전 인덱스 적재 실패: {e}")
+        raise HTTPException(status_code=503, detail="용어 사전을 적재할 수 없습니다.")
+
+
+async def search_inform_notes_by_keyword(keyword: str, filters: Dict[str, Any], limit: int, offset: int) -> Dict[str, Any]:
+    """키워드 검색: 인메모리 역색인의 관련도 순 후보 ID에 DB에서 필터를 적용
+    
+    후보를 관련도 순으로 ID_BUCKETS 최대 크기씩 나누어 조회하고, 현재 페이지(+ 다음 페이지 여부 확인 1건)를
+    채우면 중단합니다. 필터가 없으면 첫 배치로 끝나므로 테이블 크기와 무관하게 일정합니다.
+    관련도 상위 TEXT_SEARCH_MAX_CANDIDATES건을 다 확인해도 페이지를 채우지 못했는데 그 밖에 후보가
+    남아 있으면 truncated=True로 응답합니다.
+    """
+    max_candidates = settings.TEXT_SEARCH_MAX_CANDIDATES
+    ranked = text_index.search(keyword, max_candidates + 1)
+    more_candidates = len(ranked) > max_candidates
+    ranked = ranked[:max_candidates]
+    if not ranked:
+        return {"list": [], "next_cursor": None, "truncated": False}
+    
+    needed = offset + limit + 1
+    batch_size = ID_BUCKETS[-1]
+    matched = []
+    async with db.acquire() as conn:
+        cursor = conn.cursor()
+        for start in range(0, len(ranked), batch_size):
+            batch = [doc_id for doc_id, _ in ranked[start:start + batch_size]]
+            sql, binds = build_list_query("search_inform_notes_keyword.sql", filters, in_lists={"ids": batch})
+            await cursor.execute(sql, binds)
+            rows_by_id = {row[0]: row for row in await cursor.fetchall()}
+            # 필터를 통과한 후보를 관련도 순으로 누적
+            matched.extend(rows_by_id[doc_id] for doc_id in batch if doc_id in rows_by_id)
+            if len(matched) >= needed:
+                break
+        cursor.close()
+    
+    page = matched[offset:offset + limit]
+    next_offset = offset + limit
+    with timed_phase('map'):
+        result_list = [search_row_to_dict(row) for row in page]
+    return {
+        "list": result_list,
+        "next_cursor": encode_rank_cursor(next_offset) if next_offset < len(matched) else None,
+        "truncated": more_candidates and len(matched) < needed,
+    }
+
+
+def apply_hierarchy(result: IdLookupResponse):
+    """조회 결과에 계층(장비 -> 모델 -> 공정) 기반 상위 ID 채우기 및 불일치 검사 적용"""
+    result.process_id, result.model_id, result.eqp_id, conflicts = reference_index.fill_hierarchy(
+        result.process_id, result.model_id, result.eqp_id
+    )
+    result.conflicts = conflicts
+    for conflict in conflicts:
+        logger.warning(f"[ID 조회] 계층 불일치: {conflict}")
+
+
 # ============================================================================
 # 데이터베이스 연결 초기화
 # ============================================================================
@@ -308,18 +769,42 @@ def resolve_entity_id(table: str, id_col: str, name_col: str, entity_type: str,
 @app.on_event("startup")
 async def startup_event():
     """애플리케이션 시작 시 실행"""
+    # SQL 템플릿 로드 및 검증 (실패 시 서버 시작 중단)
+    sql_registry.load()
+    if settings.WORKLOAD_LOG_PATH:
+        query_builder.record_workload(settings.WORKLOAD_LOG_PATH, settings.WORKLOAD_LOG_SAMPLE_RATE)
+    
     try:
-        db.create_pool()
-        if db.test_connection():
+        await db.create_async_pool()
+        if await db.health_monitor.probe():
             logger.info("데이터베이스 연결 성공")
+            await db.data_versions.poll(notify=False)
+            await reference_index.refresh()
+            await text_index.refresh()
+            await operator_index.refresh()
+            await term_index.refresh()
     except Exception as e:
         logger.error(f"시작 시 오류 발생: {e}")
+    db.health_monitor.start()
+    db.data_versions.start()
+    reference_index.start()
+    text_index.start()
+    operator_index.start()
+    term_index.start()
+    dify_client.start()
 
 
 @app.on_event("shutdown")
 async def shutdown_event():
     """애플리케이션 종료 시 실행"""
-    db.close_pool()
+    await dify_client.close()
+    await term_index.stop()
+    await operator_index.stop()
+    await text_index.stop()
+    await reference_index.stop()
+    await db.data_versions.stop()
+    await db.health_monitor.stop()
+    await db.close_async_pool()
     logger.info("애플리케이션 종료")
 
 
@@ -338,11 +823,113 @@ async def root():
 
 @app.get("/health", response_model=HealthResponse, tags=["기본"])
 async def health_check():
-    """헬스 체크 엔드포인트"""
-    db_connected = db.test_connection()
+    """헬스 체크 엔드포인트 (백그라운드 모니터의 캐시된 상태 반환)"""
+    monitor = db.health_monitor
+    db_connected = monitor.connected
     return HealthResponse(
         status="healthy" if db_connected else "unhealthy",
         database_connected=db_connected,
+        circuit_state=db.circuit_breaker.state,
+        last_checked_at=monitor.last_checked_at.isoformat(timespec='seconds') if monitor.last_checked_at else None,
+    )
+
+
+@app.get("/metrics", tags=["모니터링"])
+async def get_prometheus_metrics():
+    """
+    Prometheus 텍스트 형식 메트릭 엔드포인트
+    
+    - api_request_duration_seconds / api_requests_total: 엔드포인트별 요청 처리 시간, 상태 코드별 응답 수
+    - api_request_phase_seconds: 단계별 시간 (acquire/execute/fetch/map/serialize)
+    - api_request_rows: 요청당 DB 조회 행 수
+    - db_pool_* / response_cache_* / request_coalescing_* / dify_answer_cache_*: 연결 풀, 응답 캐시, 동시 요청 병합, Dify 응답 캐시 현황
+    """
+    out = PrometheusText()
+    request_metrics.write(out)
+    
+    pool = db.pool_stats()
+    out.gauge("db_pool_connections", "비동기 연결 풀 연결 수", (
+        ({"state": "opened"}, pool['opened']),
+        ({"state": "busy"}, pool['busy']),
+        ({"state": "waiting"}, pool['waiting']),
+    ))
+    out.counter("db_pool_acquire_timeouts_total", "연결 풀 acquire 대기 시간 초과 수", (({}, pool['acquire_timeouts']),))
+    out.histogram("db_pool_acquire_seconds", "연결 풀 acquire 대기 시간", (({}, db.acquire_latency),))
+    
+    cache = response_cache.stats()
+    out.gauge("response_cache_entries", "응답 캐시 항목 수", (({}, cache['entries']),))
+    out.counter("response_cache_lookups_total", "응답 캐시 조회 수", (
+        ({"result": "hit"}, cache['hits']),
+        ({"result": "miss"}, cache['misses']),
+    ))
+    out.counter("response_cache_evictions_total", "최대 항목 수 초과로 제거된 캐시 항목 수", (({}, cache['evictions']),))
+    out.counter("request_coalescing_total", "캐시에 없는 요청의 DB 조회 병합 결과", (
+        ({"result": "executed"}, request_coalescer.executions),
+        ({"result": "coalesced"}, request_coalescer.coalesced),
+    ))
+    out.gauge("request_coalescing_in_flight", "진행 중인 병합 대상 DB 조회 수", (({}, len(request_coalescer)),))
+    
+    dify_cache = dify_answer_cache.stats()
+    out.gauge("dify_answer_cache_entries", "Dify 응답 캐시 항목 수", (({}, dify_cache['entries']),))
+    out.counter("dify_answer_cache_lookups_total", "Dify 응답 캐시 조회 수", (
+        ({"result": "hit"}, dify_cache['hits']),
+        ({"result": "miss"}, dify_cache['misses']),
+    ))
+    return Response(content=out.render(), media_type=PrometheusText.content_type)
+
+
+@app.get("/metrics/pool", response_model=PoolStatsResponse, tags=["모니터링"])
+async def get_pool_metrics():
+    """
+    연결 풀 통계 엔드포인트
+    
+    - opened/busy: 열린 연결 수 / 사용 중인 연결 수
+    - waiting: 현재 acquire 대기 중인 요청 수
+    - acquire_latency_seconds: acquire 대기 시간 누적 히스토그램 (le 버킷별 누적 건수)
+    """
+    return PoolStatsResponse(**db.pool_stats())
+
+
+@app.get("/metrics/cache", response_model=CacheStatsResponse, tags=["모니터링"])
+async def get_cache_metrics():
+    """
+    응답 캐시 통계 엔드포인트
+    
+    - hits/misses/hit_ratio: 통계·검색 API 캐시 적중 현황
+    - evictions: 최대 항목 수 초과로 제거된 항목 수
+    - invalidations: 데이터 적재 완료로 전체 무효화된 횟수
+    - coalescing: 캐시에 없는 같은 요청의 동시 조회 병합 (executions: 실행한 DB 조회 수, coalesced: 진행 중인 조회 결과를 공유받은 요청 수)
+    """
+    return CacheStatsResponse(
+        enabled=settings.RESPONSE_CACHE_ENABLED, coalescing=request_coalescer.stats(), **response_cache.stats()
+    )
+
+
+SLOW_QUERY_ORDERS = ('total_ms', 'max_ms', 'count')
+
+
+@app.get("/debug/slow-queries", response_model=SlowQueryResponse, tags=["모니터링"])
+async def get_slow_queries(limit: int = 20, order_by: str = "total_ms"):
+    """
+    느린 쿼리 목록 엔드포인트 (서버 시작 후 누적, 프로세스 메모리 기준)
+    
+    - list: 템플릿(조립 SQL은 필터 조합)별 누적 상위 limit개, order_by(total_ms/max_ms/count) 내림차순
+    - recent: 최근 기록 limit개 (바인드 값, execute/fetch 시간, 행 수, 오류, 샘플링된 실행 계획)
+    - 전체 기록은 SLOW_QUERY_LOG_PATH JSONL 파일 참고
+    - 인증이 없으므로 SLOW_QUERY_DEBUG_ENDPOINT=true일 때만 노출 (기본 404)
+    """
+    if not settings.SLOW_QUERY_DEBUG_ENDPOINT:
+        raise HTTPException(status_code=404, detail="Not Found")
+    if order_by not in SLOW_QUERY_ORDERS:
+        raise HTTPException(status_code=400, detail=f"order_by는 {', '.join(SLOW_QUERY_ORDERS)} 중 하나여야 합니다.")
+    limit = max(1, min(limit, 100))
+    return SlowQueryResponse(
+        enabled=slow_query_log.enabled,
+        threshold_seconds=slow_query_log.threshold,
+        plan_sample_rate=slow_query_log.plan_sample_rate,
+        total=slow_query_log.total,
+        list=slow_query_log.top(limit, order_by),
+        recent=slow_query_log.recent(limit),
     )
 
 
@@ -356,21 +943,25 @@ async def lookup_ids(request: IdLookupRequest):
     
     - ID 또는 NAME을 받으면 DB에서 WHERE OR 조건으로 조회하여 실제 ID 반환
     - 조회가 안 되면 null 반환
+    - resolve_hierarchy=true: 장비 -> 모델 -> 공정 계층으로 비어 있는 상위 ID를 채우고,
+      요청한 조합이 계층과 맞지 않으면 conflicts에 내역 반환 (예: 장비 이름만으로 model_id, process_id까지 조회)
     """
     request_dict = request.model_dump(exclude_none=True)
     logger.info(f"[ID 조회] 요청 수신 - 전체 요청: {json.dumps(request_dict, ensure_ascii=False)}")
     
-    # Process ID 처리
-    process_id, process_name = extract_id_from_request(request, 'process', request.process)
-    final_process_id = resolve_entity_id("PROCESS", "PROCESS_ID", "PROCESS_NAME", "process", process_id, process_name)
+    if request.resolve_hierarchy:
+        await ensure_reference_index()
     
-    # Model ID 처리
+    process_id, process_name = extract_id_from_request(request, 'process', request.process)
     model_id, model_name = extract_id_from_request(request, 'model', request.model)
-    final_model_id = resolve_entity_id("MODEL", "MODEL_ID", "MODEL_NAME", "model", model_id, model_name)
-    
-    # Equipment ID 처리
     eqp_id, eqp_name = extract_id_from_request(request, 'eqp', request.equipment)
-    final_eqp_id = resolve_entity_id("EQUIPMENT", "EQP_ID", "EQP_NAME", "equipment", eqp_id, eqp_name)
+    
+    # Process / Model / Equipment ID 동시 조회 (서로 독립적인 쿼리)
+    final_process_id, final_model_id, final_eqp_id = await asyncio.gather(
+        resolve_entity_id("PROCESS", "PROCESS_ID", "PROCESS_NAME", "process", process_id, process_name),
+        resolve_entity_id("MODEL", "MODEL_ID", "MODEL_NAME", "model", model_id, model_name),
+        resolve_entity_id("EQUIPMENT", "EQP_ID", "EQP_NAME", "equipment", eqp_id, eqp_name),
+    )
     
     result = IdLookupResponse(
         process_id=final_process_id,
@@ -378,22 +969,104 @@ async def lookup_ids(request: IdLookupRequest):
         eqp_id=final_eqp_id
     )
     
+    if request.resolve_hierarchy:
+        apply_hierarchy(result)
+    
     logger.info(f"[ID 조회] 최종 결과: {result.model_dump()}")
     return result
 
 
+@app.post("/lookup/ids/batch", response_model=IdLookupBatchResponse, tags=["조회"])
+async def lookup_ids_batch(request: IdLookupBatchRequest):
+    """
+    ID 일괄 조회 API
+    
+    /lookup/ids 요청 형식의 items 배열을 받아 한 번에 ID를 조회합니다.
+    
+    - 인메모리 레퍼런스 인덱스가 준비되어 있으면 DB 조회 없이 해결
+    - 아니면 엔티티 유형별로 set 기반 쿼리 1회씩 실행
+    - 결과는 요청 순서대로 반환하며, 찾지 못한 엔티티는 missing에 표시
+    """
+    # 아이템별 (ID, NAME) 추출
+    extracted = [
+        {
+            field: extract_id_from_request(item, prefix, getattr(item, attr))
+            for field, prefix, attr, _ in ENTITY_LOOKUPS
+        }
+        for item in request.items
+    ]
+    logger.info(f"[ID 일괄 조회] 요청 수신 - {len(extracted)}건")
+    
+    hierarchy_requested = any(item.resolve_hierarchy for item in request.items)
+    if hierarchy_requested:
+        await ensure_reference_index()
+    
+    if reference_index.ready:
+        resolvers = {
+            field: (lambda id_val, name_val, table=table: reference_index.resolve(table, id_val, name_val))
+            for field, _, _, table in ENTITY_LOOKUPS
+        }
+    else:
+        ensure_database_available()
+        # 엔티티 유형별로 조회할 값 수집 후 유형당 1회 조회 (유형 간 동시 실행)
+        values_by_field = {
+            field: [value for values in extracted for value in values[field] if value]
+            for field, _, _, _ in ENTITY_LOOKUPS
+        }
+        lookup_fields = [field for field, _, _, _ in ENTITY_LOOKUPS if values_by_field[field]]
+        tables = {field: table for field, _, _, table in ENTITY_LOOKUPS}
+        try:
+            maps = await asyncio.gather(*(
+                fetch_lookup_maps(tables[field], values_by_field[field]) for field in lookup_fields
+            ))
+        except DatabaseUnavailableError as e:
+            raise HTTPException(status_code=503, detail=str(e))
+        except Exception as e:
+            logger.error(f"[ID 일괄 조회] 조회 중 오류: {e}", exc_info=True)
+            raise HTTPException(status_code=500, detail=f"ID 일괄 조회 중 오류가 발생했습니다: {str(e)}")
+        
+        resolved_maps = dict(zip(lookup_fields, maps))
+        resolvers = {
+            field: (lambda id_val, name_val, field=field: resolve_from_maps(*resolved_maps[field], id_val, name_val))
+            for field in lookup_fields
+        }
+    
+    result_list = []
+    for request_item, values in zip(request.items, extracted):
+        item = IdLookupBatchItem()
+        for field, prefix, _, _ in ENTITY_LOOKUPS:
+            id_val, name_val = values[field]
+            if not id_val and not name_val:
+                continue
+            final_id = resolvers[field](id_val, name_val)
+            if final_id:
+                setattr(item, field, final_id)
+            else:
+                item.missing.append(prefix)
+        if request_item.resolve_hierarchy:
+            apply_hierarchy(item)
+        result_list.append(item)
+    
+    missing_count = sum(1 for item in result_list if item.missing)
+    logger.info(f"[ID 일괄 조회] 조회 결과: {len(result_list)}건 (미해결 포함 {missing_count}건)")
+    return IdLookupBatchResponse(list=result_list)
+
+
 @app.post(
     "/api/v1/informnote/stats/error-code",
     response_model=ErrorCodeStatsResponse,
     tags=["통계"]
 )
-async def get_error_code_stats(request: ErrorCodeStatsRequest):
+async def get_error_code_stats(request: ErrorCodeStatsRequest, http_request: Request, stream: bool = False):
     """
     공정/장비 Error Code별 건수·Down Time 집계 엔드포인트
-    """
-    if not db.test_connection():
-        raise HTTPException(status_code=503, detail="데이터베이스에 연결할 수 없습니다.")
     
+    모든 필터(기간/공정/모델/장비/에러코드)가 일별 집계 테이블의 키이므로,
+    집계가 최신이면 INFORM_NOTE 대신 INFORM_NOTE_DAILY_STATS에서 합산합니다.
+    
+    - stream=true 또는 Accept: application/x-ndjson: 한 줄에 한 항목(ErrorCodeStatsItem)씩
+      NDJSON으로 스트리밍 (응답 캐시 미사용, 서버 메모리는 배치 크기만큼만 사용)
+    """
     # 요청 값 정리
     cleaned_process_id = clean_request_value(request.process_id)
     cleaned_model_id = clean_request_value(request.model_id)
@@ -402,87 +1075,100 @@ async def get_error_code_stats(request: ErrorCodeStatsRequest):
     
     logger.info(f"[Error Code 통계] 요청 수신 - process_id: {cleaned_process_id}, model_id: {cleaned_model_id}, eqp_id: {cleaned_eqp_id}, error_code: {cleaned_error_code}, group_by: {request.group_by}")
     
-    try:
-        # Period 처리
-        if request.group_by == 'month':
-            period_select = "TO_CHAR(n.down_start_time, 'YYYY-MM') AS period"
-            period_group = "TO_CHAR(n.down_start_time, 'YYYY-MM')"
-            period_order = "period ASC"
-        elif request.group_by == 'day':
-            period_select = "TO_CHAR(n.down_start_time, 'YYYY-MM-DD') AS period"
-            period_group = "TO_CHAR(n.down_start_time, 'YYYY-MM-DD')"
-            period_order = "period ASC"
-        else:
-            period_select = "NULL AS period"
-            period_group = ""
-            period_order = "n.process_id ASC"
-        
-        # GROUP BY 절 구성
-        group_cols = [
-            "n.process_id, p.process_name",
-            "n.model_id, m.model_name",
-            "n.eqp_id, e.eqp_name",
-            "n.error_code, ec.error_desc"
-        ]
-        if period_group:
-            group_cols.insert(0, period_group)
-        
-        # ORDER BY 절 구성
-        order_cols = [
-            period_order if period_group else "n.process_id ASC",
-            "n.process_id ASC",
-            "n.error_code ASC"
-        ]
-        
-        # SQL 템플릿 파일 읽기 및 동적 부분 치환
-        sql_template = get_sql_template("error_code_stats.sql")
-        sql = sql_template.format(
-            period_select=period_select,
-            group_by_clause=', '.join(group_cols),
-            order_by_clause=', '.join(order_cols)
-        )
+    group_by = normalize_group_by(request.group_by)
+    params = {
+        "start_date": format_date_for_db(request.start_date),
+        "end_date": format_date_for_db(request.end_date),
+        "process_id": cleaned_process_id,
+        "model_id": cleaned_model_id,
+        "eqp_id": cleaned_eqp_id,
+        "error_code": cleaned_error_code
+    }
+    if wants_ndjson(http_request, stream):
+        return await stream_error_code_stats_response(group_by, params)
+    
+    cache_key = make_cache_key(f"error_code_stats:{group_by}", params)
+    cached = response_cache.get(cache_key)
+    if cached is not None:
+        logger.info(f"[Error Code 통계] 캐시 적중")
+        return build_response(cached)
+    
+    ensure_database_available()
+    
+    async def query_payload():
+        # group_by(month/day/error_code)와 주어진 필터 조합으로 SQL 조립
+        use_rollup = error_stats_rollup_ready()
+        sql, binds = query_builder.build(error_code_stats_template(use_rollup), params, group_by=group_by)
         
-        with db.get_connection() as conn:
+        async with db.acquire() as conn:
             cursor = conn.cursor()
-            cursor.execute(sql, {
-                "start_date": format_date_for_db(request.start_date),
-                "end_date": format_date_for_db(request.end_date),
-                "process_id": cleaned_process_id,
-                "model_id": cleaned_model_id,
-                "eqp_id": cleaned_eqp_id,
-                "error_code": cleaned_error_code
-            })
+            await cursor.execute(sql, binds)
             
-            rows = cursor.fetchall()
+            rows = await cursor.fetchall()
             cursor.close()
-            
-            result_list = [
-                ErrorCodeStatsItem(
-                    period=row[0],
-                    process_id=row[1],
-                    process_name=row[2],
-                    model_id=row[3],
-                    model_name=row[4],
-                    eqp_id=row[5],
-                    eqp_name=row[6],
-                    error_code=row[7],
-                    error_des=row[8],
-                    event_cnt=row[9],
-                    total_down_time_minutes=float(row[10]) if row[10] is not None else None
-                )
-                for row in rows
-            ]
-            
-            logger.info(f"[Error Code 통계] 조회 결과: {len(result_list)}건")
-            return ErrorCodeStatsResponse(list=result_list)
+        
+        with timed_phase('map'):
+            result_list = [error_code_stats_row_to_dict(row) for row in rows]
+        
+        logger.info(f"[Error Code 통계] 조회 결과: {len(result_list)}건 ({'일별 집계' if use_rollup else '원본'} 기준)")
+        payload = {"list": result_list}
+        response_cache.set(cache_key, payload)
+        return payload
+    
+    try:
+        return build_response(await request_coalescer.do(cache_key, query_payload))
     
     except HTTPException:
         raise
+    except DatabaseUnavailableError as e:
+        raise HTTPException(status_code=503, detail=str(e))
     except Exception as e:
         logger.error(f"[Error Code 통계] 조회 중 오류: {e}", exc_info=True)
         raise HTTPException(status_code=500, detail=f"통계 조회 중 오류가 발생했습니다: {str(e)}")
 
 
+async def stream_error_code_stats_response(group_by: str, params: Dict[str, Any]) -> StreamingResponse:
+    """Error Code 통계 NDJSON 스트리밍 응답 생성
+    
+    첫 배치까지는 응답 시작 전에 읽어서 연결/SQL 오류를 503/500 상태 코드로 반환하고,
+    나머지 배치는 조회되는 대로 전송합니다.
+    """
+    ensure_database_available()
+    
+    use_rollup = error_stats_rollup_ready()
+    chunks = stream_error_code_stats(
+        *query_builder.build(error_code_stats_template(use_rollup), params, group_by=group_by)
+    )
+    try:
+        first_chunk = await chunks.__anext__()
+    except StopAsyncIteration:
+        first_chunk = None
+    except DatabaseUnavailableError as e:
+        raise HTTPException(status_code=503, detail=str(e))
+    except Exception as e:
+        logger.error(f"[Error Code 통계] 스트리밍 조회 중 오류: {e}", exc_info=True)
+        raise HTTPException(status_code=500, detail=f"통계 조회 중 오류가 발생했습니다: {str(e)}")
+    
+    async def body():
+        try:
+            if first_chunk is None:
+                return
+            yield first_chunk
+            async for chunk in chunks:
+                yield chunk
+        except Exception as e:
+            # 이미 응답이 시작되었으므로 마지막 줄에 오류를 알림
+            logger.error(f"[Error Code 통계] 스트리밍 중 오류: {e}", exc_info=True)
+            yield dumps_line({"error": f"통계 조회 중 오류가 발생했습니다: {str(e)}"})
+        finally:
+            # 클라이언트 연결이 끊겨 취소된 상태에서도 커서/연결을 끝까지 반환
+            with anyio.CancelScope(shield=True):
+                await chunks.aclose()
+    
+    logger.info(f"[Error Code 통계] NDJSON 스트리밍 시작 ({'일별 집계' if use_rollup else '원본'} 기준)")
+    return StreamingResponse(body(), media_type=NDJSON_MEDIA_TYPE)
+
+
 @app.post(
     "/api/v1/informnote/history/pm",
     response_model=PMHistoryResponse,
@@ -492,47 +1178,65 @@ async def get_pm_history(request: PMHistoryRequest):
     """
     PM(장비 점검) 이력 조회 엔드포인트 (down_type_id=0)
     """
-    if not db.test_connection():
-        raise HTTPException(status_code=503, detail="데이터베이스에 연결할 수 없습니다.")
-    
     # 요청 값 정리
     cleaned_process_id = clean_request_value(request.process_id)
     cleaned_eqp_id = clean_request_value(request.eqp_id)
     cleaned_operator = clean_request_value(request.operator)
     
-    logger.info(f"[PM 이력] 요청 수신 - process_id: {cleaned_process_id}, eqp_id: {cleaned_eqp_id}, operator: {cleaned_operator}, start_date: {request.start_date}, end_date: {request.end_date}, limit: {request.limit}")
+    logger.info(f"[PM 이력] 요청 수신 - process_id: {cleaned_process_id}, eqp_id: {cleaned_eqp_id}, operator: {cleaned_operator}, start_date: {request.start_date}, end_date: {request.end_date}, limit: {request.limit}, cursor: {request.cursor}")
     
-    # SQL 템플릿 파일 읽기
-    sql = get_sql_template("pm_history.sql")
+    limit = request.limit or 10
+    cursor_time, cursor_id = decode_cursor(request.cursor)
+    params = {
+        "start_date": format_date_for_db(request.start_date),
+        "end_date": format_date_for_db(request.end_date),
+        "process_id": cleaned_process_id,
+        "eqp_id": cleaned_eqp_id,
+        "operator": cleaned_operator,
+        "cursor_time": cursor_time,
+        "cursor_id": cursor_id,
+        "limit_val": limit + 1  # 다음 페이지 존재 여부 확인용 1건 추가
+    }
+    cache_key = make_cache_key("pm_history", params)
+    cached = response_cache.get(cache_key)
+    if cached is not None:
+        logger.info(f"[PM 이력] 캐시 적중")
+        return build_response(cached)
     
-    try:
-        with db.get_connection() as conn:
+    ensure_database_available()
+    
+    async def query_payload():
+        db_json_mode = settings.PM_HISTORY_RESPONSE_MODE == RESPONSE_MODE_DB_JSON
+        sql, binds = build_list_query("pm_history_json.sql" if db_json_mode else "pm_history.sql", params)
+        if db_json_mode:
+            body = await fetch_db_json_page(sql, binds, limit)
+            logger.info(f"[PM 이력] DB JSON 생성 모드 조회 완료 ({len(body)} bytes)")
+            response_cache.set(cache_key, body)
+            return body
+        
+        async with db.acquire() as conn:
             cursor = conn.cursor()
-            cursor.execute(sql, {
-                "start_date": format_date_for_db(request.start_date),
-                "end_date": format_date_for_db(request.end_date),
-                "process_id": cleaned_process_id,
-                "eqp_id": cleaned_eqp_id,
-                "operator": cleaned_operator,
-                "limit_val": request.limit or 10
-            })
+            await cursor.execute(sql, binds)
             
-            rows = cursor.fetchall()
+            rows = await cursor.fetchall()
             cursor.close()
-            
-            result_list = [
-                PMHistoryItem(
-                    down_date=row[0],
-                    down_type=row[1] or "SCHEDULED",
-                    down_time_minutes=float(row[2]) if row[2] is not None else 0.0,
-                    operator=row[3]
-                )
-                for row in rows
-            ]
-            
-            logger.info(f"[PM 이력] 조회 결과: {len(result_list)}건")
-            return PMHistoryResponse(list=result_list)
+        
+        rows, next_cursor = split_page(rows, limit, id_index=4, time_index=5)
+        with timed_phase('map'):
+            result_list = [pm_history_row_to_dict(row) for row in rows]
+        
+        logger.info(f"[PM 이력] 조회 결과: {len(result_list)}건 (다음 페이지 {'있음' if next_cursor else '없음'})")
+        payload = {"list": result_list, "next_cursor": next_cursor}
+        response_cache.set(cache_key, payload)
+        return payload
     
+    try:
+        return build_response(await request_coalescer.do(cache_key, query_payload))
+    
+    except HTTPException:
+        raise
+    except DatabaseUnavailableError as e:
+        raise HTTPException(status_code=503, detail=str(e))
     except Exception as e:
         logger.error(f"[PM 이력] 조회 중 오류: {e}", exc_info=True)
         raise HTTPException(status_code=500, detail=f"PM 이력 조회 중 오류가 발생했습니다: {str(e)}")
@@ -546,59 +1250,131 @@ async def get_pm_history(request: PMHistoryRequest):
 async def search_inform_notes(request: SearchRequest):
     """
     상세 조치 내역 검색 엔드포인트
-    """
-    if not db.test_connection():
-        raise HTTPException(status_code=503, detail="데이터베이스에 연결할 수 없습니다.")
     
+    - keyword: 조치 내용/추정 원인 전문 검색 (한글/영문), 관련도 순으로 반환
+      (다른 필터와 함께 사용 가능, cursor는 키워드 검색 응답의 next_cursor만 사용)
+    """
     # 요청 값 정리
     cleaned_process_id = clean_request_value(request.process_id)
     cleaned_eqp_id = clean_request_value(request.eqp_id)
     cleaned_operator = clean_request_value(request.operator)
+    cleaned_keyword = clean_request_value(request.keyword)
     
-    logger.info(f"[상세 검색] 요청 수신 - process_id: {cleaned_process_id}, eqp_id: {cleaned_eqp_id}, operator: {cleaned_operator}, start_date: {request.start_date}, end_date: {request.end_date}, limit: {request.limit}")
+    logger.info(f"[상세 검색] 요청 수신 - process_id: {cleaned_process_id}, eqp_id: {cleaned_eqp_id}, operator: {cleaned_operator}, keyword: {cleaned_keyword}, start_date: {request.start_date}, end_date: {request.end_date}, limit: {request.limit}, cursor: {request.cursor}")
     
-    # SQL 템플릿 파일 읽기
-    sql = get_sql_template("search_inform_notes.sql")
+    limit = request.limit or 20
+    if cleaned_keyword:
+        return await search_by_keyword_endpoint(request, cleaned_keyword, limit)
     
-    try:
-        with db.get_connection() as conn:
+    cursor_time, cursor_id = decode_cursor(request.cursor)
+    params = {
+        "start_date": format_date_for_db(request.start_date),
+        "end_date": format_date_for_db(request.end_date),
+        "process_id": cleaned_process_id,
+        "eqp_id": cleaned_eqp_id,
+        "operator": cleaned_operator,
+        "status_id": request.status_id,
+        "cursor_time": cursor_time,
+        "cursor_id": cursor_id,
+        "limit_val": limit + 1  # 다음 페이지 존재 여부 확인용 1건 추가
+    }
+    cache_key = make_cache_key("search_inform_notes", params)
+    cached = response_cache.get(cache_key)
+    if cached is not None:
+        logger.info(f"[상세 검색] 캐시 적중")
+        return build_response(cached)
+    
+    ensure_database_available()
+    
+    async def query_payload():
+        db_json_mode = settings.SEARCH_RESPONSE_MODE == RESPONSE_MODE_DB_JSON
+        sql, binds = build_list_query("search_inform_notes_json.sql" if db_json_mode else "search_inform_notes.sql", params)
+        if db_json_mode:
+            body = await fetch_db_json_page(sql, binds, limit, extra_fields={"truncated": False})
+            logger.info(f"[상세 검색] DB JSON 생성 모드 조회 완료 ({len(body)} bytes)")
+            response_cache.set(cache_key, body)
+            return body
+        
+        async with db.acquire() as conn:
             cursor = conn.cursor()
-            cursor.execute(sql, {
-                "start_date": format_date_for_db(request.start_date),
-                "end_date": format_date_for_db(request.end_date),
-                "process_id": cleaned_process_id,
-                "eqp_id": cleaned_eqp_id,
-                "operator": cleaned_operator,
-                "status_id": request.status_id,
-                "limit_val": request.limit or 20
-            })
+            await cursor.execute(sql, binds)
             
-            rows = cursor.fetchall()
+            rows = await cursor.fetchall()
             cursor.close()
-            
-            result_list = [
-                SearchItem(
-                    informnote_id=row[0],
-                    down_start_time=row[1],
-                    process_name=row[2],
-                    eqp_name=row[3],
-                    error_code=row[4],
-                    error_desc=row[5],
-                    act_content=row[6],
-                    operator=row[7],
-                    status=row[9] or ("COMPLETED" if row[8] == 1 else "IN_PROGRESS" if row[8] == 0 else "UNKNOWN")
-                )
-                for row in rows
-            ]
-            
-            logger.info(f"[상세 검색] 조회 결과: {len(result_list)}건")
-            return SearchResponse(list=result_list)
+        
+        rows, next_cursor = split_page(rows, limit, id_index=0, time_index=10)
+        with timed_phase('map'):
+            result_list = [search_row_to_dict(row) for row in rows]
+        
+        logger.info(f"[상세 검색] 조회 결과: {len(result_list)}건 (다음 페이지 {'있음' if next_cursor else '없음'})")
+        payload = {"list": result_list, "next_cursor": next_cursor, "truncated": False}
+        response_cache.set(cache_key, payload)
+        return payload
+    
+    try:
+        return build_response(await request_coalescer.do(cache_key, query_payload))
     
+    except HTTPException:
+        raise
+    except DatabaseUnavailableError as e:
+        raise HTTPException(status_code=503, detail=str(e))
     except Exception as e:
         logger.error(f"[상세 검색] 조회 중 오류: {e}", exc_info=True)
         raise HTTPException(status_code=500, detail=f"상세 조회 중 오류가 발생했습니다: {str(e)}")
 
 
+async def search_by_keyword_endpoint(request: SearchRequest, keyword: str, limit: int):
+    """상세 검색 키워드 모드 처리 (캐시 -> 검색 인덱스 -> 후보 필터 조회)"""
+    offset = decode_rank_cursor(request.cursor)
+    filters = {
+        "start_date": format_date_for_db(request.start_date),
+        "end_date": format_date_for_db(request.end_date),
+        "process_id": clean_request_value(request.process_id),
+        "eqp_id": clean_request_value(request.eqp_id),
+        "operator": clean_request_value(request.operator),
+        "status_id": request.status_id,
+    }
+    cache_key = make_cache_key("search_inform_notes:keyword", {
+        **filters, "keyword": keyword.casefold(), "limit": limit, "offset": offset
+    })
+    cached = response_cache.get(cache_key)
+    if cached is not None:
+        logger.info(f"[상세 검색] 캐시 적중")
+        return build_response(cached)
+    
+    await ensure_text_index()
+    
+    async def query_payload():
+        payload = await search_inform_notes_by_keyword(keyword, filters, limit, offset)
+        logger.info(f"[상세 검색] 키워드 검색 결과: {len(payload['list'])}건 (다음 페이지 {'있음' if payload['next_cursor'] else '없음'}{', 후보 한도 도달' if payload['truncated'] else ''})")
+        response_cache.set(cache_key, payload)
+        return payload
+    
+    try:
+        return build_response(await request_coalescer.do(cache_key, query_payload))
+    
+    except DatabaseUnavailableError as e:
+        raise HTTPException(status_code=503, detail=str(e))
+    except Exception as e:
+        logger.error(f"[상세 검색] 키워드 검색 중 오류: {e}", exc_info=True)
+        raise HTTPException(status_code=500, detail=f"상세 조회 중 오류가 발생했습니다: {str(e)}")
+
+
+@app.post("/api/v1/terms/search", response_model=TermSearchResponse, tags=["조회"])
+async def search_terms(request: TermSearchRequest):
+    """
+    반도체 용어 사전 조회 엔드포인트
+    
+    영문 용어, 한글 발음, 앞부분(접두사), 오타가 있는 입력으로 용어를 찾습니다.
+    인메모리 인덱스에서 처리하므로 DB 조회 없이 응답합니다.
+    """
+    await ensure_term_index()
+    
+    result_list = term_index.search(request.query, request.limit or 10, fuzzy=request.fuzzy)
+    logger.info(f"[용어 조회] query: {request.query}, 결과: {len(result_list)}건")
+    return build_response({"list": result_list})
+
+
 # ============================================================================
 # Dify 프록시 엔드포인트 (Vercel 미국 서버 → 로컬 한국 IP → Dify 한국 서버)
 # ============================================================================
@@ -612,16 +1388,14 @@ class DifyProxyRequest(BaseModel):
     payload: Dict[str, Any] = Field(..., description="Dify API 요청 payload")
 
 
-@app.post("/proxy/dify")
-async def proxy_dify(request: DifyProxyRequest):
-    """
-    Dify API 프록시 엔드포인트
-    
-    Vercel(미국)에서 직접 Dify(한국)에 접근할 수 없을 때,
-    로컬 서버(한국 IP)를 통해 프록시하여 접근합니다.
-    """
-    logger.info(f"[Dify Proxy] 요청 수신 - URL: {request.url}, 앱 타입: {request.appType}")
-    
+SSE_MEDIA_TYPE = "text/event-stream"
+
+# Dify 응답 캐시 요청/응답 헤더
+DIFY_CACHE_HEADER = "X-Dify-Cache"
+
+
+def resolve_dify_request(request: DifyProxyRequest) -> Tuple[str, Dict[str, str]]:
+    """프록시 요청의 최종 Dify URL과 요청 헤더 (API Key가 비어 있으면 400)"""
     # API Key 정리
     clean_api_key = request.apiKey.strip().replace(" ", "")
     
@@ -666,48 +1440,177 @@ async def proxy_dify(request: DifyProxyRequest):
     
     logger.info(f"[Dify Proxy] 최종 URL: {clean_url}")
     logger.info(f"[Dify Proxy] 인증 헤더 타입: {auth_header_type}")
+    return clean_url, headers
+
+
+def dify_json_response(response: httpx.Response) -> JSONResponse:
+    """본문까지 받은 Dify 응답 -> 프록시 JSON 응답 (HTML/오류 응답은 error 메시지로 변환)"""
+    # 응답 텍스트 가져오기
+    response_text = response.text
+    
+    # HTML 응답 체크
+    if response_text.strip().startswith(("<!DOCTYPE", "<html", "<!doctype")):
+        logger.error(f"[Dify Proxy] HTML 응답 감지")
+        return JSONResponse(
+            status_code=response.status_code or 500,
+            content={"error": "Dify 서버에서 HTML 페이지를 반환했습니다. URL을 확인하세요."}
+        )
+    
+    # JSON 파싱 시도
+    try:
+        response_data = response.json()
+    except:
+        response_data = {"raw_response": response_text[:500]}
+    
+    if not response.is_success:
+        logger.error(f"[Dify Proxy] 오류 응답: {response_text[:500]}")
+        return JSONResponse(
+            status_code=response.status_code,
+            content={"error": response_data.get("message") or response_data.get("error") or response_text[:200]}
+        )
+    
+    logger.info(f"[Dify Proxy] 성공 응답")
+    return JSONResponse(content=response_data)
+
+
+async def stream_dify_response(url: str, headers: Dict[str, str], payload: Dict[str, Any]) -> Response:
+    """Dify 스트리밍 응답(text/event-stream)을 받는 대로 클라이언트에 그대로 전달
+    
+    응답 헤더까지 받은 뒤 성공한 SSE 응답이면 StreamingResponse로 청크를 중계하고,
+    오류/JSON 응답이면 본문을 읽어 blocking 모드와 같은 형식으로 반환합니다.
+    클라이언트 연결이 끊기면 Dify 응답 스트림을 닫아 업스트림 요청도 중단합니다.
+    """
+    upstream = AsyncExitStack()
+    relaying = False
+    try:
+        response = await upstream.enter_async_context(
+            dify_client.stream(url, headers={**headers, "Accept": SSE_MEDIA_TYPE}, json=payload)
+        )
+        logger.info(f"[Dify Proxy] 응답 상태: {response.status_code} ({response.headers.get('content-type', '-')})")
+        if not response.is_success or not response.headers.get("content-type", "").startswith(SSE_MEDIA_TYPE):
+            await response.aread()
+            return dify_json_response(response)
+        relaying = True
+    finally:
+        if not relaying:
+            await upstream.aclose()
+    
+    async def relay():
+        chunks = 0
+        completed = False
+        try:
+            async for chunk in response.aiter_raw():
+                chunks += 1
+                yield chunk
+            completed = True
+            logger.info(f"[Dify Proxy] 스트리밍 완료 ({chunks}개 청크)")
+        except httpx.HTTPError as e:
+            # 이미 응답이 시작되었으므로 스트림만 종료
+            completed = True
+            logger.error(f"[Dify Proxy] 스트리밍 중 업스트림 오류: {e}")
+        finally:
+            if not completed:
+                logger.info(f"[Dify Proxy] 클라이언트 연결 종료로 스트리밍 중단 ({chunks}개 청크 전달)")
+            # 연결 종료로 취소된 상태에서도 업스트림 응답은 끝까지 닫음
+            with anyio.CancelScope(shield=True):
+                await upstream.aclose()
+    
+    return StreamingResponse(
+        relay(),
+        status_code=response.status_code,
+        media_type=SSE_MEDIA_TYPE,
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+        # 본문 전송을 시작하기 전에 연결이 끊긴 경우에도 업스트림 응답을 닫음 (이미 닫혔으면 무시)
+        background=BackgroundTask(upstream.aclose),
+    )
+
+
+def dify_cache_mode(http_request: Request) -> str:
+    """요청 헤더의 Dify 응답 캐시 사용 방식
+
+    - use: 캐시 조회 후 없으면 Dify 호출 결과 저장 (기본)
+    - refresh: 캐시를 조회하지 않고 Dify를 호출하여 결과로 갱신 (Cache-Control: no-cache 또는 X-Dify-Cache: refresh)
+    - bypass: 캐시를 조회/저장하지 않음 (Cache-Control: no-store 또는 X-Dify-Cache: bypass)
+    """
+    cache_control = http_request.headers.get("cache-control", "").lower()
+    directive = http_request.headers.get(DIFY_CACHE_HEADER, "").strip().lower()
+    if directive == "bypass" or "no-store" in cache_control:
+        return "bypass"
+    if directive == "refresh" or "no-cache" in cache_control:
+        return "refresh"
+    return "use"
+
+
+def is_cacheable_dify_response(response: httpx.Response) -> bool:
+    """저장할 Dify 응답인지 (성공한 JSON 응답, 워크플로는 실행 상태가 succeeded인 경우만)"""
+    if not response.is_success or not response.headers.get("content-type", "").startswith("application/json"):
+        return False
+    try:
+        data = response.json()
+    except ValueError:
+        return False
+    run = data.get("data") if isinstance(data, dict) else None
+    return not isinstance(run, dict) or run.get("status", "succeeded") == "succeeded"
+
+
+@app.post("/proxy/dify")
+async def proxy_dify(request: DifyProxyRequest, http_request: Request):
+    """
+    Dify API 프록시 엔드포인트
+    
+    Vercel(미국)에서 직접 Dify(한국)에 접근할 수 없을 때,
+    로컬 서버(한국 IP)를 통해 프록시하여 접근합니다.
+    Dify 서버 연결은 공유 HTTP 클라이언트(dify_client.py)로 요청 간에 재사용합니다.
+    
+    - payload.response_mode가 "streaming"이면 Dify의 SSE(text/event-stream) 응답을
+      받는 대로 그대로 전달 (첫 토큰까지의 시간이 직접 연결과 같음)
+    - DIFY_ANSWER_CACHE_ENABLED=true이면 DIFY_ANSWER_CACHE_APP_TYPES 앱(기본 workflow)의 blocking 요청은
+      같은 URL/앱/API Key/payload(user, conversation_id 제외) 응답을 TTL 동안 재사용
+      (응답 헤더 X-Dify-Cache: HIT/MISS/REFRESH/BYPASS, 요청 헤더로 refresh/bypass 지정)
+    """
+    logger.info(f"[Dify Proxy] 요청 수신 - URL: {request.url}, 앱 타입: {request.appType}")
+    
+    clean_url, headers = resolve_dify_request(request)
+    streaming = request.payload.get("response_mode") == "streaming"
     logger.info(f"[Dify Proxy] Payload: {json.dumps(request.payload, ensure_ascii=False)[:200]}...")
     
+    app_type = request.appType or "chatbot"
+    cache_key = cache_status = None
+    if settings.DIFY_ANSWER_CACHE_ENABLED and not streaming and app_type in DIFY_ANSWER_CACHE_APP_TYPES:
+        cache_mode = dify_cache_mode(http_request)
+        if cache_mode != "bypass":
+            cache_key = answer_cache_key(clean_url, app_type, request.apiKey.strip().replace(" ", ""), request.payload)
+        if cache_mode == "use":
+            cached = dify_answer_cache.get(cache_key)
+            if cached is not None:
+                logger.info(f"[Dify Proxy] 캐시 적중")
+                return Response(content=cached, media_type="application/json", headers={DIFY_CACHE_HEADER: "HIT"})
+        cache_status = {"use": "MISS", "refresh": "REFRESH", "bypass": "BYPASS"}[cache_mode]
+    
     try:
-        async with httpx.AsyncClient(timeout=60.0, follow_redirects=True) as client:
-            response = await client.post(
-                clean_url,
-                headers=headers,
-                json=request.payload
-            )
-            
-            logger.info(f"[Dify Proxy] 응답 상태: {response.status_code}")
-            
-            # 응답 텍스트 가져오기
-            response_text = response.text
-            
-            # HTML 응답 체크
-            if response_text.strip().startswith(("<!DOCTYPE", "<html", "<!doctype")):
-                logger.error(f"[Dify Proxy] HTML 응답 감지")
-                return JSONResponse(
-                    status_code=response.status_code or 500,
-                    content={"error": "Dify 서버에서 HTML 페이지를 반환했습니다. URL을 확인하세요."}
-                )
-            
-            # JSON 파싱 시도
-            try:
-                response_data = response.json()
-            except:
-                response_data = {"raw_response": response_text[:500]}
-            
-            if not response.is_success:
-                logger.error(f"[Dify Proxy] 오류 응답: {response_text[:500]}")
-                return JSONResponse(
-                    status_code=response.status_code,
-                    content={"error": response_data.get("message") or response_data.get("error") or response_text[:200]}
-                )
-            
-            logger.info(f"[Dify Proxy] 성공 응답")
-            return JSONResponse(content=response_data)
-            
+        if streaming:
+            return await stream_dify_response(clean_url, headers, request.payload)
+        
+        response = await dify_client.post(
+            clean_url,
+            headers=headers,
+            json=request.payload
+        )
+        
+        logger.info(f"[Dify Proxy] 응답 상태: {response.status_code}")
+        result = dify_json_response(response)
+        if cache_status is not None:
+            if cache_key is not None and is_cacheable_dify_response(response):
+                dify_answer_cache.set(cache_key, result.body)
+            result.headers[DIFY_CACHE_HEADER] = cache_status
+        return result
+        
+    except httpx.PoolTimeout as e:
+        logger.error(f"[Dify Proxy] 연결 대기 시간 초과: {e}")
+        raise HTTPException(status_code=503, detail="Dify 서버 동시 요청이 많습니다. 잠시 후 다시 시도하세요.")
     except httpx.TimeoutException:
         logger.error("[Dify Proxy] 타임아웃")
-        raise HTTPException(status_code=504, detail="Dify 서버 응답 타임아웃 (60초 초과)")
+        raise HTTPException(status_code=504, detail=f"Dify 서버 응답 타임아웃 ({settings.DIFY_PROXY_READ_TIMEOUT:g}초 초과)")
     except httpx.ConnectError as e:
         logger.error(f"[Dify Proxy] 연결 오류: {e}")
         raise HTTPException(status_code=502, detail=f"Dify 서버에 연결할 수 없습니다: {str(e)}")
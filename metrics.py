@@ -0,0 +1,205 @@
+"""
+애플리케이션 메트릭 수집 모듈
+연결 풀 대기 시간 등 지연 시간 분포를 고정 버킷 히스토그램으로 누적합니다.
+
+- 요청 단계별 시간: 요청마다 RequestTiming을 contextvar로 공유하고, 연결 acquire(database.py),
+  SQL execute/fetch(database.py의 요청용 커서), 행 변환/직렬화(main.py)가 각 단계 시간을 더함
+- 출력: Server-Timing 응답 헤더(요청 단위) + Prometheus 텍스트 형식 /metrics (엔드포인트별 누적)
+"""
+import bisect
+import math
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+# 지연 시간 기본 버킷 (초)
+DEFAULT_LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# 요청당 조회 행 수 버킷
+ROW_COUNT_BUCKETS = (0, 1, 10, 50, 100, 500, 1000, 5000, 10000)
+
+# 요청 처리 단계 (Server-Timing 항목 순서)
+# acquire: 연결 풀 대기, execute: SQL 실행, fetch: 결과 행 수신, map: 행 -> dict 변환, serialize: JSON 인코딩
+REQUEST_PHASES = ('acquire', 'execute', 'fetch', 'map', 'serialize')
+
+
+class Histogram:
+    """고정 버킷 히스토그램 (버킷별 카운트는 Prometheus 규칙과 같이 le 기준 누적으로 조회)"""
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS):
+        self.buckets = tuple(sorted(buckets))
+        self._counts = [0] * (len(self.buckets) + 1)  # 마지막 칸은 +Inf
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float):
+        """값 하나 기록"""
+        self._counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def cumulative_counts(self) -> Dict[str, int]:
+        """le(상한) 문자열 -> 누적 카운트"""
+        result: Dict[str, int] = {}
+        total = 0
+        for bound, bucket_count in zip(self.buckets, self._counts):
+            total += bucket_count
+            result[f"{bound:g}"] = total
+        result["+Inf"] = self.count
+        return result
+
+    def snapshot(self) -> Dict[str, Any]:
+        """JSON 응답용 요약"""
+        return {
+            "count": self.count,
+            "sum": round(self.sum, 6),
+            "avg": round(self.sum / self.count, 6) if self.count else None,
+            "buckets": self.cumulative_counts(),
+        }
+
+
+class RequestTiming:
+    """요청 하나의 단계별 누적 시간(초)과 조회 행 수"""
+
+    __slots__ = ('started', 'phases', 'rows', 'path')
+
+    def __init__(self, path: Optional[str] = None):
+        self.started = time.perf_counter()
+        self.path = path              # 요청 경로 (느린 쿼리 기록용)
+        self.phases: Dict[str, float] = {}
+        self.rows = 0
+
+    def add(self, phase: str, seconds: float):
+        self.phases[phase] = self.phases.get(phase, 0.0) + seconds
+
+    def merge(self, other: "RequestTiming"):
+        """다른 타이밍의 단계 시간과 행 수를 더함 (병합된 공유 조회의 DB 단계를 각 요청에 반영)"""
+        for phase, seconds in other.phases.items():
+            self.add(phase, seconds)
+        self.rows += other.rows
+
+    def server_timing(self, total: float) -> str:
+        """Server-Timing 헤더 값 (ms, 예: "acquire;dur=0.12, execute;dur=8.40, total;dur=10.31")"""
+        entries = [f"{phase};dur={self.phases[phase] * 1000:.2f}" for phase in REQUEST_PHASES if phase in self.phases]
+        entries.append(f"total;dur={total * 1000:.2f}")
+        return ', '.join(entries)
+
+
+# 현재 요청의 타이밍 (요청 처리 밖의 백그라운드 작업/스크립트에서는 None)
+current_request_timing: ContextVar[Optional[RequestTiming]] = ContextVar('current_request_timing', default=None)
+
+
+def record_phase(phase: str, seconds: float):
+    """현재 요청의 단계 시간 추가 (요청 처리 중이 아니면 무시)"""
+    timing = current_request_timing.get()
+    if timing is not None:
+        timing.add(phase, seconds)
+
+
+@contextmanager
+def timed_phase(phase: str):
+    """with 블록 실행 시간을 현재 요청의 단계 시간으로 추가"""
+    timing = current_request_timing.get()
+    if timing is None:
+        yield
+        return
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        timing.add(phase, time.perf_counter() - started)
+
+
+class RequestMetrics:
+    """엔드포인트별 요청 지연 시간 / 단계별 시간 / 조회 행 수 / 응답 수 누적"""
+
+    def __init__(self):
+        self.latency: Dict[Tuple[str, str], Histogram] = {}
+        self.phases: Dict[Tuple[str, str, str], Histogram] = {}
+        self.rows: Dict[Tuple[str, str], Histogram] = {}
+        self.responses: Dict[Tuple[str, str, int], int] = {}
+
+    def observe(self, method: str, endpoint: str, status: int, total: float, timing: RequestTiming):
+        key = (method, endpoint)
+        self.latency.setdefault(key, Histogram()).observe(total)
+        for phase, seconds in timing.phases.items():
+            self.phases.setdefault((method, endpoint, phase), Histogram()).observe(seconds)
+        if 'execute' in timing.phases:
+            self.rows.setdefault(key, Histogram(ROW_COUNT_BUCKETS)).observe(timing.rows)
+        response_key = (method, endpoint, status)
+        self.responses[response_key] = self.responses.get(response_key, 0) + 1
+
+    def write(self, out: "PrometheusText"):
+        out.counter("api_requests_total", "엔드포인트/상태 코드별 응답 수", (
+            ({"method": method, "endpoint": endpoint, "status": str(status)}, count)
+            for (method, endpoint, status), count in sorted(self.responses.items())
+        ))
+        out.histogram("api_request_duration_seconds", "요청 처리 시간 (응답 헤더 전송까지)", (
+            ({"method": method, "endpoint": endpoint}, histogram)
+            for (method, endpoint), histogram in sorted(self.latency.items())
+        ))
+        out.histogram("api_request_phase_seconds", "요청 처리 단계별 시간 (acquire/execute/fetch/map/serialize)", (
+            ({"method": method, "endpoint": endpoint, "phase": phase}, histogram)
+            for (method, endpoint, phase), histogram in sorted(self.phases.items())
+        ))
+        out.histogram("api_request_rows", "요청당 DB 조회 행 수", (
+            ({"method": method, "endpoint": endpoint}, histogram)
+            for (method, endpoint), histogram in sorted(self.rows.items())
+        ))
+
+
+def _label_value(value: str) -> str:
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _labels(labels: Dict[str, str]) -> str:
+    parts = [f'{name}="{_label_value(value)}"' for name, value in labels.items()]
+    return '{' + ','.join(parts) + '}' if parts else ''
+
+
+def _sample_value(value: float) -> str:
+    """샘플 값 표기 (정수는 그대로, 실수는 repr로 정밀도 손실 없이, 무한대/NaN은 Prometheus 표기)"""
+    if isinstance(value, int):
+        return str(int(value))
+    if math.isnan(value):
+        return "NaN"
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return repr(float(value))
+
+
+class PrometheusText:
+    """Prometheus 텍스트 노출 형식(version 0.0.4) 작성기"""
+
+    content_type = "text/plain; version=0.0.4"
+
+    def __init__(self):
+        self.lines: List[str] = []
+
+    def _header(self, name: str, help_text: str, metric_type: str):
+        self.lines.append(f"# HELP {name} {help_text}")
+        self.lines.append(f"# TYPE {name} {metric_type}")
+
+    def counter(self, name: str, help_text: str, series: Iterable[Tuple[Dict[str, str], float]]):
+        self._header(name, help_text, "counter")
+        self.lines.extend(f"{name}{_labels(labels)} {_sample_value(value)}" for labels, value in series)
+
+    def gauge(self, name: str, help_text: str, series: Iterable[Tuple[Dict[str, str], float]]):
+        self._header(name, help_text, "gauge")
+        self.lines.extend(f"{name}{_labels(labels)} {_sample_value(value)}" for labels, value in series)
+
+    def histogram(self, name: str, help_text: str, series: Iterable[Tuple[Dict[str, str], Histogram]]):
+        self._header(name, help_text, "histogram")
+        for labels, histogram in series:
+            for bound, count in histogram.cumulative_counts().items():
+                self.lines.append(f"{name}_bucket{_labels({**labels, 'le': bound})} {count}")
+            self.lines.append(f"{name}_sum{_labels(labels)} {histogram.sum:.6f}")
+            self.lines.append(f"{name}_count{_labels(labels)} {histogram.count}")
+
+    def render(self) -> str:
+        return '\n'.join(self.lines) + '\n'
+
+
+# 전역 요청 메트릭 인스턴스
+request_metrics = RequestMetrics()
@@ -0,0 +1,100 @@
+"""
+작업자(operator) 이름 인메모리 trigram 인덱스
+INFORM_NOTE의 서로 다른 작업자 이름을 프로세스 메모리에 적재하여
+부분 일치(LIKE '%값%') 조건을 본 쿼리 실행 전에 후보 이름 목록으로 좁힙니다.
+본 쿼리는 선행 와일드카드 LIKE 대신 n.operator IN (...) 조건으로 작업자 인덱스를 사용합니다.
+
+- 일치 기준: 대소문자 구분 부분 문자열 (기존 LIKE 조건과 동일한 의미)
+- 3글자 이상 검색어: trigram 포스팅 교집합으로 후보를 고른 뒤 부분 문자열 확인
+  3글자 미만 검색어: 서로 다른 작업자 이름 전체에서 부분 문자열 확인
+- 갱신: OPERATOR_INDEX_REFRESH_INTERVAL 주기 전체 갱신
+        + DATA_VERSION('inform_note') 변경 감지 즉시 갱신
+"""
+import logging
+from datetime import datetime
+from typing import Dict, List, Optional, Set
+from config import settings
+from database import db, PeriodicTask
+from sql_registry import sql_registry
+from query_builder import OPERATOR_NAME_BUCKETS
+
+logger = logging.getLogger(__name__)
+
+INFORM_NOTE_DATASET = 'inform_note'
+
+# LIKE 와일드카드 문자 (검색어에 포함되면 인덱스 대신 LIKE 조건 그대로 사용)
+LIKE_WILDCARDS = ('%', '_')
+
+
+def trigrams(text: str) -> Set[str]:
+    """문자열의 3글자 n-gram 집합"""
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+class OperatorIndex(PeriodicTask):
+    """작업자 이름 trigram 인덱스"""
+
+    name = "작업자 인덱스 갱신"
+
+    def __init__(self, interval: float):
+        super().__init__(interval)
+        self.names: List[str] = []
+        self.postings: Dict[str, Set[str]] = {}   # trigram -> 작업자 이름 집합
+        self.loaded_at: Optional[datetime] = None
+
+    @property
+    def ready(self) -> bool:
+        return self.loaded_at is not None
+
+    async def refresh(self):
+        """서로 다른 작업자 이름을 읽어 새 인덱스를 만든 뒤 교체"""
+        async with db.acquire() as conn:
+            cursor = conn.cursor()
+            cursor.arraysize = 1000
+            await cursor.execute(sql_registry.get("operator_index.sql"))
+            rows = await cursor.fetchall()
+            cursor.close()
+
+        names = sorted(name for (name,) in rows)
+        postings: Dict[str, Set[str]] = {}
+        for name in names:
+            for gram in trigrams(name):
+                postings.setdefault(gram, set()).add(name)
+
+        self.names, self.postings = names, postings
+        self.loaded_at = datetime.now()
+        logger.info(f"작업자 인덱스 갱신 완료 (작업자 {len(names)}명, trigram {len(postings)}개)")
+
+    async def run_once(self):
+        await self.refresh()
+
+    async def on_data_version_change(self, version: int):
+        """DATA_VERSION('inform_note') 변경 시 즉시 갱신"""
+        await self.refresh()
+
+    def match(self, query: str) -> Optional[List[str]]:
+        """검색어를 부분 문자열로 포함하는 작업자 이름 목록
+
+        인덱스를 사용할 수 없으면 None (미적재, LIKE 와일드카드 포함,
+        후보가 IN 목록 최대 버킷 초과 - 선택도가 낮아 LIKE 조건으로 조회)
+        일치하는 이름이 없으면 빈 목록 (마지막 갱신 이후 추가된 작업자일 수 있어 호출 측은 LIKE 조건으로 조회)
+        """
+        if not self.ready or any(wildcard in query for wildcard in LIKE_WILDCARDS):
+            return None
+
+        grams = trigrams(query)
+        if grams:
+            postings = sorted((self.postings.get(gram, set()) for gram in grams), key=len)
+            candidates = set.intersection(*postings) if postings[0] else set()
+        else:
+            candidates = self.names
+        matched = sorted(name for name in candidates if query in name)
+
+        if len(matched) > OPERATOR_NAME_BUCKETS[-1]:
+            return None
+        return matched
+
+
+# 전역 작업자 인덱스 인스턴스
+operator_index = OperatorIndex(settings.OPERATOR_INDEX_REFRESH_INTERVAL)
+db.data_versions.subscribe(INFORM_NOTE_DATASET, operator_index.on_data_version_change)
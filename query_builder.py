@@ -0,0 +1,206 @@
+"""
+동적 WHERE 절 조립 모듈
+"(:x IS NULL OR col = :x)" 형태의 범용 조건 대신 요청에 실제로 주어진 필터의 조건만 넣어
+SQL을 조립합니다. 필터 조합(shape)마다 별도 SQL이 되므로 Oracle이 조합별로 실행 계획을 세우고
+(예: eqp_id만 주어지면 IDX_INFORM_NOTE_EQP_COL 사용) 연결별 statement cache에도 따로 보관됩니다.
+
+- 조건 조각: 화이트리스트(PREDICATES)에 정의된 고정 SQL 조각만 사용, 값은 모두 바인드 변수
+- 템플릿별 허용 필터: QUERY_SPECS (허용되지 않은 필터는 무시)
+- 조립한 SQL은 (템플릿, group_by, shape) 키로 프로세스 메모리에 보관하여 재사용
+- 워크로드 기록: WORKLOAD_LOG_PATH 설정 시 build() 요청 파라미터를 JSONL로 기록 (index_advisor.py 입력)
+"""
+import json
+import logging
+import random
+from typing import Any, Dict, List, NamedTuple, Optional, Sequence, Tuple
+from sql_registry import sql_registry, render_error_code_stats
+
+logger = logging.getLogger(__name__)
+
+# 워크로드 기록 전용 로거 (파일 핸들러가 붙었을 때만 기록, 서버 로그로는 전파하지 않음)
+workload_logger = logging.getLogger("workload")
+workload_logger.propagate = False
+workload_logger.setLevel(logging.INFO)
+
+# 필터별 조건 조각 ({date_col}은 템플릿의 기간 기준 컬럼)
+PREDICATES = {
+    'start_date': "{date_col} >= TO_DATE(:start_date, 'YYYY-MM-DD')",
+    'end_date': "{date_col} < TO_DATE(:end_date, 'YYYY-MM-DD') + 1",
+    'process_id': "n.process_id = :process_id",
+    'model_id': "n.model_id = :model_id",
+    'eqp_id': "n.eqp_id = :eqp_id",
+    'error_code': "n.error_code = :error_code",
+    'status_id': "n.status_id = :status_id",
+    'operator': "n.operator LIKE '%' || :operator || '%'",
+    # 키셋 페이지네이션: (down_start_time DESC NULLS FIRST, informnote_id DESC) 순서에서 cursor 다음 행
+    'cursor': (
+        "(n.down_start_time < TO_TIMESTAMP(:cursor_time, 'YYYY-MM-DD HH24:MI:SS.FF6')"
+        " OR (n.down_start_time = TO_TIMESTAMP(:cursor_time, 'YYYY-MM-DD HH24:MI:SS.FF6')"
+        " AND n.informnote_id < :cursor_id))"
+    ),
+    # 이전 페이지 마지막 행의 down_start_time이 NULL인 경우 (NULL 구간의 나머지 + NULL이 아닌 전체)
+    'cursor_null_time': "(n.down_start_time IS NOT NULL OR n.informnote_id < :cursor_id)",
+}
+
+# IN 목록 조건 조각: 필터 -> (컬럼, 바인드 접두사)
+IN_LIST_PREDICATES = {
+    'ids': ('n.informnote_id', 'k'),
+    'operator_names': ('n.operator', 'op'),
+}
+
+# IN 목록 바인드 개수 버킷 (SQL 변형 수를 유한하게 유지)
+ID_BUCKETS = (8, 32, 128, 512)
+OPERATOR_NAME_BUCKETS = (4, 16, 64)
+IN_LIST_BUCKETS = {
+    'ids': ID_BUCKETS,
+    'operator_names': OPERATOR_NAME_BUCKETS,
+}
+
+# 필터 조건으로만 쓰이는 요청 파라미터 (나머지 파라미터는 그대로 바인드로 전달, 예: limit_val)
+FILTER_PARAMS = set(PREDICATES) | {'cursor_time', 'cursor_id'}
+
+
+class QuerySpec(NamedTuple):
+    """템플릿별 조립 규칙"""
+    fixed: Tuple[str, ...]          # 항상 적용되는 조건
+    filters: Tuple[str, ...]        # 허용 필터 (요청 값이 있을 때만 조건 추가, 이 순서로 나열)
+    date_col: str = 'n.down_start_time'
+
+
+ERROR_CODE_STATS_FILTERS = ('start_date', 'end_date', 'process_id', 'model_id', 'eqp_id', 'error_code')
+PM_HISTORY_FILTERS = ('start_date', 'end_date', 'process_id', 'eqp_id', 'operator', 'cursor')
+SEARCH_FILTERS = ('start_date', 'end_date', 'process_id', 'eqp_id', 'operator', 'status_id', 'cursor')
+
+ERROR_CODE_STATS_TEMPLATES = ('error_code_stats.sql', 'error_code_stats_rollup.sql')
+
+QUERY_SPECS: Dict[str, QuerySpec] = {
+    'error_code_stats.sql': QuerySpec(("n.down_type_id = 1",), ERROR_CODE_STATS_FILTERS),
+    'error_code_stats_rollup.sql': QuerySpec(("n.down_type_id = 1",), ERROR_CODE_STATS_FILTERS, 'n.stat_day'),
+    'pm_history.sql': QuerySpec(("n.down_type_id = 0",), PM_HISTORY_FILTERS),
+    'pm_history_json.sql': QuerySpec(("n.down_type_id = 0",), PM_HISTORY_FILTERS),
+    'search_inform_notes.sql': QuerySpec((), SEARCH_FILTERS),
+    'search_inform_notes_json.sql': QuerySpec((), SEARCH_FILTERS),
+    'search_inform_notes_keyword.sql': QuerySpec((), ('ids',) + SEARCH_FILTERS[:-1]),
+}
+
+
+def bucket_for(buckets: Sequence[int], count: int) -> int:
+    """count개를 담을 수 있는 가장 작은 버킷 크기 (최대 버킷 초과 시 ValueError)"""
+    for size in buckets:
+        if size >= count:
+            return size
+    raise ValueError(f"IN 목록 값이 최대 버킷({buckets[-1]})보다 많습니다: {count}")
+
+
+class QueryBuilder:
+    """요청 필터 -> (SQL, 바인드) 조립 및 shape별 SQL 캐시"""
+
+    def __init__(self):
+        self._statements: Dict[Tuple, str] = {}
+        self._names: Dict[str, str] = {}      # 조립한 SQL -> 템플릿 이름 (느린 쿼리 기록용)
+        self.workload_sample_rate = 0.0
+
+    def record_workload(self, path: str, sample_rate: float = 1.0):
+        """build() 요청(템플릿, group_by, 파라미터, IN 목록)을 path에 JSONL로 기록 (sample_rate 비율만)"""
+        handler = logging.FileHandler(path, encoding='utf-8')
+        handler.setFormatter(logging.Formatter('%(message)s'))
+        workload_logger.addHandler(handler)
+        self.workload_sample_rate = sample_rate
+        logger.info(f"워크로드 기록 시작: {path} (샘플링 비율 {sample_rate})")
+
+    def __len__(self) -> int:
+        return len(self._statements)
+
+    def build(self, filename: str, params: Dict[str, Any], group_by: Optional[str] = None,
+              in_lists: Optional[Dict[str, List[Any]]] = None) -> Tuple[str, Dict[str, Any]]:
+        """템플릿과 요청 파라미터로 SQL과 바인드 dict 반환
+
+        params: 필터 값(None이면 미지정) + 그 외 바인드(limit_val 등)
+        in_lists: IN 목록 필터 값 (ids / operator_names, 비어 있지 않아야 함)
+                  operator_names가 주어지면 operator LIKE 대신 작업자 이름 IN 조건 사용
+        """
+        spec = QUERY_SPECS[filename]
+        in_lists = in_lists or {}
+        if self.workload_sample_rate and random.random() < self.workload_sample_rate:
+            workload_logger.info(json.dumps({
+                "template": filename, "group_by": group_by, "params": params, "in_lists": in_lists,
+            }, ensure_ascii=False, default=str))
+
+        shape: List[Any] = []
+        binds = {key: value for key, value in params.items() if key not in FILTER_PARAMS}
+        for name in spec.filters:
+            if name in IN_LIST_PREDICATES or (name == 'operator' and 'operator_names' in in_lists):
+                list_name = 'operator_names' if name == 'operator' else name
+                values = in_lists.get(list_name)
+                if not values:
+                    continue
+                bucket_size = bucket_for(IN_LIST_BUCKETS[list_name], len(values))
+                prefix = IN_LIST_PREDICATES[list_name][1]
+                binds.update({f"{prefix}{i}": None for i in range(bucket_size)})
+                binds.update({f"{prefix}{i}": value for i, value in enumerate(values)})
+                shape.append((list_name, bucket_size))
+            elif name == 'cursor':
+                if params.get('cursor_id') is None:
+                    continue
+                binds['cursor_id'] = params['cursor_id']
+                if params.get('cursor_time') is None:
+                    shape.append('cursor_null_time')
+                else:
+                    binds['cursor_time'] = params['cursor_time']
+                    shape.append('cursor')
+            elif params.get(name) is not None:
+                binds[name] = params[name]
+                shape.append(name)
+
+        key = (filename, group_by if filename in ERROR_CODE_STATS_TEMPLATES else None, tuple(shape))
+        sql = self._statements.get(key)
+        if sql is None:
+            sql = self._render(filename, spec, key[1], shape)
+            self._statements[key] = sql
+            self._names[sql] = shape_label(key)
+            logger.debug(f"SQL 조립: {filename} {shape} (캐시 {len(self._statements)}개)")
+        return sql, binds
+
+    def describe(self, sql: str) -> Optional[str]:
+        """조립한 SQL의 템플릿 이름 (예: "pm_history.sql [eqp_id, start_date]"), 조립한 SQL이 아니면 None"""
+        return self._names.get(sql)
+
+    @staticmethod
+    def _render(filename: str, spec: QuerySpec, group_by: Optional[str], shape: List[Any]) -> str:
+        conditions = list(spec.fixed)
+        for item in shape:
+            if isinstance(item, tuple):
+                list_name, bucket_size = item
+                column, prefix = IN_LIST_PREDICATES[list_name]
+                binds = ', '.join(f":{prefix}{i}" for i in range(bucket_size))
+                conditions.append(f"{column} IN ({binds})")
+            else:
+                conditions.append(PREDICATES[item].format(date_col=spec.date_col))
+        where_clause = "WHERE " + "\n  AND ".join(conditions) if conditions else ""
+
+        template = sql_registry.template(filename)
+        if filename in ERROR_CODE_STATS_TEMPLATES:
+            return render_error_code_stats(template, group_by, spec.date_col, where_clause)
+        return template.format(where_clause=where_clause)
+
+
+def shape_label(key: Tuple) -> str:
+    """(템플릿, group_by, shape) 키 -> 표시용 이름 (IN 목록은 "ids:32"처럼 버킷 크기 포함)"""
+    filename, group_by, shape = key
+    items = [f"{item[0]}:{item[1]}" if isinstance(item, tuple) else item for item in shape]
+    name = f"{filename}:{group_by}" if group_by else filename
+    return f"{name} [{', '.join(items)}]"
+
+
+def error_code_stats_template(use_rollup: bool) -> str:
+    """error_code_stats 템플릿 파일명 (일별 집계 테이블 / 원본 테이블)"""
+    return 'error_code_stats_rollup.sql' if use_rollup else 'error_code_stats.sql'
+
+
+def normalize_group_by(group_by: Optional[str]) -> str:
+    """error_code_stats group_by 정규화 (month/day 외에는 error_code 기준)"""
+    return group_by if group_by in ('month', 'day') else 'error_code'
+
+
+# 전역 쿼리 조립기 인스턴스
+query_builder = QueryBuilder()
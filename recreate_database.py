@@ -3,8 +3,11 @@
 Oracle DB 전체 재구성 및 데이터 적재 통합 스크립트
 1. 기존 테이블 삭제 (외래키 제약조건 고려)
 2. 새 스키마로 테이블 생성
-3. 데이터 적재
+3. 인덱스 마이그레이션 적용 (index_migrations/, SCHEMA_MIGRATIONS에 적용 버전 기록)
+4. 데이터 적재
 """
+import hashlib
+import re
 import sys
 from pathlib import Path
 import logging
@@ -30,6 +33,7 @@ logger = logging.getLogger(__name__)
 # 테이블 삭제 순서 (자식 테이블부터, 외래키 제약조건 고려)
 # normalized_data_preprocessed.xlsx에는 site, factory, line 시트가 없으므로 제외
 DROP_ORDER = [
+    'INFORM_NOTE_DAILY_STATS',  # INFORM_NOTE 일별 집계 (독립적)
     'INFORM_NOTE',           # 가장 많은 참조를 하는 테이블
     'EQUIPMENT',            # MODEL 참조 (LINE은 엑셀에 없음)
     'ERROR_CODE',           # PROCESS 참조
@@ -38,6 +42,8 @@ DROP_ORDER = [
     'PROCESS',              # 독립적
     'STATUS',               # 독립적
     'DOWN_TYPE',            # 독립적
+    'DATA_VERSION',         # 독립적 (데이터셋 적재 버전)
+    'SCHEMA_MIGRATIONS',    # 독립적 (인덱스 마이그레이션 적용 이력)
 ]
 
 # 테이블 생성 설정
@@ -56,6 +62,15 @@ TABLE_CONFIGS = [
     },
 ]
 
+# 인덱스 마이그레이션 (V{번호}__{설명}.sql, 번호 순서대로 한 번씩 적용)
+MIGRATIONS_DIR = Path(__file__).parent / 'index_migrations'
+MIGRATION_FILE_PATTERN = re.compile(r'^V(\d+)__(\w+)\.sql$')
+SCHEMA_MIGRATIONS_SQL = 'create_schema_migrations.sql'
+
+# 마이그레이션 재적용 시 경고만 출력하는 오류
+# (ORA-00955 이름 중복, ORA-01408 같은 컬럼 목록 인덱스 존재, ORA-01418 삭제할 인덱스 없음)
+MIGRATION_IGNORABLE_ERRORS = ('ORA-00955', 'ORA-01408', 'ORA-01418')
+
 
 def drop_all_tables():
     """모든 테이블 삭제 (외래키 제약조건 고려)"""
@@ -192,6 +207,80 @@ def create_all_tables():
     return True
 
 
+def list_index_migrations():
+    """index_migrations/의 마이그레이션 파일 목록 [(버전, 설명, 경로)] (버전 오름차순)"""
+    migrations = []
+    for path in sorted(MIGRATIONS_DIR.glob('*.sql')):
+        match = MIGRATION_FILE_PATTERN.match(path.name)
+        if not match:
+            logger.warning(f"마이그레이션 파일명 형식이 아닙니다 (건너뜀): {path.name}")
+            continue
+        migrations.append((int(match.group(1)), match.group(2), path))
+    migrations.sort(key=lambda migration: migration[0])
+    return migrations
+
+
+def apply_index_migrations():
+    """적용되지 않은 인덱스 마이그레이션을 버전 순서대로 적용하고 SCHEMA_MIGRATIONS에 기록"""
+    logger.info("=" * 80)
+    logger.info("인덱스 마이그레이션 적용")
+    logger.info("=" * 80)
+
+    try:
+        with db.get_connection() as conn:
+            cursor = conn.cursor()
+
+            # 이력 테이블 (기존 DB에 --migrate-only로 처음 적용하는 경우에도 생성)
+            for statement in split_sql_statements(read_sql_file(Path(__file__).parent / SCHEMA_MIGRATIONS_SQL)):
+                try:
+                    cursor.execute(statement)
+                except Exception as e:
+                    if 'ORA-00955' not in str(e).upper():
+                        raise
+
+            cursor.execute("SELECT version, checksum FROM SCHEMA_MIGRATIONS")
+            applied = dict(cursor.fetchall())
+
+            applied_count = 0
+            for version, description, path in list_index_migrations():
+                sql_content = read_sql_file(path)
+                checksum = hashlib.sha256(sql_content.encode('utf-8')).hexdigest()
+                if version in applied:
+                    if applied[version] != checksum:
+                        logger.warning(f"  ⚠ V{version:03d} 적용 후 파일이 수정되었습니다 (재적용하지 않음, 새 버전으로 추가하세요)")
+                    continue
+
+                statements = split_sql_statements(sql_content)
+                logger.info(f"\n[V{version:03d} {description}] SQL 문 {len(statements)}개 적용 중...")
+                for idx, statement in enumerate(statements, 1):
+                    try:
+                        cursor.execute(statement)
+                        logger.info(f"  [{idx}/{len(statements)}] {statement.splitlines()[0][:100]}")
+                    except Exception as e:
+                        error_msg = str(e)
+                        if any(code in error_msg.upper() for code in MIGRATION_IGNORABLE_ERRORS):
+                            logger.warning(f"  ⚠ [{idx}/{len(statements)}] 이미 반영됨: {error_msg[:100]}")
+                        else:
+                            logger.error(f"  ✗ [{idx}/{len(statements)}] SQL 실행 실패: {statement[:150]}")
+                            raise
+
+                cursor.execute(
+                    "INSERT INTO SCHEMA_MIGRATIONS (version, description, checksum) VALUES (:1, :2, :3)",
+                    [version, description, checksum]
+                )
+                conn.commit()
+                applied_count += 1
+                logger.info(f"✓ V{version:03d} 적용 완료")
+
+            cursor.close()
+            logger.info(f"\n✓ 인덱스 마이그레이션 {applied_count}개 적용 (이전 적용 {len(applied)}개)")
+            return True
+
+    except Exception as e:
+        logger.error(f"인덱스 마이그레이션 적용 중 오류 발생: {e}", exc_info=True)
+        return False
+
+
 def verify_tables():
     """생성된 테이블 확인"""
     logger.info("=" * 80)
@@ -231,7 +320,17 @@ def main():
     
     parser = argparse.ArgumentParser(description='Oracle DB 전체 재구성 및 데이터 적재')
     parser.add_argument('--yes', '-y', action='store_true', help='확인 없이 자동 실행')
+    parser.add_argument('--migrate-only', action='store_true',
+                        help='테이블/데이터는 그대로 두고 적용되지 않은 인덱스 마이그레이션만 적용')
     args = parser.parse_args()
+
+    if args.migrate_only:
+        if not db.test_connection():
+            logger.error("데이터베이스 연결 실패")
+            sys.exit(1)
+        if not apply_index_migrations():
+            sys.exit(1)
+        return
     
     print("\n" + "=" * 80)
     print("Oracle DB 전체 재구성 및 데이터 적재")
@@ -243,11 +342,12 @@ def main():
     print("\n작업 순서:")
     print("  1. 기존 테이블 삭제")
     print("  2. 새 스키마로 테이블 생성")
-    print("  3. 테이블 확인")
-    print("  4. 데이터 적재 (참조 테이블: SITE, FACTORY, LINE)")
-    print("  5. 데이터 적재 (레퍼런스 테이블)")
-    print("  6. 데이터 적재 (용어 사전)")
-    print("  7. 데이터 적재 (Inform Note)")
+    print("  3. 인덱스 마이그레이션 적용")
+    print("  4. 테이블 확인")
+    print("  5. 데이터 적재 (참조 테이블: SITE, FACTORY, LINE)")
+    print("  6. 데이터 적재 (레퍼런스 테이블)")
+    print("  7. 데이터 적재 (용어 사전)")
+    print("  8. 데이터 적재 (Inform Note)")
     print("=" * 80)
     
     if not args.yes:
@@ -273,28 +373,35 @@ def main():
         sys.exit(1)
     
     # 1단계: 기존 테이블 삭제
-    print("\n[1/7] 기존 테이블 삭제 중...")
+    print("\n[1/8] 기존 테이블 삭제 중...")
     if not drop_all_tables():
         logger.error("테이블 삭제 실패")
         sys.exit(1)
     print("✓ 기존 테이블 삭제 완료")
     
     # 2단계: 새 테이블 생성
-    print("\n[2/7] 새 테이블 생성 중...")
+    print("\n[2/8] 새 테이블 생성 중...")
     if not create_all_tables():
         logger.error("테이블 생성 실패")
         sys.exit(1)
     print("✓ 새 테이블 생성 완료")
     
-    # 3단계: 테이블 확인
-    print("\n[3/7] 생성된 테이블 확인 중...")
+    # 3단계: 인덱스 마이그레이션 적용
+    print("\n[3/8] 인덱스 마이그레이션 적용 중...")
+    if not apply_index_migrations():
+        logger.error("인덱스 마이그레이션 적용 실패")
+        sys.exit(1)
+    print("✓ 인덱스 마이그레이션 적용 완료")
+    
+    # 4단계: 테이블 확인
+    print("\n[4/8] 생성된 테이블 확인 중...")
     if not verify_tables():
         logger.error("테이블 확인 실패")
         sys.exit(1)
     print("✓ 테이블 확인 완료")
     
-    # 4단계: 참조 테이블 (SITE, FACTORY, LINE) 데이터 적재
-    print("\n[4/7] 참조 테이블 (SITE, FACTORY, LINE) 데이터 적재 중...")
+    # 5단계: 참조 테이블 (SITE, FACTORY, LINE) 데이터 적재
+    print("\n[5/8] 참조 테이블 (SITE, FACTORY, LINE) 데이터 적재 중...")
     try:
         load_reference_dependencies()
         print("✓ 참조 테이블 데이터 적재 완료")
@@ -302,8 +409,8 @@ def main():
         logger.error(f"참조 테이블 데이터 적재 실패: {e}", exc_info=True)
         sys.exit(1)
     
-    # 5단계: 레퍼런스 테이블 데이터 적재
-    print("\n[5/7] 레퍼런스 테이블 데이터 적재 중...")
+    # 6단계: 레퍼런스 테이블 데이터 적재
+    print("\n[6/8] 레퍼런스 테이블 데이터 적재 중...")
     try:
         load_reference_tables()
         print("✓ 레퍼런스 테이블 데이터 적재 완료")
@@ -311,8 +418,8 @@ def main():
         logger.error(f"레퍼런스 테이블 데이터 적재 실패: {e}", exc_info=True)
         sys.exit(1)
     
-    # 6단계: 용어 사전 데이터 적재
-    print("\n[6/7] fab_terms_dictionary 데이터 적재 중...")
+    # 7단계: 용어 사전 데이터 적재
+    print("\n[7/8] fab_terms_dictionary 데이터 적재 중...")
     try:
         load_term_dictionary(truncate=True)
         print("✓ fab_terms_dictionary 데이터 적재 완료")
@@ -320,8 +427,8 @@ def main():
         logger.error(f"용어 사전 데이터 적재 실패: {e}", exc_info=True)
         sys.exit(1)
     
-    # 7단계: Inform Note 데이터 적재
-    print("\n[7/7] Inform_note 데이터 적재 중...")
+    # 8단계: Inform Note 데이터 적재
+    print("\n[8/8] Inform_note 데이터 적재 중...")
     try:
         load_inform_notes()
         print("✓ Inform_note 데이터 적재 완료")
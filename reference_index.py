@@ -0,0 +1,136 @@
+"""
+레퍼런스 데이터 인메모리 인덱스
+PROCESS / MODEL / EQUIPMENT 테이블을 프로세스 메모리에 적재하여
+ID/NAME 조회를 DB 접근 없이 해시 조회로 처리합니다.
+
+- 키 정규화: 앞뒤 공백 제거 + casefold (기존 UPPER(TRIM(col)) = UPPER(:v) 조건과 동일한 의미)
+- 갱신: REFERENCE_INDEX_REFRESH_INTERVAL 주기 전체 갱신
+        + load_data.load_reference_tables 적재 완료 시 DATA_VERSION('reference') 변경 감지 즉시 갱신
+"""
+import logging
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+from config import settings
+from database import db, PeriodicTask
+from sql_registry import sql_registry, LOOKUP_TABLES
+
+logger = logging.getLogger(__name__)
+
+REFERENCE_DATASET = 'reference'
+
+
+def normalize_key(value: Optional[str]) -> Optional[str]:
+    """조회 키 정규화 (공백 제거 + 대소문자 무시)"""
+    if value is None:
+        return None
+    key = str(value).strip().casefold()
+    return key or None
+
+
+def build_lookup_maps(rows) -> Tuple[Dict[str, str], Dict[str, str]]:
+    """(id, name) 행 목록으로 정규화 키 -> ID 해시 맵 생성 (중복 키는 첫 행 우선)"""
+    by_id: Dict[str, str] = {}
+    by_name: Dict[str, str] = {}
+    for entity_id, entity_name in rows:
+        id_key = normalize_key(entity_id)
+        if id_key:
+            by_id.setdefault(id_key, entity_id)
+        name_key = normalize_key(entity_name)
+        if name_key:
+            by_name.setdefault(name_key, entity_id)
+    return by_id, by_name
+
+
+def resolve_from_maps(by_id: Dict[str, str], by_name: Dict[str, str],
+                      id_val: Optional[str], name_val: Optional[str]) -> Optional[str]:
+    """ID 또는 NAME으로 실제 ID 조회 (ID 일치 우선)"""
+    id_key = normalize_key(id_val)
+    if id_key and id_key in by_id:
+        return by_id[id_key]
+    name_key = normalize_key(name_val)
+    if name_key:
+        return by_name.get(name_key)
+    return None
+
+
+class ReferenceIndex(PeriodicTask):
+    """PROCESS/MODEL/EQUIPMENT ID/NAME 해시 인덱스"""
+
+    name = "레퍼런스 인덱스 갱신"
+
+    def __init__(self, interval: float):
+        super().__init__(interval)
+        self.by_id: Dict[str, Dict[str, str]] = {table: {} for table in LOOKUP_TABLES}
+        self.by_name: Dict[str, Dict[str, str]] = {table: {} for table in LOOKUP_TABLES}
+        # 상위 엔티티 ID (MODEL -> PROCESS_ID, EQUIPMENT -> MODEL_ID)
+        self.parent: Dict[str, Dict[str, Optional[str]]] = {table: {} for table in LOOKUP_TABLES}
+        self.loaded_at: Optional[datetime] = None
+
+    @property
+    def ready(self) -> bool:
+        return self.loaded_at is not None
+
+    async def refresh(self):
+        """세 테이블을 한 번의 쿼리로 읽어 새 인덱스를 만든 뒤 교체"""
+        by_id = {table: {} for table in LOOKUP_TABLES}
+        by_name = {table: {} for table in LOOKUP_TABLES}
+        parent = {table: {} for table in LOOKUP_TABLES}
+
+        async with db.acquire() as conn:
+            cursor = conn.cursor()
+            await cursor.execute(sql_registry.get("reference_index.sql"))
+            rows = await cursor.fetchall()
+            cursor.close()
+
+        for table, entity_id, entity_name, parent_id in rows:
+            id_key = normalize_key(entity_id)
+            if id_key:
+                by_id[table].setdefault(id_key, entity_id)
+                parent[table][entity_id] = parent_id
+            name_key = normalize_key(entity_name)
+            if name_key:
+                by_name[table].setdefault(name_key, entity_id)
+
+        self.by_id, self.by_name, self.parent = by_id, by_name, parent
+        self.loaded_at = datetime.now()
+        counts = ', '.join(f"{table}={len(ids)}" for table, ids in by_id.items())
+        logger.info(f"레퍼런스 인덱스 갱신 완료 ({counts})")
+
+    async def run_once(self):
+        await self.refresh()
+
+    async def on_data_version_change(self, version: int):
+        """DATA_VERSION('reference') 변경 시 즉시 갱신"""
+        await self.refresh()
+
+    def resolve(self, table: str, id_val: Optional[str], name_val: Optional[str]) -> Optional[str]:
+        """ID 또는 NAME으로 실제 ID 조회 (ID 일치 우선)"""
+        return resolve_from_maps(self.by_id[table], self.by_name[table], id_val, name_val)
+
+    def fill_hierarchy(self, process_id: Optional[str], model_id: Optional[str],
+                       eqp_id: Optional[str]) -> Tuple[Optional[str], Optional[str], Optional[str], List[str]]:
+        """EQUIPMENT.MODEL_ID -> MODEL.PROCESS_ID 계층을 따라 비어 있는 상위 ID를 채우고
+        요청한 ID 조합이 계층과 맞지 않으면 충돌 내역을 반환
+
+        명시적으로 주어진 ID가 우선하며, 하위에서 유도한 값은 비어 있는 자리만 채웁니다.
+        """
+        conflicts: List[str] = []
+
+        if eqp_id:
+            eqp_model_id = self.parent['EQUIPMENT'].get(eqp_id)
+            if model_id and eqp_model_id and model_id != eqp_model_id:
+                conflicts.append(f"장비 {eqp_id}의 모델은 {eqp_model_id}이며 요청한 모델 {model_id}와 다릅니다.")
+            model_id = model_id or eqp_model_id
+
+        if model_id:
+            model_process_id = self.parent['MODEL'].get(model_id)
+            if process_id and model_process_id and process_id != model_process_id:
+                conflicts.append(f"모델 {model_id}의 공정은 {model_process_id}이며 요청한 공정 {process_id}와 다릅니다.")
+            process_id = process_id or model_process_id
+
+        return process_id, model_id, eqp_id, conflicts
+
+
+# 전역 레퍼런스 인덱스 인스턴스
+reference_index = ReferenceIndex(settings.REFERENCE_INDEX_REFRESH_INTERVAL)
+db.data_versions.subscribe(REFERENCE_DATASET, reference_index.on_data_version_change)
@@ -0,0 +1,37 @@
+"""
+응답 직렬화 모듈
+조회 결과 dict를 Pydantic 모델 생성/검증 없이 바로 JSON 바이트로 인코딩합니다.
+orjson이 설치되어 있으면 사용하고, 없으면 표준 json 모듈로 동일한 형식을 출력합니다.
+"""
+import json
+from typing import Any
+
+from fastapi.responses import Response
+
+try:
+    import orjson
+except ImportError:  # 선택 의존성
+    orjson = None
+
+JSON_BACKEND = "orjson" if orjson is not None else "json"
+
+
+def dumps(content: Any) -> bytes:
+    """JSON 바이트 인코딩 (공백 없는 compact 형식, 한글은 이스케이프 없이 UTF-8)"""
+    if orjson is not None:
+        return orjson.dumps(content)
+    return json.dumps(content, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+def dumps_line(content: Any) -> bytes:
+    """NDJSON 한 줄 인코딩"""
+    return dumps(content) + b'\n'
+
+
+class FastJSONResponse(Response):
+    """dumps()로 인코딩하는 JSON 응답 (response_model 검증/직렬화를 거치지 않음)"""
+
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
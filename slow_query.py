@@ -0,0 +1,216 @@
+"""
+느린 쿼리 기록 모듈
+database.py의 계측 커서가 문장 하나의 SQL 실행(execute) + 결과 수신(fetch) 시간을 재고,
+합계가 SLOW_QUERY_THRESHOLD를 넘으면 여기에 기록합니다.
+
+- 기록 항목: 템플릿 이름(조립 SQL은 필터 조합 포함), 바인드 값, execute/fetch 시간, 행 수, 요청 경로,
+  실패한 문장(호출 타임아웃 등)은 오류 메시지
+- 바인드 값: 작업자 이름 등 개인 정보가 포함되므로 기본은 값을 가리고 이름만 기록 (SLOW_QUERY_LOG_BINDS=true면 원문)
+- 실행 계획: SLOW_QUERY_PLAN_SAMPLE_RATE 비율로 같은 세션에서 DBMS_XPLAN.DISPLAY_CURSOR를 조회하여
+  실제 계획을 함께 기록 (V$SQL_PLAN 등 조회 권한 필요, 실패 시 plan_error에 사유,
+  peek한 바인드 값 출력은 SLOW_QUERY_LOG_BINDS=true일 때만)
+- 출력: 크기 기준 회전 JSONL 파일(SLOW_QUERY_LOG_PATH, opt-in) + 템플릿별 누적
+  (/debug/slow-queries, SLOW_QUERY_DEBUG_ENDPOINT=true일 때만 노출)
+"""
+import json
+import logging
+import random
+from collections import deque
+from datetime import datetime
+from logging.handlers import RotatingFileHandler
+from pathlib import Path
+from typing import Any, Deque, Dict, List, Optional
+from config import settings
+from query_builder import query_builder
+from sql_registry import sql_registry
+
+logger = logging.getLogger(__name__)
+
+# 느린 쿼리 기록 전용 로거 (파일 핸들러가 붙었을 때만 기록, 서버 로그로는 전파하지 않음)
+slow_query_logger = logging.getLogger("slow_query")
+slow_query_logger.propagate = False
+slow_query_logger.setLevel(logging.INFO)
+
+# 직전 실행 문장(세션의 prev_sql_id)의 실제 실행 계획 (바인드 값을 기록할 때만 peek한 바인드 포함)
+DISPLAY_CURSOR_SQL = "SELECT plan_table_output FROM TABLE(DBMS_XPLAN.DISPLAY_CURSOR(NULL, NULL, '{format}'))"
+
+# 기록할 바인드 문자열 값 최대 길이
+MAX_BIND_VALUE_LENGTH = 200
+
+# 가린 바인드 값 표시
+REDACTED_BIND_VALUE = '***'
+
+# 최근 기록 보관 건수 (/debug/slow-queries)
+RECENT_LIMIT = 100
+
+
+def describe_sql(sql: str) -> str:
+    """SQL 문자열 -> 템플릿 이름 (조립/사전 렌더링 SQL이 아니면 첫 줄 일부)"""
+    name = query_builder.describe(sql) or sql_registry.name_of(sql)
+    if name:
+        return name
+    first_line = next((line.strip() for line in sql.splitlines() if line.strip()), '')
+    return f"(adhoc) {first_line[:80]}"
+
+
+def bind_values(binds: Any, redact: bool = False) -> Any:
+    """기록용 바인드 값 (긴 문자열은 잘라서, 값이 없는 IN 목록 채움 바인드는 제외, redact면 값을 가림)"""
+    def clip(value):
+        if redact:
+            return REDACTED_BIND_VALUE
+        if isinstance(value, str) and len(value) > MAX_BIND_VALUE_LENGTH:
+            return value[:MAX_BIND_VALUE_LENGTH] + '...'
+        return value
+    if isinstance(binds, dict):
+        return {key: clip(value) for key, value in binds.items() if value is not None}
+    if isinstance(binds, (list, tuple)):
+        return [clip(value) for value in binds]
+    return None
+
+
+class StatementStats:
+    """문장 하나의 실행 측정값 (execute 시점에 생성, fetch마다 누적)"""
+
+    __slots__ = ('sql', 'binds', 'execute', 'fetch', 'rows', 'path', 'error')
+
+    def __init__(self, sql: str, binds: Any, execute: float, path: Optional[str]):
+        self.sql = sql
+        self.binds = binds
+        self.execute = execute
+        self.fetch = 0.0
+        self.rows = 0
+        self.path = path
+        self.error: Optional[str] = None  # 실행 실패 시 오류 메시지
+
+    @property
+    def elapsed(self) -> float:
+        return self.execute + self.fetch
+
+
+class SlowQueryLog:
+    """느린 쿼리 기록 (JSONL 파일 + 템플릿별 누적, 이벤트 루프 단일 스레드에서 사용)"""
+
+    def __init__(self, threshold: float, plan_sample_rate: float, path: Optional[str],
+                 max_bytes: int, backup_count: int, log_binds: bool = False):
+        self.threshold = threshold
+        self.plan_sample_rate = plan_sample_rate
+        self.path = path
+        self.log_binds = log_binds
+        self.max_bytes = max_bytes
+        self.backup_count = backup_count
+        self._handler: Optional[RotatingFileHandler] = None
+        self._templates: Dict[str, Dict[str, Any]] = {}
+        self._recent: Deque[Dict[str, Any]] = deque(maxlen=RECENT_LIMIT)
+        self.total = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.threshold > 0
+
+    def is_slow(self, stats: StatementStats) -> bool:
+        return self.enabled and stats.elapsed >= self.threshold
+
+    def sample_plan(self) -> bool:
+        return self.plan_sample_rate > 0 and random.random() < self.plan_sample_rate
+
+    def _write(self, record: Dict[str, Any]):
+        """JSONL 파일에 한 줄 기록 (첫 기록 시 파일 핸들러 생성)"""
+        if not self.path:
+            return
+        if self._handler is None:
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+            self._handler = RotatingFileHandler(
+                self.path, maxBytes=self.max_bytes, backupCount=self.backup_count, encoding='utf-8'
+            )
+            self._handler.setFormatter(logging.Formatter('%(message)s'))
+            slow_query_logger.addHandler(self._handler)
+        slow_query_logger.info(json.dumps(record, ensure_ascii=False, default=str))
+
+    def record(self, stats: StatementStats, plan: Optional[List[str]] = None, plan_error: Optional[str] = None):
+        """느린 문장 하나 기록"""
+        template = describe_sql(stats.sql)
+        record = {
+            "time": datetime.now().isoformat(timespec='milliseconds'),
+            "template": template,
+            "elapsed_ms": round(stats.elapsed * 1000, 2),
+            "execute_ms": round(stats.execute * 1000, 2),
+            "fetch_ms": round(stats.fetch * 1000, 2),
+            "rows": stats.rows,
+            "path": stats.path,
+            "binds": bind_values(stats.binds, redact=not self.log_binds),
+        }
+        if stats.error is not None:
+            record["error"] = stats.error
+        if plan is not None:
+            record["plan"] = plan
+        if plan_error is not None:
+            record["plan_error"] = plan_error
+
+        self.total += 1
+        self._recent.append(record)
+        entry = self._templates.get(template)
+        if entry is None:
+            entry = self._templates[template] = {
+                "template": template, "count": 0, "errors": 0, "total_ms": 0.0, "max_ms": 0.0, "max_rows": 0,
+                "last_seen": None, "slowest": None, "plan": None,
+            }
+        entry["count"] += 1
+        if stats.error is not None:
+            entry["errors"] += 1
+        entry["total_ms"] += record["elapsed_ms"]
+        entry["max_rows"] = max(entry["max_rows"], stats.rows)
+        entry["last_seen"] = record["time"]
+        if record["elapsed_ms"] >= entry["max_ms"]:
+            entry["max_ms"] = record["elapsed_ms"]
+            entry["slowest"] = {
+                key: record[key] for key in ("time", "execute_ms", "fetch_ms", "rows", "path", "binds", "error")
+                if key in record
+            }
+        if plan is not None:
+            entry["plan"] = plan
+
+        logger.warning(
+            f"느린 쿼리: {template} {record['elapsed_ms']:.1f}ms "
+            f"(execute {record['execute_ms']:.1f}ms, fetch {record['fetch_ms']:.1f}ms, 행 {stats.rows})"
+            + (f" 실패: {stats.error}" if stats.error is not None else "")
+        )
+        self._write(record)
+
+    def top(self, limit: int, order_by: str = 'total_ms') -> List[Dict[str, Any]]:
+        """템플릿별 누적 상위 항목 (order_by: total_ms / max_ms / count)"""
+        entries = sorted(self._templates.values(), key=lambda entry: -entry[order_by])[:limit]
+        return [
+            {**entry, "total_ms": round(entry["total_ms"], 2),
+             "avg_ms": round(entry["total_ms"] / entry["count"], 2)}
+            for entry in entries
+        ]
+
+    def recent(self, limit: int) -> List[Dict[str, Any]]:
+        """최근 기록 (최신순)"""
+        return list(self._recent)[::-1][:limit]
+
+    def clear(self):
+        self._templates.clear()
+        self._recent.clear()
+        self.total = 0
+
+
+async def capture_plan(conn, peeked_binds: bool = False) -> List[str]:
+    """같은 연결(세션)에서 직전에 실행한 문장의 실제 실행 계획 (DBMS_XPLAN.DISPLAY_CURSOR 출력 행)"""
+    cursor = conn.cursor()
+    try:
+        await cursor.execute(DISPLAY_CURSOR_SQL.format(format='TYPICAL +PEEKED_BINDS' if peeked_binds else 'TYPICAL'))
+        return [line for (line,) in await cursor.fetchall()]
+    finally:
+        cursor.close()
+
+
+# 전역 느린 쿼리 기록 인스턴스
+slow_query_log = SlowQueryLog(
+    threshold=settings.SLOW_QUERY_THRESHOLD,
+    plan_sample_rate=settings.SLOW_QUERY_PLAN_SAMPLE_RATE,
+    path=settings.SLOW_QUERY_LOG_PATH,
+    max_bytes=settings.SLOW_QUERY_LOG_MAX_BYTES,
+    backup_count=settings.SLOW_QUERY_LOG_BACKUP_COUNT,
+    log_binds=settings.SLOW_QUERY_LOG_BINDS,
+)
@@ -0,0 +1,233 @@
+"""
+SQL 템플릿 레지스트리
+sql_templates/*.sql 파일을 시작 시 한 번만 읽어 검증하고,
+동적 부분이 있는 템플릿은 허용된 유한한 변형을 모두 미리 렌더링합니다.
+요청 처리 중에는 디스크 I/O나 str.format 없이 완성된 SQL 문자열만 반환합니다.
+(WHERE 절을 요청 필터 조합별로 조립하는 템플릿은 query_builder.py가 조합별로 한 번 렌더링하여 보관)
+"""
+import logging
+from pathlib import Path
+from string import Formatter
+from typing import Dict, List, Optional, Set, Tuple
+from utils import read_sql_file
+
+logger = logging.getLogger(__name__)
+
+TEMPLATE_DIR = Path(__file__).parent / "sql_templates"
+
+# 템플릿 파일별 허용 placeholder (이외의 placeholder가 있으면 로드 실패)
+TEMPLATE_FIELDS: Dict[str, Set[str]] = {
+    'error_code_stats.sql': {'period_select', 'where_clause', 'group_by_clause', 'order_by_clause'},
+    'error_code_stats_rollup.sql': {'period_select', 'where_clause', 'group_by_clause', 'order_by_clause'},
+    'lookup_id.sql': {'id_col', 'name_col', 'table', 'where_conditions'},
+    'lookup_id_batch.sql': {'id_col', 'name_col', 'table', 'key_binds'},
+    'pm_history.sql': {'where_clause'},
+    'search_inform_notes.sql': {'where_clause'},
+    'pm_history_json.sql': {'where_clause'},
+    'search_inform_notes_json.sql': {'where_clause'},
+    'search_inform_notes_keyword.sql': {'where_clause'},
+    'text_index.sql': set(),
+    'text_index_count.sql': set(),
+    'operator_index.sql': set(),
+    'term_index.sql': set(),
+    'reference_index.sql': set(),
+    'data_version.sql': set(),
+}
+
+# WHERE 절을 요청 필터 조합별로 조립하는 템플릿 (query_builder.py가 렌더링, 사전 렌더링 대상 아님)
+COMPOSED_TEMPLATES = {
+    'error_code_stats.sql',
+    'error_code_stats_rollup.sql',
+    'pm_history.sql',
+    'search_inform_notes.sql',
+    'pm_history_json.sql',
+    'search_inform_notes_json.sql',
+    'search_inform_notes_keyword.sql',
+}
+
+# error_code_stats group_by 변형: group_by -> period 날짜 형식 (None이면 기간 구분 없음)
+ERROR_CODE_STATS_PERIODS = {
+    'month': 'YYYY-MM',
+    'day': 'YYYY-MM-DD',
+    'error_code': None,
+}
+
+# lookup_id.sql 화이트리스트: 테이블 -> (ID 컬럼, NAME 컬럼)
+LOOKUP_TABLES = {
+    'PROCESS': ('PROCESS_ID', 'PROCESS_NAME'),
+    'MODEL': ('MODEL_ID', 'MODEL_NAME'),
+    'EQUIPMENT': ('EQP_ID', 'EQP_NAME'),
+}
+
+# lookup_id_batch.sql IN 목록 바인드 개수 버킷 (SQL 변형 수를 유한하게 유지)
+LOOKUP_BATCH_BUCKETS = (8, 32, 128, 512)
+
+
+def render_error_code_stats(template: str, group_by: str, date_col: str, where_clause: str) -> str:
+    """error_code_stats(_rollup).sql의 group_by 변형 렌더링 (WHERE 절은 query_builder.py가 조립)"""
+    date_format = ERROR_CODE_STATS_PERIODS[group_by]
+    if date_format:
+        period_group = f"TO_CHAR({date_col}, '{date_format}')"
+        period_select = f"{period_group} AS period"
+        period_order = "period ASC"
+    else:
+        period_group = ""
+        period_select = "NULL AS period"
+        period_order = "n.process_id ASC"
+
+    # GROUP BY 절 구성
+    group_cols = [
+        "n.process_id, p.process_name",
+        "n.model_id, m.model_name",
+        "n.eqp_id, e.eqp_name",
+        "n.error_code, ec.error_desc"
+    ]
+    if period_group:
+        group_cols.insert(0, period_group)
+
+    # ORDER BY 절 구성
+    order_cols = [
+        period_order,
+        "n.process_id ASC",
+        "n.error_code ASC"
+    ]
+
+    return template.format(
+        period_select=period_select,
+        where_clause=where_clause,
+        group_by_clause=', '.join(group_cols),
+        order_by_clause=', '.join(order_cols)
+    )
+
+
+def _render_lookup_id(template: str, table: str, use_id: bool, use_name: bool) -> str:
+    """lookup_id.sql의 테이블/조건 변형 렌더링 (바인드 변수는 :1, :2 순서)"""
+    id_col, name_col = LOOKUP_TABLES[table]
+    conditions = []
+    param_index = 1
+    if use_id:
+        conditions.append(f"UPPER(TRIM({id_col})) = UPPER(:{param_index})")
+        param_index += 1
+    if use_name:
+        conditions.append(f"UPPER(TRIM({name_col})) = UPPER(:{param_index})")
+
+    return template.format(
+        id_col=id_col,
+        name_col=name_col,
+        table=table,
+        where_conditions=' OR '.join(conditions)
+    )
+
+
+def _render_lookup_id_batch(template: str, table: str, bucket_size: int) -> str:
+    """lookup_id_batch.sql의 테이블/바인드 개수 변형 렌더링 (바인드 변수는 :k0 ~ :k{n-1})"""
+    id_col, name_col = LOOKUP_TABLES[table]
+    return template.format(
+        id_col=id_col,
+        name_col=name_col,
+        table=table,
+        key_binds=', '.join(f":k{i}" for i in range(bucket_size))
+    )
+
+
+class SqlTemplateRegistry:
+    """SQL 템플릿 로드/검증 및 사전 렌더링된 SQL 보관"""
+
+    def __init__(self, template_dir: Path = TEMPLATE_DIR):
+        self.template_dir = template_dir
+        self._templates: Dict[str, str] = {}
+        self._statements: Dict[str, str] = {}
+        self._names: Dict[str, str] = {}
+
+    @property
+    def loaded(self) -> bool:
+        return bool(self._statements)
+
+    def load(self):
+        """모든 템플릿을 읽어 검증하고 변형을 미리 렌더링
+
+        템플릿이 없거나 허용되지 않은 placeholder가 있으면 ValueError 발생
+        """
+        templates: Dict[str, str] = {}
+        for filename, allowed_fields in TEMPLATE_FIELDS.items():
+            sql_content = read_sql_file(self.template_dir / filename).strip()
+            if not sql_content:
+                raise ValueError(f"SQL 템플릿 파일을 읽을 수 없습니다: {filename}")
+
+            fields = {name for _, name, _, _ in Formatter().parse(sql_content) if name is not None}
+            unknown = fields - allowed_fields
+            missing = allowed_fields - fields
+            if unknown or missing:
+                raise ValueError(
+                    f"SQL 템플릿 placeholder 불일치 ({filename}): "
+                    f"허용되지 않음={sorted(unknown)}, 누락={sorted(missing)}"
+                )
+            templates[filename] = sql_content
+
+        statements: Dict[str, str] = {}
+        for filename, allowed_fields in TEMPLATE_FIELDS.items():
+            if not allowed_fields:
+                statements[filename] = templates[filename]
+
+        for table in LOOKUP_TABLES:
+            for use_id, use_name in ((True, False), (False, True), (True, True)):
+                statements[self._lookup_key(table, use_id, use_name)] = _render_lookup_id(
+                    templates['lookup_id.sql'], table, use_id, use_name
+                )
+            for bucket_size in LOOKUP_BATCH_BUCKETS:
+                statements[f"lookup_id_batch.sql:{table}:{bucket_size}"] = _render_lookup_id_batch(
+                    templates['lookup_id_batch.sql'], table, bucket_size
+                )
+
+        self._templates = templates
+        self._statements = statements
+        self._names = {sql: name for name, sql in statements.items()}
+        logger.info(f"SQL 템플릿 {len(templates)}개 로드, 사전 렌더링 SQL {len(statements)}개")
+
+    def _ensure_loaded(self):
+        if not self.loaded:
+            self.load()
+
+    @staticmethod
+    def _lookup_key(table: str, use_id: bool, use_name: bool) -> str:
+        mode = 'id_or_name' if use_id and use_name else ('id' if use_id else 'name')
+        return f"lookup_id.sql:{table}:{mode}"
+
+    def get(self, name: str) -> str:
+        """정적 템플릿(동적 부분 없음) SQL 반환"""
+        self._ensure_loaded()
+        try:
+            return self._statements[name]
+        except KeyError:
+            raise KeyError(f"등록되지 않은 SQL 템플릿: {name}")
+
+    def name_of(self, sql: str) -> Optional[str]:
+        """사전 렌더링 SQL의 이름 (예: "lookup_id.sql:PROCESS:id"), 등록된 SQL이 아니면 None"""
+        return self._names.get(sql)
+
+    def template(self, filename: str) -> str:
+        """검증된 원본 템플릿 반환 (query_builder.py가 WHERE 절을 조립하는 템플릿용)"""
+        self._ensure_loaded()
+        if filename not in COMPOSED_TEMPLATES:
+            raise KeyError(f"조립 대상 SQL 템플릿이 아닙니다: {filename}")
+        return self._templates[filename]
+
+    def lookup_id(self, table: str, use_id: bool, use_name: bool) -> Optional[str]:
+        """lookup_id.sql 변형 반환 (화이트리스트 외 테이블이거나 조건이 없으면 None)"""
+        if table not in LOOKUP_TABLES or not (use_id or use_name):
+            return None
+        return self.get(self._lookup_key(table, use_id, use_name))
+
+    def lookup_id_batch(self, table: str, key_count: int) -> Tuple[str, int]:
+        """lookup_id_batch.sql 변형과 버킷 크기 반환 (key_count는 최대 버킷 이하여야 함)"""
+        bucket_size = next(size for size in LOOKUP_BATCH_BUCKETS if size >= key_count)
+        return self.get(f"lookup_id_batch.sql:{table}:{bucket_size}"), bucket_size
+
+    def statements(self) -> List[str]:
+        """사전 렌더링된 모든 SQL (연결별 statement cache 워밍업용)"""
+        self._ensure_loaded()
+        return list(self._statements.values())
+
+
+# 전역 SQL 템플릿 레지스트리
+sql_registry = SqlTemplateRegistry()
@@ -0,0 +1,4 @@
+-- 데이터셋별 적재 버전 조회 SQL
+
+SELECT dataset_name, version, updated_at
+FROM DATA_VERSION
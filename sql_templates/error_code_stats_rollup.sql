@@ -0,0 +1,25 @@
+-- Error Code 통계 조회 SQL (일별 집계 테이블 INFORM_NOTE_DAILY_STATS 기준)
+-- error_code_stats.sql과 같은 결과를 반환하며, INFORM_NOTE 대신 사전 집계된 일별 행을 다시 합산
+-- 동적 부분: {period_select}, {where_clause}, {group_by_clause}, {order_by_clause}
+-- WHERE 절은 query_builder.py가 요청에 주어진 필터 조건만 넣어 조립
+
+SELECT
+    {period_select},
+    n.process_id,
+    p.process_name,
+    n.model_id,
+    m.model_name,
+    n.eqp_id,
+    e.eqp_name,
+    n.error_code,
+    ec.error_desc AS error_des,
+    SUM(n.event_cnt) AS event_cnt,
+    SUM(n.down_time_minutes_sum) AS total_down_time_minutes
+FROM INFORM_NOTE_DAILY_STATS n
+LEFT JOIN PROCESS p ON n.process_id = p.process_id
+LEFT JOIN EQUIPMENT e ON n.eqp_id = e.eqp_id
+LEFT JOIN MODEL m ON n.model_id = m.model_id
+LEFT JOIN ERROR_CODE ec ON n.error_code = ec.error_code
+{where_clause}
+GROUP BY {group_by_clause}
+ORDER BY {order_by_clause}
@@ -0,0 +1,8 @@
+-- ID/NAME 일괄 조회 SQL 템플릿 (엔티티 유형별 1회 조회)
+-- 동적 부분: {id_col}, {name_col}, {table}, {key_binds}
+-- key_binds: 정규화(UPPER/TRIM)된 ID·NAME 값 바인드 목록 (고정 크기 버킷, 남는 자리는 NULL)
+
+SELECT {id_col}, {name_col}
+FROM {table}
+WHERE UPPER(TRIM({id_col})) IN ({key_binds})
+   OR UPPER(TRIM({name_col})) IN ({key_binds})
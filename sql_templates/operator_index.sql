@@ -0,0 +1,3 @@
+-- 작업자 이름 인덱스 적재 SQL (INFORM_NOTE의 서로 다른 작업자 이름)
+
+SELECT DISTINCT operator FROM INFORM_NOTE WHERE operator IS NOT NULL
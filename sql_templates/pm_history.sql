@@ -1,18 +1,19 @@
 -- PM 이력 조회 SQL
+-- 키셋 페이지네이션: (down_start_time DESC NULLS FIRST, informnote_id DESC) 순서에서
+-- :cursor_time/:cursor_id(이전 페이지 마지막 행) 다음 행부터 조회, :limit_val은 page size + 1
+-- WHERE 절은 query_builder.py가 요청에 주어진 필터 조건만 넣어 조립
+-- (작업자 조건은 작업자 인덱스로 후보 이름을 찾으면 IN 목록, 아니면 부분 일치 LIKE)
 
 SELECT
     TO_CHAR(n.down_start_time, 'YYYY-MM-DD') as down_date,
     dt.down_type_name,
     n.down_time_minutes,
-    n.operator
+    n.operator,
+    n.informnote_id,
+    TO_CHAR(n.down_start_time, 'YYYY-MM-DD HH24:MI:SS.FF6') as cursor_time
 FROM INFORM_NOTE n
 LEFT JOIN DOWN_TYPE dt ON n.down_type_id = dt.down_type_id
-WHERE (:start_date IS NULL OR n.down_start_time >= TO_DATE(:start_date, 'YYYY-MM-DD'))
-  AND (:end_date IS NULL OR n.down_start_time < TO_DATE(:end_date, 'YYYY-MM-DD') + 1)
-  AND (:process_id IS NULL OR n.process_id = :process_id)
-  AND (:eqp_id IS NULL OR n.eqp_id = :eqp_id)
-  AND (:operator IS NULL OR n.operator LIKE '%' || :operator || '%')
-  AND n.down_type_id = 0
-ORDER BY n.down_start_time DESC
+{where_clause}
+ORDER BY n.down_start_time DESC NULLS FIRST, n.informnote_id DESC
 FETCH FIRST :limit_val ROWS ONLY
 
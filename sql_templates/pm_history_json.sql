@@ -0,0 +1,36 @@
+-- PM 이력 조회 SQL (DB JSON 생성 모드, PM_HISTORY_RESPONSE_MODE=db_json)
+-- pm_history.sql과 같은 조건/정렬로 조회하고 응답의 list 배열을 DB에서 JSON으로 생성
+-- :limit_val은 page size + 1, :page_size를 넘는 마지막 행은 배열에서 제외하고 다음 페이지 존재 여부 확인에만 사용
+-- 반환: list_json(CLOB), 다음 cursor 키(cursor_time, cursor_id), 조회 행 수(fetched_count)
+
+WITH page AS (
+    SELECT
+        n.informnote_id,
+        n.down_start_time,
+        dt.down_type_name,
+        n.down_time_minutes,
+        n.operator,
+        ROW_NUMBER() OVER (ORDER BY n.down_start_time DESC NULLS FIRST, n.informnote_id DESC) AS rn
+    FROM INFORM_NOTE n
+    LEFT JOIN DOWN_TYPE dt ON n.down_type_id = dt.down_type_id
+    {where_clause}
+    ORDER BY n.down_start_time DESC NULLS FIRST, n.informnote_id DESC
+    FETCH FIRST :limit_val ROWS ONLY
+)
+SELECT
+    JSON_ARRAYAGG(
+        CASE WHEN rn <= :page_size THEN JSON_OBJECT(
+            'down_date' VALUE TO_CHAR(down_start_time, 'YYYY-MM-DD'),
+            'down_type' VALUE NVL(down_type_name, 'SCHEDULED'),
+            'down_time_minutes' VALUE NVL(down_time_minutes, 0),
+            'operator' VALUE operator
+            NULL ON NULL
+            RETURNING VARCHAR2(4000)
+        ) END FORMAT JSON
+        ORDER BY rn
+        RETURNING CLOB
+    ) AS list_json,
+    MAX(CASE WHEN rn = :page_size THEN TO_CHAR(down_start_time, 'YYYY-MM-DD HH24:MI:SS.FF6') END) AS cursor_time,
+    MAX(CASE WHEN rn = :page_size THEN informnote_id END) AS cursor_id,
+    COUNT(*) AS fetched_count
+FROM page
@@ -0,0 +1,9 @@
+-- 레퍼런스 데이터 인메모리 인덱스 적재 SQL
+-- entity, id, name, 상위 ID (MODEL -> PROCESS_ID, EQUIPMENT -> MODEL_ID)
+
+SELECT 'PROCESS' AS entity, PROCESS_ID, PROCESS_NAME, NULL AS parent_id FROM PROCESS
+UNION ALL
+SELECT 'MODEL', MODEL_ID, MODEL_NAME, PROCESS_ID FROM MODEL
+UNION ALL
+SELECT 'EQUIPMENT', EQP_ID, EQP_NAME, MODEL_ID FROM EQUIPMENT
+ORDER BY 1, 2
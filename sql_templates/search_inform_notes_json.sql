@@ -0,0 +1,49 @@
+-- 상세 조치 내역 검색 SQL (DB JSON 생성 모드, SEARCH_RESPONSE_MODE=db_json)
+-- search_inform_notes.sql과 같은 조건/정렬로 조회하고 응답의 list 배열을 DB에서 JSON으로 생성
+-- :limit_val은 page size + 1, :page_size를 넘는 마지막 행은 배열에서 제외하고 다음 페이지 존재 여부 확인에만 사용
+-- 반환: list_json(CLOB), 다음 cursor 키(cursor_time, cursor_id), 조회 행 수(fetched_count)
+
+WITH page AS (
+    SELECT
+        n.informnote_id,
+        n.down_start_time,
+        p.process_name,
+        e.eqp_name,
+        n.error_code,
+        ec.error_desc,
+        n.act_content,
+        n.operator,
+        n.status_id,
+        s.status_name,
+        ROW_NUMBER() OVER (ORDER BY n.down_start_time DESC NULLS FIRST, n.informnote_id DESC) AS rn
+    FROM INFORM_NOTE n
+    LEFT JOIN PROCESS p ON n.process_id = p.process_id
+    LEFT JOIN EQUIPMENT e ON n.eqp_id = e.eqp_id
+    LEFT JOIN ERROR_CODE ec ON n.error_code = ec.error_code
+    LEFT JOIN STATUS s ON n.status_id = s.status_id
+    {where_clause}
+    ORDER BY n.down_start_time DESC NULLS FIRST, n.informnote_id DESC
+    FETCH FIRST :limit_val ROWS ONLY
+)
+SELECT
+    JSON_ARRAYAGG(
+        CASE WHEN rn <= :page_size THEN JSON_OBJECT(
+            'informnote_id' VALUE informnote_id,
+            'down_start_time' VALUE TO_CHAR(down_start_time, 'YYYY-MM-DD HH24:MI:SS'),
+            'process_name' VALUE process_name,
+            'eqp_name' VALUE eqp_name,
+            'error_code' VALUE error_code,
+            'error_desc' VALUE error_desc,
+            'act_content' VALUE act_content,
+            'operator' VALUE operator,
+            'status' VALUE NVL(status_name, CASE status_id WHEN 1 THEN 'COMPLETED' WHEN 0 THEN 'IN_PROGRESS' ELSE 'UNKNOWN' END)
+            NULL ON NULL
+            RETURNING VARCHAR2(4000)
+        ) END FORMAT JSON
+        ORDER BY rn
+        RETURNING CLOB
+    ) AS list_json,
+    MAX(CASE WHEN rn = :page_size THEN TO_CHAR(down_start_time, 'YYYY-MM-DD HH24:MI:SS.FF6') END) AS cursor_time,
+    MAX(CASE WHEN rn = :page_size THEN informnote_id END) AS cursor_id,
+    COUNT(*) AS fetched_count
+FROM page
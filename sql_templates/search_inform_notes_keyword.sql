@@ -0,0 +1,22 @@
+-- 상세 조치 내역 키워드 검색 SQL
+-- 인메모리 검색 인덱스(text_index.py)가 고른 후보 ID(:k0, :k1, ... 빈 자리는 NULL)에
+-- 나머지 필터를 적용하여 조회 (순위 정렬과 페이지 분할은 서버에서 처리)
+-- WHERE 절은 query_builder.py가 후보 ID IN 목록 + 요청에 주어진 필터 조건으로 조립
+
+SELECT
+    n.informnote_id,
+    TO_CHAR(n.down_start_time, 'YYYY-MM-DD HH24:MI:SS') as down_start_time,
+    p.process_name,
+    e.eqp_name,
+    n.error_code,
+    ec.error_desc,
+    n.act_content,
+    n.operator,
+    n.status_id,
+    s.status_name
+FROM INFORM_NOTE n
+LEFT JOIN PROCESS p ON n.process_id = p.process_id
+LEFT JOIN EQUIPMENT e ON n.eqp_id = e.eqp_id
+LEFT JOIN ERROR_CODE ec ON n.error_code = ec.error_code
+LEFT JOIN STATUS s ON n.status_id = s.status_id
+{where_clause}
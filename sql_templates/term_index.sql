@@ -0,0 +1,6 @@
+-- 반도체 용어 사전 인메모리 인덱스 적재 SQL
+-- 용어 ID, 영문 용어, 한글 발음, 요약 설명, 검색 키워드
+
+SELECT TERM_ID, TERM_EN, TERM_KOR_READING, MEANING_SHORT, SEARCH_KEYWORDS
+FROM FAB_TERMS_DICTIONARY
+ORDER BY TERM_ID
@@ -0,0 +1,10 @@
+-- 조치 내용 검색 인덱스 구성 SQL
+-- :since가 NULL이면 전체, 아니면 NVL(updated_at, created_at)이 :since 이후인 변경분만 조회
+
+SELECT
+    n.informnote_id,
+    n.act_prob_reason,
+    n.act_content,
+    TO_CHAR(NVL(n.updated_at, n.created_at), 'YYYY-MM-DD HH24:MI:SS.FF6') AS changed_at
+FROM INFORM_NOTE n
+WHERE (:since IS NULL OR NVL(n.updated_at, n.created_at) >= TO_TIMESTAMP(:since, 'YYYY-MM-DD HH24:MI:SS.FF6'))
@@ -0,0 +1,3 @@
+-- 조치 내용 검색 인덱스 문서 수 확인 SQL (삭제/재적재 감지용)
+
+SELECT COUNT(*) FROM INFORM_NOTE
@@ -0,0 +1,232 @@
+"""
+반도체 용어 사전 인메모리 인덱스
+FAB_TERMS_DICTIONARY를 프로세스 메모리에 적재하여 용어 조회를 DB 접근 없이 처리합니다.
+
+- 키 정규화: casefold + 공백/기호 제거 ("Chemical-Mechanical Polishing" -> "chemicalmechanicalpolishing")
+- 일치 순서: 정확 일치(영문 용어/한글 발음) > 접두사 일치(trie) > 검색 키워드(SEARCH_KEYWORDS) 일치
+             > 오타 허용 일치(bigram 후보 + 편집 거리)
+- 갱신: TERM_INDEX_REFRESH_INTERVAL 주기 전체 갱신
+        + load_data.load_term_dictionary 적재 완료 시 DATA_VERSION('term_dictionary') 변경 감지 즉시 갱신
+"""
+import logging
+import re
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Set, Tuple
+from config import settings
+from database import db, PeriodicTask
+from sql_registry import sql_registry
+
+logger = logging.getLogger(__name__)
+
+TERM_DICTIONARY_DATASET = 'term_dictionary'
+
+NORMALIZE_PATTERN = re.compile(r'[\W_]+')
+
+# 일치 유형별 기본 점수 (같은 용어가 여러 방식으로 일치하면 높은 점수 하나만 사용)
+MATCH_SCORES = {
+    'exact': 1.0,
+    'prefix': 0.8,
+    'keyword': 0.6,
+}
+
+# 오타 허용 일치 후보로 편집 거리를 계산할 최대 키 수 (bigram 공유 수 상위)
+FUZZY_CANDIDATE_LIMIT = 50
+
+
+def normalize_term(value: Optional[str]) -> str:
+    """조회 키 정규화 (대소문자 무시, 공백/기호 제거)"""
+    if not value:
+        return ''
+    return NORMALIZE_PATTERN.sub('', str(value).casefold())
+
+
+def bigrams(key: str) -> Set[str]:
+    """앞뒤 경계 문자를 붙인 2글자 n-gram 집합 (짧은 키/한글 발음도 후보 검색 가능)"""
+    padded = f"^{key}$"
+    return {padded[i:i + 2] for i in range(len(padded) - 1)}
+
+
+def edit_distance(a: str, b: str, max_distance: int) -> Optional[int]:
+    """Levenshtein 편집 거리 (max_distance를 넘으면 None)"""
+    if abs(len(a) - len(b)) > max_distance:
+        return None
+    previous = list(range(len(b) + 1))
+    for i, char_a in enumerate(a, 1):
+        current = [i]
+        for j, char_b in enumerate(b, 1):
+            current.append(min(
+                previous[j] + 1,
+                current[j - 1] + 1,
+                previous[j - 1] + (char_a != char_b),
+            ))
+        if min(current) > max_distance:
+            return None
+        previous = current
+    return previous[-1] if previous[-1] <= max_distance else None
+
+
+def max_fuzzy_distance(key: str) -> int:
+    """키 길이별 허용 편집 거리 (4글자 미만 0, 8글자 미만 1, 그 이상 2)"""
+    if len(key) < 4:
+        return 0
+    return 1 if len(key) < 8 else 2
+
+
+class TermTrie:
+    """정규화 키 접두사 검색용 trie (노드: 다음 문자 -> 자식 노드, 키 끝 노드에는 용어 ID 집합)"""
+
+    TERMINAL = ''
+
+    def __init__(self):
+        self.root: Dict[str, Any] = {}
+
+    def insert(self, key: str, term_id: str):
+        node = self.root
+        for char in key:
+            node = node.setdefault(char, {})
+        node.setdefault(self.TERMINAL, set()).add(term_id)
+
+    def exact(self, key: str) -> Set[str]:
+        """키와 정확히 일치하는 용어 ID 집합"""
+        node = self._find(key)
+        return node.get(self.TERMINAL, set()) if node is not None else set()
+
+    def prefix(self, key: str, limit: int) -> List[str]:
+        """키로 시작하는 용어 ID 목록 (짧은 키 순, 최대 limit개)"""
+        node = self._find(key)
+        if node is None:
+            return []
+        found: List[str] = []
+        level = [node]
+        while level and len(found) < limit:
+            next_level = []
+            for current in level:
+                found.extend(sorted(current.get(self.TERMINAL, ())))
+                next_level.extend(child for char, child in sorted(current.items()) if char != self.TERMINAL)
+            level = next_level
+        return list(dict.fromkeys(found))[:limit]
+
+    def _find(self, key: str) -> Optional[Dict[str, Any]]:
+        node = self.root
+        for char in key:
+            node = node.get(char)
+            if node is None:
+                return None
+        return node
+
+
+class TermIndex(PeriodicTask):
+    """반도체 용어 사전 trie + bigram 인덱스"""
+
+    name = "용어 사전 인덱스 갱신"
+
+    def __init__(self, interval: float):
+        super().__init__(interval)
+        self.terms: Dict[str, Dict[str, Optional[str]]] = {}   # 용어 ID -> 용어 정보
+        self.trie = TermTrie()                                 # 영문 용어/한글 발음 키
+        self.keywords: Dict[str, Set[str]] = {}                # 검색 키워드 단어 -> 용어 ID 집합
+        self.key_terms: Dict[str, Set[str]] = {}               # 정규화 키 -> 용어 ID 집합 (오타 허용 일치용)
+        self.gram_keys: Dict[str, Set[str]] = {}               # bigram -> 정규화 키 집합
+        self.loaded_at: Optional[datetime] = None
+
+    @property
+    def ready(self) -> bool:
+        return self.loaded_at is not None
+
+    async def refresh(self):
+        """용어 사전 전체를 읽어 새 인덱스를 만든 뒤 교체"""
+        async with db.acquire() as conn:
+            cursor = conn.cursor()
+            cursor.arraysize = 1000
+            await cursor.execute(sql_registry.get("term_index.sql"))
+            rows = await cursor.fetchall()
+            cursor.close()
+
+        terms: Dict[str, Dict[str, Optional[str]]] = {}
+        trie = TermTrie()
+        keywords: Dict[str, Set[str]] = {}
+        key_terms: Dict[str, Set[str]] = {}
+        gram_keys: Dict[str, Set[str]] = {}
+
+        for term_id, term_en, term_kor_reading, meaning_short, search_keywords in rows:
+            terms[term_id] = {
+                "term_id": term_id,
+                "term_en": term_en,
+                "term_kor_reading": term_kor_reading,
+                "meaning_short": meaning_short,
+            }
+            for key in {normalize_term(term_en), normalize_term(term_kor_reading)} - {''}:
+                trie.insert(key, term_id)
+                key_terms.setdefault(key, set()).add(term_id)
+                for gram in bigrams(key):
+                    gram_keys.setdefault(gram, set()).add(key)
+            for word in (search_keywords or '').split():
+                word_key = normalize_term(word)
+                if word_key:
+                    keywords.setdefault(word_key, set()).add(term_id)
+
+        self.terms, self.trie, self.keywords = terms, trie, keywords
+        self.key_terms, self.gram_keys = key_terms, gram_keys
+        self.loaded_at = datetime.now()
+        logger.info(f"용어 사전 인덱스 갱신 완료 (용어 {len(terms)}개, 키 {len(key_terms)}개)")
+
+    async def run_once(self):
+        await self.refresh()
+
+    async def on_data_version_change(self, version: int):
+        """DATA_VERSION('term_dictionary') 변경 시 즉시 갱신"""
+        await self.refresh()
+
+    def _fuzzy(self, key: str) -> List[Tuple[str, float]]:
+        """오타 허용 일치: bigram을 많이 공유하는 키만 편집 거리 계산 -> (용어 ID, 점수)"""
+        max_distance = max_fuzzy_distance(key)
+        if not max_distance:
+            return []
+        shared: Dict[str, int] = {}
+        for gram in bigrams(key):
+            for candidate in self.gram_keys.get(gram, ()):
+                shared[candidate] = shared.get(candidate, 0) + 1
+        candidates = sorted(shared, key=lambda candidate: (-shared[candidate], candidate))[:FUZZY_CANDIDATE_LIMIT]
+
+        matches: List[Tuple[str, float]] = []
+        for candidate in candidates:
+            distance = edit_distance(key, candidate, max_distance)
+            if distance is None:
+                continue
+            score = round(0.5 * (1 - distance / max(len(key), len(candidate))), 4)
+            matches.extend((term_id, score) for term_id in self.key_terms[candidate])
+        return matches
+
+    def search(self, query: str, limit: int, fuzzy: bool = True) -> List[Dict[str, Any]]:
+        """용어 조회: 용어 정보 + match_type/score 목록을 점수 내림차순으로 반환"""
+        key = normalize_term(query)
+        if not key:
+            return []
+
+        best: Dict[str, Tuple[float, str]] = {}
+
+        def add(term_id: str, score: float, match_type: str):
+            if term_id not in best or best[term_id][0] < score:
+                best[term_id] = (score, match_type)
+
+        for term_id in self.trie.exact(key):
+            add(term_id, MATCH_SCORES['exact'], 'exact')
+        for term_id in self.trie.prefix(key, limit + len(best)):
+            add(term_id, MATCH_SCORES['prefix'], 'prefix')
+        for word in query.split():
+            for term_id in self.keywords.get(normalize_term(word), ()):
+                add(term_id, MATCH_SCORES['keyword'], 'keyword')
+        if fuzzy and len(best) < limit:
+            for term_id, score in self._fuzzy(key):
+                add(term_id, score, 'fuzzy')
+
+        ranked = sorted(best.items(), key=lambda item: (-item[1][0], self.terms[item[0]]["term_en"] or '', item[0]))
+        return [
+            {**self.terms[term_id], "match_type": match_type, "score": score}
+            for term_id, (score, match_type) in ranked[:limit]
+        ]
+
+
+# 전역 용어 사전 인덱스 인스턴스
+term_index = TermIndex(settings.TERM_INDEX_REFRESH_INTERVAL)
+db.data_versions.subscribe(TERM_DICTIONARY_DATASET, term_index.on_data_version_change)
@@ -0,0 +1,57 @@
+"""
+서킷 브레이커 half_open 시험 요청 테스트 (DB 없이 가짜 연결 풀로 실행)
+"""
+import asyncio
+import time
+
+import pytest
+from oracledb import errors as oracledb_errors
+
+from database import Database, DatabaseUnavailableError
+
+
+class TimeoutPool:
+    """acquire가 항상 연결 풀 대기 시간 초과(DPY-4005)로 끝나는 가짜 연결 풀"""
+
+    async def acquire(self):
+        oracledb_errors._raise_err(oracledb_errors.ERR_POOL_NO_CONNECTION_AVAILABLE)
+
+
+def half_open_database(pool) -> Database:
+    """서킷이 open된 뒤 reset_timeout이 지나 half_open 상태인 Database"""
+    database = Database()
+    database.async_pool = pool
+    breaker = database.circuit_breaker
+    breaker.reset_timeout = 30.0
+    breaker.failure_count = breaker.failure_threshold
+    breaker.opened_at = time.monotonic() - breaker.reset_timeout
+    assert breaker.state == breaker.HALF_OPEN
+    return database
+
+
+async def use_connection(database: Database):
+    async with database.acquire():
+        pass
+
+
+def test_pool_timeout_during_trial_releases_trial_slot():
+    """시험 요청이 풀 대기 초과로 끝나면 다음 요청을 시험 요청으로 허용"""
+    database = half_open_database(TimeoutPool())
+
+    with pytest.raises(DatabaseUnavailableError, match="연결 풀 대기 시간"):
+        asyncio.run(use_connection(database))
+
+    breaker = database.circuit_breaker
+    assert breaker.trial_started_at is None
+    assert breaker.allow_request()
+
+
+def test_trial_admits_single_request():
+    """half_open 상태에서는 진행 중인 시험 요청이 있으면 나머지 요청 거부"""
+    database = half_open_database(TimeoutPool())
+    breaker = database.circuit_breaker
+
+    assert breaker.allow_request()
+    assert not breaker.allow_request()
+    assert breaker.is_available()
+
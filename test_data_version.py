@@ -0,0 +1,69 @@
+"""
+DataVersionWatcher 변경 감지 테스트 (DB 없이 fetch_data_versions를 대체하여 실행)
+"""
+import asyncio
+from datetime import datetime
+
+from database import DataVersionWatcher
+
+
+class StubDatabase:
+    """fetch_data_versions 결과를 테스트에서 지정하는 가짜 DB"""
+
+    def __init__(self):
+        self.stamps = {}
+
+    async def fetch_data_versions(self):
+        return dict(self.stamps)
+
+
+def make_watcher():
+    database = StubDatabase()
+    watcher = DataVersionWatcher(database, interval=30)
+    calls = []
+
+    async def on_change(version):
+        calls.append(version)
+
+    watcher.subscribe('inform_note', on_change)
+    return database, watcher, calls
+
+
+def test_first_appearance_fires_callback():
+    """DATA_VERSION에 행이 없다가 첫 적재로 버전 1이 생기면 콜백 호출"""
+    database, watcher, calls = make_watcher()
+    asyncio.run(watcher.poll())
+    assert calls == []
+
+    database.stamps = {'inform_note': (1, datetime(2026, 10, 1, 9, 0, 0))}
+    asyncio.run(watcher.poll())
+    assert calls == [1]
+    assert watcher.versions == {'inform_note': 1}
+
+
+def test_reset_to_same_version_fires_callback():
+    """DB 재구성 후 다시 버전 1로 적재되어도 UPDATED_AT이 달라지면 콜백 호출"""
+    database, watcher, calls = make_watcher()
+    database.stamps = {'inform_note': (1, datetime(2026, 10, 1, 9, 0, 0))}
+    asyncio.run(watcher.poll(notify=False))
+    assert calls == []
+
+    database.stamps = {'inform_note': (1, datetime(2026, 10, 2, 9, 0, 0))}
+    asyncio.run(watcher.poll())
+    assert calls == [1]
+
+
+def test_reset_to_lower_version_fires_callback():
+    """버전이 낮아져도(재구성 후 재적재) 콜백 호출, 변화가 없으면 호출하지 않음"""
+    database, watcher, calls = make_watcher()
+    database.stamps = {'inform_note': (3, datetime(2026, 10, 1, 9, 0, 0))}
+    asyncio.run(watcher.poll(notify=False))
+
+    database.stamps = {}
+    asyncio.run(watcher.poll())
+    assert watcher.versions == {}
+
+    database.stamps = {'inform_note': (1, datetime(2026, 10, 1, 10, 0, 0))}
+    asyncio.run(watcher.poll())
+    asyncio.run(watcher.poll())
+    assert calls == [1]
@@ -0,0 +1,118 @@
+"""
+NDJSON 스트리밍 응답 연결 반환 테스트 (DB 없이 가짜 연결 풀로 실행)
+"""
+import asyncio
+
+import main
+from main import app, db, sql_registry
+
+
+class StubCursor:
+    """fetchmany마다 한 배치를 돌려주는 결과 집합 (batches가 None이면 끝나지 않음)"""
+
+    arraysize = 100
+    batches = None
+    fetched = 0
+
+    async def execute(self, sql, params=None):
+        pass
+
+    async def fetchmany(self, size=None):
+        await asyncio.sleep(0.01)
+        if self.batches is not None and self.fetched >= self.batches:
+            return []
+        self.fetched += 1
+        return [("2024-01", "P001", "공정", "M001", "모델", "E001", "장비", "ERR01", "설명", 3, 12.5)]
+
+    def close(self):
+        pass
+
+
+class StubConnection:
+    def cursor(self):
+        return StubCursor()
+
+    async def commit(self):
+        pass
+
+    async def rollback(self):
+        pass
+
+
+class StubPool:
+    """acquire/release 횟수만 세는 가짜 비동기 연결 풀"""
+
+    def __init__(self):
+        self.busy = 0
+        self.released = 0
+
+    async def acquire(self):
+        self.busy += 1
+        return StubConnection()
+
+    async def release(self, conn):
+        await asyncio.sleep(0)  # 실제 풀처럼 반환 중에도 await 지점이 있음
+        self.busy -= 1
+        self.released += 1
+
+
+async def request_and_disconnect(path: str, body: bytes):
+    """첫 본문 청크를 받은 직후 클라이언트 연결을 끊는 ASGI 요청"""
+    disconnected = asyncio.Event()
+    received_body = asyncio.Event()
+    messages = []
+
+    async def receive():
+        if not received_body.is_set():
+            received_body.set()
+            return {"type": "http.request", "body": body, "more_body": False}
+        await disconnected.wait()
+        return {"type": "http.disconnect"}
+
+    async def send(message):
+        messages.append(message)
+        if message["type"] == "http.response.body" and message.get("body"):
+            disconnected.set()
+
+    scope = {
+        "type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1", "method": "POST",
+        "scheme": "http", "path": path, "raw_path": path.encode(), "root_path": "",
+        "query_string": b"stream=true", "headers": [(b"content-type", b"application/json")],
+        "client": ("test", 1), "server": ("test", 80),
+    }
+    await asyncio.wait_for(app(scope, receive, send), timeout=5)
+    return messages
+
+
+def test_error_code_stats_stream_releases_connection_on_disconnect(monkeypatch):
+    """NDJSON 스트리밍 중 클라이언트 연결이 끊기면 연결을 풀에 반환"""
+    if not sql_registry.loaded:
+        sql_registry.load()
+    pool = StubPool()
+    monkeypatch.setattr(db, "async_pool", pool)
+    monkeypatch.setattr(main, "error_stats_rollup_ready", lambda: False)
+
+    messages = asyncio.run(request_and_disconnect("/api/v1/informnote/stats/error-code", b"{}"))
+
+    assert messages[0]["status"] == 200
+    assert pool.busy == 0
+    assert pool.released == 1
+
+
+def test_error_code_stats_stream_releases_connection_on_completion(monkeypatch):
+    """NDJSON 스트리밍을 끝까지 받으면 모든 줄을 전송하고 연결을 풀에 반환"""
+    from fastapi.testclient import TestClient
+
+    if not sql_registry.loaded:
+        sql_registry.load()
+    pool = StubPool()
+    monkeypatch.setattr(db, "async_pool", pool)
+    monkeypatch.setattr(main, "error_stats_rollup_ready", lambda: False)
+    monkeypatch.setattr(StubCursor, "batches", 3)
+
+    response = TestClient(app).post("/api/v1/informnote/stats/error-code?stream=true", json={})
+
+    assert response.status_code == 200
+    assert len(response.text.splitlines()) == 3
+    assert pool.busy == 0
+    assert pool.released == 1
@@ -0,0 +1,201 @@
+"""
+INFORM_NOTE 조치 내용 전문 검색 인메모리 역색인
+ACT_PROB_REASON(추정 원인) + ACT_CONTENT(조치 내용)를 토큰화하여 역색인을 만들고
+BM25로 점수를 매겨 키워드 검색 후보(informnote_id)를 순위대로 반환합니다.
+
+- 토큰화: 한글은 음절 bigram(한 글자 단어는 그대로), 영문/숫자는 단어 단위 (대소문자 무시)
+  예) "챔버 압력 drift 조치" -> 챔버, 압력, drift, 조치
+      "챔버압력저하" -> 챔버, 버압, 압력, 력저, 저하
+- 갱신: 최초 전체 구성 후에는 NVL(updated_at, created_at) 기준 변경분만 반영하고,
+        삭제 등으로 문서 수가 맞지 않으면 전체 재구성
+        (TEXT_INDEX_REFRESH_INTERVAL 주기 + DATA_VERSION('inform_note') 변경 시 즉시)
+"""
+import asyncio
+import heapq
+import logging
+import math
+import re
+from collections import Counter
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Tuple
+from config import settings
+from database import db, PeriodicTask
+from sql_registry import sql_registry
+
+logger = logging.getLogger(__name__)
+
+INFORM_NOTE_DATASET = 'inform_note'
+
+TOKEN_PATTERN = re.compile(r'[가-힣]+|[a-z0-9]+')
+
+# BM25 파라미터
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+
+def tokenize(text: Optional[str]) -> List[str]:
+    """검색용 토큰 목록 (한글 음절 bigram + 영문/숫자 단어)"""
+    if not text:
+        return []
+    tokens: List[str] = []
+    for word in TOKEN_PATTERN.findall(text.casefold()):
+        if word[0] >= '가':
+            if len(word) == 1:
+                tokens.append(word)
+            else:
+                tokens.extend(word[i:i + 2] for i in range(len(word) - 1))
+        elif len(word) > 1 or word.isdigit():
+            tokens.append(word)
+    return tokens
+
+
+def tokenize_rows(rows: Iterable[tuple]) -> List[Tuple[str, Counter]]:
+    """(informnote_id, act_prob_reason, act_content, ...) 행 -> (문서 ID, 토큰 빈도) 목록"""
+    return [
+        (informnote_id, Counter(tokenize(prob_reason) + tokenize(content)))
+        for informnote_id, prob_reason, content, *_ in rows
+    ]
+
+
+class TextIndex(PeriodicTask):
+    """조치 내용/추정 원인 BM25 역색인"""
+
+    name = "조치 내용 검색 인덱스 갱신"
+
+    def __init__(self, interval: float):
+        super().__init__(interval)
+        self.postings: Dict[str, Dict[str, int]] = {}   # 토큰 -> {문서 ID: 빈도}
+        self.doc_terms: Dict[str, Counter] = {}          # 문서 ID -> 토큰 빈도 (변경분 반영 시 기존 색인 제거용)
+        self.doc_lengths: Dict[str, int] = {}            # 문서 ID -> 토큰 수
+        self.total_length = 0
+        self.watermark: Optional[str] = None             # 반영된 최신 NVL(updated_at, created_at)
+        self.loaded_at: Optional[datetime] = None
+        self._lock = asyncio.Lock()
+
+    @property
+    def ready(self) -> bool:
+        return self.loaded_at is not None
+
+    @property
+    def document_count(self) -> int:
+        return len(self.doc_terms)
+
+    async def _fetch(self, since: Optional[str]) -> List[tuple]:
+        async with db.acquire() as conn:
+            cursor = conn.cursor()
+            cursor.arraysize = 1000
+            await cursor.execute(sql_registry.get("text_index.sql"), {"since": since})
+            rows = await cursor.fetchall()
+            cursor.close()
+        return rows
+
+    async def _count(self) -> int:
+        async with db.acquire() as conn:
+            cursor = conn.cursor()
+            await cursor.execute(sql_registry.get("text_index_count.sql"))
+            (count,) = await cursor.fetchone()
+            cursor.close()
+        return count
+
+    @staticmethod
+    def _max_changed_at(rows: List[tuple], current: Optional[str]) -> Optional[str]:
+        changed = [row[3] for row in rows if row[3]]
+        if current:
+            changed.append(current)
+        return max(changed) if changed else None
+
+    def _add(self, doc_id: str, terms: Counter):
+        self.doc_terms[doc_id] = terms
+        self.doc_lengths[doc_id] = sum(terms.values())
+        self.total_length += self.doc_lengths[doc_id]
+        for term, freq in terms.items():
+            self.postings.setdefault(term, {})[doc_id] = freq
+
+    def _remove(self, doc_id: str):
+        terms = self.doc_terms.pop(doc_id, None)
+        if terms is None:
+            return
+        self.total_length -= self.doc_lengths.pop(doc_id)
+        for term in terms:
+            posting = self.postings.get(term)
+            if posting is not None:
+                posting.pop(doc_id, None)
+                if not posting:
+                    del self.postings[term]
+
+    async def rebuild(self):
+        """전체 재구성 (새 색인을 만든 뒤 교체)"""
+        rows = await self._fetch(None)
+        documents = await asyncio.to_thread(tokenize_rows, rows)
+
+        postings: Dict[str, Dict[str, int]] = {}
+        doc_terms: Dict[str, Counter] = {}
+        doc_lengths: Dict[str, int] = {}
+        for doc_id, terms in documents:
+            doc_terms[doc_id] = terms
+            doc_lengths[doc_id] = sum(terms.values())
+            for term, freq in terms.items():
+                postings.setdefault(term, {})[doc_id] = freq
+
+        self.postings, self.doc_terms, self.doc_lengths = postings, doc_terms, doc_lengths
+        self.total_length = sum(doc_lengths.values())
+        self.watermark = self._max_changed_at(rows, None)
+        self.loaded_at = datetime.now()
+        logger.info(f"조치 내용 검색 인덱스 전체 구성 완료 (문서 {len(doc_terms)}건, 토큰 {len(postings)}개)")
+
+    async def refresh(self):
+        """변경분 반영 (최초 또는 문서 수 불일치 시 전체 재구성)"""
+        async with self._lock:
+            if not self.ready:
+                await self.rebuild()
+                return
+
+            rows = await self._fetch(self.watermark)
+            if rows:
+                documents = await asyncio.to_thread(tokenize_rows, rows)
+                for doc_id, terms in documents:
+                    self._remove(doc_id)
+                    self._add(doc_id, terms)
+                self.watermark = self._max_changed_at(rows, self.watermark)
+
+            # 삭제/TRUNCATE 후 재적재는 변경분으로 알 수 없으므로 문서 수로 확인
+            if await self._count() != self.document_count:
+                await self.rebuild()
+                return
+
+            self.loaded_at = datetime.now()
+            if rows:
+                logger.info(f"조치 내용 검색 인덱스 변경분 반영: {len(rows)}건 (전체 문서 {self.document_count}건)")
+
+    async def run_once(self):
+        await self.refresh()
+
+    async def on_data_version_change(self, version: int):
+        """DATA_VERSION('inform_note') 변경 시 즉시 갱신"""
+        await self.refresh()
+
+    def search(self, query: str, max_results: int) -> List[Tuple[str, float]]:
+        """키워드 검색: (informnote_id, BM25 점수) 목록을 점수 내림차순으로 반환"""
+        terms = set(tokenize(query))
+        doc_count = self.document_count
+        if not terms or not doc_count:
+            return []
+
+        avg_length = self.total_length / doc_count
+        scores: Dict[str, float] = {}
+        for term in terms:
+            posting = self.postings.get(term)
+            if not posting:
+                continue
+            idf = math.log(1 + (doc_count - len(posting) + 0.5) / (len(posting) + 0.5))
+            for doc_id, freq in posting.items():
+                norm = freq + BM25_K1 * (1 - BM25_B + BM25_B * self.doc_lengths[doc_id] / avg_length)
+                scores[doc_id] = scores.get(doc_id, 0.0) + idf * freq * (BM25_K1 + 1) / norm
+
+        # 점수가 같으면 ID 내림차순(최근 등록 순) 우선
+        return heapq.nlargest(max_results, scores.items(), key=lambda item: (item[1], item[0]))
+
+
+# 전역 조치 내용 검색 인덱스 인스턴스
+text_index = TextIndex(settings.TEXT_INDEX_REFRESH_INTERVAL)
+db.data_versions.subscribe(INFORM_NOTE_DATASET, text_index.on_data_version_change)